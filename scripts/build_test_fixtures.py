@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Build the pre-built package archives used by the end-to-end tests.
+
+The archives are committed under tests/data/fixtures/ so tests can copy them
+instead of generating them on every run. Re-run this script whenever the
+fixture contents below change:
+
+    python scripts/build_test_fixtures.py
+"""
+
+import gzip
+import io
+import json
+import tarfile
+import zipfile
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "data" / "fixtures"
+
+# Fixed timestamp so rebuilt archives are byte-identical
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+COMPLETE_WHEEL_METADATA = """Metadata-Version: 2.1
+Name: complete-package
+Version: 1.0.0
+Summary: A complete test package
+Home-page: https://example.com
+Author: John Doe
+Author-email: john@example.com
+License: MIT
+Classifier: Development Status :: 5 - Production/Stable
+Classifier: Programming Language :: Python :: 3
+Classifier: License :: OSI Approved :: MIT License
+Keywords: test complete example
+Requires-Dist: requests>=2.0.0
+Requires-Dist: click>=8.0.0
+Provides-Extra: dev
+Requires-Dist: pytest>=7.0.0; extra == "dev"
+"""
+
+MAVEN_POM = """<?xml version="1.0"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <groupId>com.example</groupId>
+    <artifactId>maven-artifact</artifactId>
+    <version>1.0.0</version>
+    <description>Maven test artifact</description>
+    <url>https://example.com/maven</url>
+    <developers>
+        <developer>
+            <id>dev1</id>
+            <name>Developer One</name>
+            <email>dev1@example.com</email>
+        </developer>
+    </developers>
+    <licenses>
+        <license>
+            <name>Apache License, Version 2.0</name>
+            <url>https://www.apache.org/licenses/LICENSE-2.0</url>
+        </license>
+    </licenses>
+    <scm>
+        <url>https://github.com/example/maven-artifact</url>
+        <connection>scm:git:https://github.com/example/maven-artifact.git</connection>
+    </scm>
+    <dependencies>
+        <dependency>
+            <groupId>org.springframework</groupId>
+            <artifactId>spring-core</artifactId>
+            <version>5.3.0</version>
+        </dependency>
+        <dependency>
+            <groupId>junit</groupId>
+            <artifactId>junit</artifactId>
+            <version>4.13</version>
+            <scope>test</scope>
+        </dependency>
+    </dependencies>
+</project>"""
+
+NPM_PACKAGE_JSON = {
+    "name": "@scope/npm-package",
+    "version": "1.0.0",
+    "description": "Complete NPM package test",
+    "main": "index.js",
+    "scripts": {
+        "test": "jest",
+        "build": "webpack"
+    },
+    "repository": {
+        "type": "git",
+        "url": "git+https://github.com/scope/npm-package.git"
+    },
+    "keywords": ["npm", "test", "package"],
+    "author": {
+        "name": "NPM Author",
+        "email": "npm@example.com",
+        "url": "https://example.com"
+    },
+    "contributors": [
+        {
+            "name": "Contributor One",
+            "email": "contrib1@example.com"
+        }
+    ],
+    "license": "ISC",
+    "bugs": {
+        "url": "https://github.com/scope/npm-package/issues"
+    },
+    "homepage": "https://github.com/scope/npm-package#readme",
+    "dependencies": {
+        "express": "^4.18.0",
+        "lodash": "^4.17.21"
+    },
+    "devDependencies": {
+        "jest": "^29.0.0",
+        "webpack": "^5.0.0"
+    },
+    "peerDependencies": {
+        "react": "^18.0.0"
+    }
+}
+
+
+def write_zip(path: Path, entries: dict):
+    """Write a deterministic, uncompressed zip archive."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as zf:
+        for name, content in entries.items():
+            info = zipfile.ZipInfo(filename=name, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_STORED
+            zf.writestr(info, content)
+
+
+def write_tgz(path: Path, entries: dict):
+    """Write a deterministic gzipped tar archive."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w') as tf:
+        for name, content in entries.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tf.addfile(info, fileobj=io.BytesIO(content))
+
+    with open(path, 'wb') as f:
+        with gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0) as gz:
+            gz.write(buffer.getvalue())
+
+
+def main():
+    """Regenerate all fixture archives."""
+    FIXTURES_DIR.mkdir(parents=True, exist_ok=True)
+
+    write_zip(FIXTURES_DIR / "complete.whl", {
+        "complete-1.0.0.dist-info/METADATA": COMPLETE_WHEEL_METADATA,
+        "complete-1.0.0.dist-info/LICENSE": "MIT License\n\nCopyright (c) 2024",
+        "complete-1.0.0.dist-info/top_level.txt": "complete",
+    })
+
+    write_zip(FIXTURES_DIR / "maven.jar", {
+        "META-INF/maven/com.example/maven-artifact/pom.xml": MAVEN_POM,
+    })
+
+    write_tgz(FIXTURES_DIR / "npm.tgz", {
+        "package/package.json": json.dumps(NPM_PACKAGE_JSON, separators=(",", ":")).encode(),
+        "package/README.md": b"# NPM Package\n\nTest package for E2E testing",
+    })
+
+    for path in sorted(FIXTURES_DIR.iterdir()):
+        print(f"Wrote {path.relative_to(FIXTURES_DIR.parent.parent.parent)}")
+
+
+if __name__ == '__main__':
+    main()
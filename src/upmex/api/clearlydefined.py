@@ -1,8 +1,8 @@
 """ClearlyDefined API integration for license and metadata enrichment."""
 
-import requests
 from typing import Optional, Dict, Any
 from ..core.models import PackageType, NO_ASSERTION
+from .session import create_session
 
 
 class ClearlyDefinedAPI:
@@ -19,6 +19,7 @@ class ClearlyDefinedAPI:
         self.headers = {}
         if api_key:
             self.headers['Authorization'] = f'Bearer {api_key}'
+        self.session = create_session(self.headers)
     
     def get_definition(self, package_type: PackageType, namespace: Optional[str], name: str, version: str) -> Optional[Dict[str, Any]]:
         """Get package definition from ClearlyDefined.
@@ -49,7 +50,7 @@ class ClearlyDefinedAPI:
             
             # Make API request
             url = f"{self.base_url}/definitions/{coordinates}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 return response.json()
@@ -1,8 +1,8 @@
 """Ecosyste.ms API integration for package metadata enrichment."""
 
-import requests
 from typing import Optional, Dict, Any
 from ..core.models import PackageType, NO_ASSERTION
+from .session import create_session
 
 
 class EcosystemsAPI:
@@ -19,6 +19,7 @@ class EcosystemsAPI:
         self.headers = {}
         if api_key:
             self.headers['Authorization'] = f'Bearer {api_key}'
+        self.session = create_session(self.headers)
     
     def get_package_info(self, package_type: PackageType, name: str, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get package information from Ecosyste.ms.
@@ -39,7 +40,7 @@ class EcosystemsAPI:
             
             # Get package-level info first for maintainers
             package_url = f"{self.base_url}/registries/{registry}/packages/{name}"
-            package_response = requests.get(package_url, headers=self.headers, timeout=10)
+            package_response = self.session.get(package_url, timeout=10)
             
             if package_response.status_code == 200:
                 package_data = package_response.json()
@@ -47,7 +48,7 @@ class EcosystemsAPI:
                 # If version requested, get version-specific data and merge
                 if version:
                     version_url = f"{package_url}/versions/{version}"
-                    version_response = requests.get(version_url, headers=self.headers, timeout=10)
+                    version_response = self.session.get(version_url, timeout=10)
                     if version_response.status_code == 200:
                         version_data = version_response.json()
                         # Merge package data into version data, preserving key package-level metadata
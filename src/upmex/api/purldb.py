@@ -1,8 +1,8 @@
 """PurlDB API integration for package metadata enrichment."""
 
-import requests
 from typing import Optional, Dict, Any, List
 from ..core.models import PackageType, NO_ASSERTION
+from .session import create_session
 
 
 class PurlDBAPI:
@@ -20,6 +20,7 @@ class PurlDBAPI:
         self.headers = {'Content-Type': 'application/json'}
         if api_key:
             self.headers['Authorization'] = f'Token {api_key}'
+        self.session = create_session(self.headers)
 
     def get_package_by_purl(self, purl: str) -> Optional[Dict[str, Any]]:
         """Get package information by PURL.
@@ -35,7 +36,7 @@ class PurlDBAPI:
             url = f"{self.base_url}/api/packages/"
             params = {'purl': purl}
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -94,7 +95,7 @@ class PurlDBAPI:
             if version:
                 params['version'] = version
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -0,0 +1,33 @@
+"""Shared HTTP session setup for API clients."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict
+
+
+def create_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Create a requests session with connection pooling and retries.
+
+    Reusing one session per client keeps TCP/TLS connections alive across
+    lookups instead of reconnecting on every request.
+
+    Args:
+        headers: Optional headers to send with every request
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
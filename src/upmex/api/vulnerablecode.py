@@ -1,8 +1,8 @@
 """VulnerableCode API integration for vulnerability information."""
 
-import requests
 from typing import Optional, Dict, Any, List
 from ..core.models import PackageType
+from .session import create_session
 
 
 class VulnerableCodeAPI:
@@ -20,6 +20,7 @@ class VulnerableCodeAPI:
         self.headers = {'Content-Type': 'application/json'}
         if api_key:
             self.headers['Authorization'] = f'Token {api_key}'
+        self.session = create_session(self.headers)
 
     def get_vulnerabilities_by_purl(self, purl: str) -> Optional[Dict[str, Any]]:
         """Get vulnerability information by PURL.
@@ -38,7 +39,7 @@ class VulnerableCodeAPI:
             url = f"{self.base_url}/api/packages"
             params = {'purl': purl}
 
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
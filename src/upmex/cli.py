@@ -12,6 +12,7 @@ except ImportError:
     pass
 
 import sys
+import copy
 import json
 import click
 from pathlib import Path
@@ -32,6 +33,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Extractor reused across invocations in the same process
+_EXTRACTOR: Optional[PackageExtractor] = None
+_EXTRACTOR_CONFIG: Optional[dict] = None
+
+
+def get_extractor(extractor_config: dict) -> PackageExtractor:
+    """Return a shared PackageExtractor for the given configuration.
+    
+    The extractor is only rebuilt when the configuration changes, so
+    repeated commands in one process reuse the same extractor instances.
+    
+    Args:
+        extractor_config: Configuration dictionary for PackageExtractor
+        
+    Returns:
+        PackageExtractor instance
+    """
+    global _EXTRACTOR, _EXTRACTOR_CONFIG
+    if _EXTRACTOR is None or _EXTRACTOR_CONFIG != extractor_config:
+        _EXTRACTOR = PackageExtractor(extractor_config)
+        _EXTRACTOR_CONFIG = copy.deepcopy(extractor_config)
+    return _EXTRACTOR
+
 
 @click.group()
 @click.version_option(version=__version__, prog_name="upmex")
@@ -91,7 +115,7 @@ def extract(ctx, package_path, output, format, pretty, api, registry):
         # Create extractor with registry mode
         extractor_config = config.to_dict()
         extractor_config['registry_mode'] = registry
-        extractor = PackageExtractor(extractor_config)
+        extractor = get_extractor(extractor_config)
         
         # Extract metadata
         if verbose:
@@ -393,7 +417,7 @@ def extract(ctx, package_path, output, format, pretty, api, registry):
         
         # Write output
         if output:
-            Path(output).write_text(output_text)
+            Path(output).write_text(output_text, encoding='utf-8')
             if not ctx.obj['quiet']:
                 click.echo(f"Output written to: {output}")
         else:
@@ -445,7 +469,7 @@ def license(ctx, package_path):
     
     try:
         # Create extractor
-        extractor = PackageExtractor(config.to_dict())
+        extractor = get_extractor(config.to_dict())
         
         # Extract metadata
         metadata = extractor.extract(package_path)
@@ -1,9 +1,10 @@
 """Configuration management with environment variable support."""
 
 import os
-import json
+import copy
 from pathlib import Path
 from typing import Dict, Any, Optional
+from .utils.json_utils import loads, dumps
 
 
 class Config:
@@ -72,7 +73,8 @@ class Config:
         Args:
             config_file: Optional path to configuration file
         """
-        self.config = self.DEFAULT_CONFIG.copy()
+        # Deep copy so per-instance overrides never write into the shared defaults
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         
         # Load from file if provided
         if config_file:
@@ -94,11 +96,11 @@ class Config:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
-        with open(path, 'r') as f:
-            if path.suffix == '.json':
-                file_config = json.load(f)
-            else:
-                raise ValueError(f"Unsupported config file format: {path.suffix}. Use .json files.")
+        if path.suffix != '.json':
+            raise ValueError(f"Unsupported config file format: {path.suffix}. Use .json files.")
+        
+        data = path.read_bytes()
+        file_config = loads(data)
         
         # Merge with default config
         self.config = self._deep_merge(self.config, file_config)
@@ -208,5 +210,4 @@ class Config:
         """
         path = Path(file_path)
         
-        with open(path, 'w') as f:
-            json.dump(self.config, f, indent=2)
\ No newline at end of file
+        path.write_text(dumps(self.config, indent=True), encoding="utf-8")
\ No newline at end of file
@@ -36,13 +36,19 @@ class PackageExtractor:
         self.config = config or {}
         self.registry_mode = self.config.get('registry_mode', False)
         
+        # Parent POMs fetched in registry mode are cached under the extraction cache dir
+        extraction_config = self.config.get('extraction', {})
+        maven_cache_dir = None
+        if extraction_config.get('cache_enabled', True) and extraction_config.get('cache_dir'):
+            maven_cache_dir = str(Path(extraction_config['cache_dir']) / 'maven')
+        
         # Initialize extractors with registry mode
         self.extractors = {
             PackageType.PYTHON_WHEEL: PythonExtractor(registry_mode=self.registry_mode),
             PackageType.PYTHON_SDIST: PythonExtractor(registry_mode=self.registry_mode),
             PackageType.NPM: NpmExtractor(registry_mode=self.registry_mode),
-            PackageType.MAVEN: JavaExtractor(registry_mode=self.registry_mode),
-            PackageType.JAR: JavaExtractor(registry_mode=self.registry_mode),
+            PackageType.MAVEN: JavaExtractor(registry_mode=self.registry_mode, cache_dir=maven_cache_dir),
+            PackageType.JAR: JavaExtractor(registry_mode=self.registry_mode, cache_dir=maven_cache_dir),
             PackageType.GRADLE: GradleExtractor(registry_mode=self.registry_mode),
             PackageType.COCOAPODS: CocoaPodsExtractor(registry_mode=self.registry_mode),
             PackageType.CONDA: CondaExtractor(registry_mode=self.registry_mode),
@@ -364,9 +370,5 @@ class PackageExtractor:
         Returns:
             Normalized text
         """
-        import re
-        # Replace multiple whitespace with single space
-        text = re.sub(r'\s+', ' ', text)
-        # Strip leading and trailing whitespace
-        text = text.strip()
-        return text
\ No newline at end of file
+        # Collapse whitespace runs to single spaces and strip both ends in one pass
+        return ' '.join(text.split())
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 
 from ..core.models import PackageMetadata, LicenseInfo, LicenseConfidenceLevel, NO_ASSERTION
-from ..utils.patterns import LICENSE_FILE_NAMES
+from ..utils.patterns import LICENSE_FILE_NAMES, SPDX_ID_LOOKUP
 from ..utils.author_parser import parse_author_string, parse_author_list
 from ..utils.archive_utils import find_file_in_archive, extract_from_tar, extract_from_zip
 
@@ -106,6 +106,36 @@ class BaseExtractor(ABC):
 
         return licenses
     
+    def detect_declared_license(self, license_str: str) -> List[LicenseInfo]:
+        """Detect licenses from a license string declared in package metadata.
+        
+        Canonical SPDX identifiers are resolved with a table lookup; other
+        values are passed to OSLiLi.
+        
+        Args:
+            license_str: Declared license, e.g. "MIT" or "BSD-3-Clause"
+            
+        Returns:
+            List of detected licenses
+        """
+        if not license_str:
+            return []
+        
+        spdx_id = SPDX_ID_LOOKUP.get(license_str.strip().casefold())
+        if spdx_id:
+            return [LicenseInfo(
+                name=spdx_id,
+                spdx_id=spdx_id,
+                confidence=1.0,
+                confidence_level=LicenseConfidenceLevel.EXACT,
+                detection_method='spdx_id'
+            )]
+        
+        # Format license text for better osslili detection
+        if len(license_str) < 20 and ':' not in license_str:
+            license_str = f"License: {license_str}"
+        return self.detect_licenses_from_text(license_str)
+    
     def detect_licenses_from_file(self, file_path: str) -> List[LicenseInfo]:
         """Detect licenses from a file.
         
@@ -2,10 +2,50 @@
 
 import json
 import re
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, NO_ASSERTION
+from ..utils.json_utils import loads
+
+
+# Ruby DSL podspec patterns, compiled once per process
+_QUOTES_RE = re.compile(r'^["\']|["\']$')
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_DESC_HEREDOC_RE = re.compile(r's\.description\s*=\s*<<-?(\w+)(.*?)\n\s*\1', re.DOTALL)
+_DESC_RE = re.compile(r's\.description\s*=\s*["\']([^"\']*(?:\\.[^"\']*)*)["\']', re.DOTALL)
+_LICENSE_RE = re.compile(r's\.license\s*=\s*([^\\n]+)')
+_LICENSE_TYPE_RE = re.compile(r':type\s*=>\s*["\']([^"\']+)["\']')
+_LICENSE_FILE_RE = re.compile(r':file\s*=>\s*["\']([^"\']+)["\']')
+_AUTHORS_HASH_RE = re.compile(r's\.authors?\s*=\s*\{([^}]+)\}')
+_AUTHOR_PAIR_RE = re.compile(r'["\']([^"\']+)["\']\s*=>\s*["\']([^"\']+)["\']')
+_AUTHORS_STRING_RE = re.compile(r's\.authors?\s*=\s*["\']([^"\']+)["\']')
+_SOURCE_RE = re.compile(r's\.source\s*=\s*\{([^}]+)\}', re.DOTALL)
+_SOURCE_KEY_RES = {
+    key: re.compile(rf':{key}\s*=>\s*["\']([^"\']+)["\']')
+    for key in ('git', 'tag', 'commit', 'http')
+}
+# Single-pass scanner for simple attributes, platforms and dependencies
+_PODSPEC_RE = re.compile(r"""
+    s\.(?P<key>name|version|summary|homepage)\s*=\s*["'](?P<value>[^"']+)["']
+  | s\.platform\s*=\s*:(?P<platform>\w+)(?:,\s*["'](?P<platform_version>[^"']+)["'])?
+  | s\.(?P<target>\w+)\.deployment_target\s*=\s*["'](?P<target_version>[^"']+)["']
+  | s\.(?P<legacy_target>\w+)_deployment_target\s*=\s*["'](?P<legacy_version>[^"']+)["']
+  | s\.dependency\s+["'](?P<dep>[^"']+)["'](?:,\s*["'](?P<dep_version>[^"']+)["'])?
+""", re.VERBOSE)
+_FRAMEWORKS_ARRAY_RE = re.compile(r's\.frameworks?\s*=\s*\[([^\]]+)\]')
+_FRAMEWORK_RE = re.compile(r's\.frameworks?\s*=\s*["\']([^"\']+)["\']')
+_LIBRARIES_ARRAY_RE = re.compile(r's\.libraries?\s*=\s*\[([^\]]+)\]')
+_LIBRARY_RE = re.compile(r's\.libraries?\s*=\s*["\']([^"\']+)["\']')
+
+
+def _clean_value(value: Optional[str]) -> Optional[str]:
+    """Strip surrounding quotes and unescape quotes in a Ruby string value."""
+    if value is None:
+        return None
+    value = _QUOTES_RE.sub('', value.strip())
+    return value.replace('\\"', '"').replace("\\'", "'")
 
 
 class CocoaPodsExtractor(BaseExtractor):
@@ -34,49 +74,86 @@ class CocoaPodsExtractor(BaseExtractor):
         Returns:
             PackageMetadata object
         """
-        path = Path(file_path)
-        
         try:
-            if path.suffix == '.json':
-                return self._extract_json_podspec(file_path)
-            else:
-                return self._extract_ruby_podspec(file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except UnicodeDecodeError as e:
+            return self._create_minimal_metadata(
+                name=self._name_from_path(file_path),
+                version=NO_ASSERTION,
+                file_path=file_path,
+                error=f"File encoding error: {e}"
+            )
         except Exception as e:
             return self._create_minimal_metadata(
-                name=path.stem.replace('.podspec', '').replace('.json', ''),
+                name=self._name_from_path(file_path),
                 version=NO_ASSERTION,
                 file_path=file_path,
                 error=str(e)
             )
+        
+        return self._extract_from_content(content, file_path)
     
-    def _extract_json_podspec(self, file_path: str) -> PackageMetadata:
-        """Extract metadata from a .podspec.json file."""
+    def extract_from_bytes(self, data: bytes, filename: str) -> PackageMetadata:
+        """Extract metadata from in-memory podspec content.
+        
+        Podspecs are plain text, so they are parsed directly rather than
+        written to a temporary file first.
+        
+        Args:
+            data: Raw podspec bytes
+            filename: Podspec file name, e.g. "Alamofire.podspec.json"
+            
+        Returns:
+            PackageMetadata object
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                spec_data = json.load(f)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
             return self._create_minimal_metadata(
-                name=Path(file_path).stem.replace('.podspec', '').replace('.json', ''),
+                name=self._name_from_path(filename),
                 version=NO_ASSERTION,
-                file_path=file_path,
-                error=f"JSON parsing error: {e}"
+                file_path=filename,
+                error=f"File encoding error: {e}"
             )
         
-        return self._extract_from_spec_data(spec_data, file_path)
+        return self._extract_from_content(content, filename)
     
-    def _extract_ruby_podspec(self, file_path: str) -> PackageMetadata:
-        """Extract metadata from a .podspec Ruby DSL file."""
+    def _extract_from_content(self, content: str, file_path: str) -> PackageMetadata:
+        """Parse podspec content in JSON or Ruby DSL format based on the file name."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError as e:
+            if Path(file_path).suffix == '.json':
+                return self._extract_json_podspec(content, file_path)
+            else:
+                return self._extract_ruby_podspec(content, file_path)
+        except Exception as e:
             return self._create_minimal_metadata(
-                name=Path(file_path).stem.replace('.podspec', '').replace('.json', ''),
+                name=self._name_from_path(file_path),
                 version=NO_ASSERTION,
                 file_path=file_path,
-                error=f"File encoding error: {e}"
+                error=str(e)
+            )
+    
+    def _name_from_path(self, file_path: str) -> str:
+        """Derive a pod name from a podspec file name."""
+        return Path(file_path).name.split('.podspec', 1)[0]
+    
+    def _extract_json_podspec(self, content: str, file_path: str) -> PackageMetadata:
+        """Extract metadata from .podspec.json content."""
+        try:
+            spec_data = loads(content)
+        except json.JSONDecodeError as e:
+            return self._create_minimal_metadata(
+                name=self._name_from_path(file_path),
+                version=NO_ASSERTION,
+                file_path=file_path,
+                error=f"JSON parsing error: {e}"
             )
         
+        return self._extract_from_spec_data(spec_data, file_path)
+    
+    def _extract_ruby_podspec(self, content: str, file_path: str) -> PackageMetadata:
+        """Extract metadata from .podspec Ruby DSL content."""
         # Parse Ruby DSL using regex patterns
         spec_data = self._parse_ruby_dsl(content)
         return self._extract_from_spec_data(spec_data, file_path)
@@ -85,25 +162,34 @@ class CocoaPodsExtractor(BaseExtractor):
         """Parse Ruby DSL podspec content using regex patterns."""
         spec_data = {}
         
-        # Helper function to extract quoted strings and handle multi-line
-        def extract_value(pattern: str, content: str, multiline: bool = False) -> Optional[str]:
-            flags = re.DOTALL if multiline else 0
-            match = re.search(pattern, content, flags)
-            if match:
-                value = match.group(1)
-                # Clean up quotes and escape sequences
-                value = re.sub(r'^["\']|["\']$', '', value.strip())
-                value = value.replace('\\"', '"').replace("\\'", "'")
-                return value
-            return None
+        # Scan simple attributes, platforms and dependencies in one pass.
+        # Attributes keep their first occurrence; platform sources are merged
+        # below so deployment targets override s.platform as before.
+        values = {}
+        platform_decls = {}
+        deployment_targets = {}
+        legacy_targets = {}
+        runtime_deps = []
+        for match in _PODSPEC_RE.finditer(content):
+            if match.group('key'):
+                values.setdefault(match.group('key'), match.group('value'))
+            elif match.group('platform'):
+                platform_decls[match.group('platform')] = match.group('platform_version')
+            elif match.group('target'):
+                deployment_targets[match.group('target')] = match.group('target_version')
+            elif match.group('legacy_target'):
+                legacy_targets[match.group('legacy_target')] = match.group('legacy_version')
+            else:
+                dep_name, version_req = match.group('dep', 'dep_version')
+                runtime_deps.append(f"{dep_name} {version_req}" if version_req else dep_name)
         
         # Extract basic metadata
-        spec_data['name'] = extract_value(r's\.name\s*=\s*["\']([^"\']+)["\']', content)
-        spec_data['version'] = extract_value(r's\.version\s*=\s*["\']([^"\']+)["\']', content)
-        spec_data['summary'] = extract_value(r's\.summary\s*=\s*["\']([^"\']+)["\']', content)
+        spec_data['name'] = _clean_value(values.get('name'))
+        spec_data['version'] = _clean_value(values.get('version'))
+        spec_data['summary'] = _clean_value(values.get('summary'))
         
         # Description can be multi-line, including heredoc format
-        desc_heredoc = re.search(r's\.description\s*=\s*<<-?(\w+)(.*?)\n\s*\1', content, re.DOTALL)
+        desc_heredoc = _DESC_HEREDOC_RE.search(content)
         if desc_heredoc:
             desc_content = desc_heredoc.group(2).strip()
             # Clean up indentation
@@ -116,90 +202,67 @@ class CocoaPodsExtractor(BaseExtractor):
             spec_data['description'] = ' '.join(clean_lines)
         else:
             # Single-line description
-            description = extract_value(r's\.description\s*=\s*["\']([^"\']*(?:\\.[^"\']*)*)["\']', content, True)
+            desc_match = _DESC_RE.search(content)
+            description = _clean_value(desc_match.group(1)) if desc_match else None
             if description:
                 spec_data['description'] = description
         
         # Extract homepage
-        homepage = extract_value(r's\.homepage\s*=\s*["\']([^"\']+)["\']', content)
+        homepage = _clean_value(values.get('homepage'))
         if homepage:
             spec_data['homepage'] = homepage
         
         # Extract license
-        license_match = re.search(r's\.license\s*=\s*([^\\n]+)', content)
+        license_match = _LICENSE_RE.search(content)
         if license_match:
             license_str = license_match.group(1).strip()
             if license_str.startswith('{') and license_str.endswith('}'):
                 # Hash format: { :type => 'MIT', :file => 'LICENSE' }
-                type_match = re.search(r':type\s*=>\s*["\']([^"\']+)["\']', license_str)
-                file_match = re.search(r':file\s*=>\s*["\']([^"\']+)["\']', license_str)
+                type_match = _LICENSE_TYPE_RE.search(license_str)
+                file_match = _LICENSE_FILE_RE.search(license_str)
                 if type_match:
                     spec_data['license'] = {'type': type_match.group(1)}
                     if file_match:
                         spec_data['license']['file'] = file_match.group(1)
             else:
                 # String format: 'MIT'
-                license_clean = re.sub(r'^["\']|["\']$', '', license_str.strip())
+                license_clean = _QUOTES_RE.sub('', license_str.strip())
                 spec_data['license'] = license_clean
         
         # Extract authors (handle different formats)
-        authors_hash = re.search(r's\.authors?\s*=\s*\{([^}]+)\}', content)
+        authors_hash = _AUTHORS_HASH_RE.search(content)
         if authors_hash:
             # Hash format: { 'Author Name' => 'email@example.com' }
             authors_str = authors_hash.group(1)
             authors = {}
-            author_matches = re.findall(r'["\']([^"\']+)["\']\s*=>\s*["\']([^"\']+)["\']', authors_str)
+            author_matches = _AUTHOR_PAIR_RE.findall(authors_str)
             for name, email in author_matches:
                 authors[name] = email
             spec_data['authors'] = authors
         else:
             # Try array format or simple string
-            authors_simple = re.search(r's\.authors?\s*=\s*["\']([^"\']+)["\']', content)
+            authors_simple = _AUTHORS_STRING_RE.search(content)
             if authors_simple:
                 spec_data['authors'] = authors_simple.group(1)
         
         # Extract source
-        source_match = re.search(r's\.source\s*=\s*\{([^}]+)\}', content, re.DOTALL)
+        source_match = _SOURCE_RE.search(content)
         if source_match:
             source_str = source_match.group(1)
             source = {}
-            # Extract git URL
-            git_match = re.search(r':git\s*=>\s*["\']([^"\']+)["\']', source_str)
-            if git_match:
-                source['git'] = git_match.group(1)
-            # Extract tag
-            tag_match = re.search(r':tag\s*=>\s*["\']([^"\']+)["\']', source_str)
-            if tag_match:
-                source['tag'] = tag_match.group(1)
-            # Extract commit
-            commit_match = re.search(r':commit\s*=>\s*["\']([^"\']+)["\']', source_str)
-            if commit_match:
-                source['commit'] = commit_match.group(1)
-            # Extract http
-            http_match = re.search(r':http\s*=>\s*["\']([^"\']+)["\']', source_str)
-            if http_match:
-                source['http'] = http_match.group(1)
+            # Extract git URL, tag, commit and http
+            for key, pattern in _SOURCE_KEY_RES.items():
+                key_match = pattern.search(source_str)
+                if key_match:
+                    source[key] = key_match.group(1)
             
             spec_data['source'] = source
         
-        # Extract platform requirements
-        platforms = {}
-        
-        # Check for s.platform = :ios, '9.0' format
-        platform_matches = re.findall(r's\.platform\s*=\s*:(\w+)(?:,\s*["\']([^"\']+)["\'])?', content)
-        for platform, version in platform_matches:
-            platforms[platform] = version if version else None
-        
-        # Also check for deployment targets: s.ios.deployment_target = "9.0"
-        deployment_targets = re.findall(r's\.(\w+)\.deployment_target\s*=\s*["\']([^"\']+)["\']', content)
-        for platform, version in deployment_targets:
-            platforms[platform] = version
-        
-        # Also check for legacy format: s.ios_deployment_target = "9.0"
-        legacy_targets = re.findall(r's\.(\w+)_deployment_target\s*=\s*["\']([^"\']+)["\']', content)
-        for target_key, version in legacy_targets:
-            platform = target_key  # ios_deployment_target -> ios
-            platforms[platform] = version
+        # Extract platform requirements: s.platform = :ios, '9.0', then
+        # s.ios.deployment_target = "9.0", then legacy s.ios_deployment_target
+        platforms = {platform: version or None for platform, version in platform_decls.items()}
+        platforms.update(deployment_targets)
+        platforms.update(legacy_targets)
         
         if platforms:
             spec_data['platforms'] = platforms
@@ -208,39 +271,33 @@ class CocoaPodsExtractor(BaseExtractor):
         dependencies = {}
         
         # Runtime dependencies
-        runtime_deps = re.findall(r's\.dependency\s+["\']([^"\']+)["\'](?:,\s*["\']([^"\']+)["\'])?', content)
         if runtime_deps:
-            dependencies['runtime'] = []
-            for dep_name, version_req in runtime_deps:
-                if version_req:
-                    dependencies['runtime'].append(f"{dep_name} {version_req}")
-                else:
-                    dependencies['runtime'].append(dep_name)
+            dependencies['runtime'] = runtime_deps
         
         if dependencies:
             spec_data['dependencies'] = dependencies
         
         # Extract frameworks (can be array or string)
-        frameworks_array = re.search(r's\.frameworks?\s*=\s*\[([^\]]+)\]', content)
+        frameworks_array = _FRAMEWORKS_ARRAY_RE.search(content)
         if frameworks_array:
             frameworks_str = frameworks_array.group(1)
-            frameworks = re.findall(r'["\']([^"\']+)["\']', frameworks_str)
+            frameworks = _QUOTED_RE.findall(frameworks_str)
             spec_data['frameworks'] = frameworks
         else:
             # Single framework
-            framework = re.search(r's\.frameworks?\s*=\s*["\']([^"\']+)["\']', content)
+            framework = _FRAMEWORK_RE.search(content)
             if framework:
                 spec_data['frameworks'] = [framework.group(1)]
         
         # Extract libraries (can be array or string)
-        libraries_array = re.search(r's\.libraries?\s*=\s*\[([^\]]+)\]', content)
+        libraries_array = _LIBRARIES_ARRAY_RE.search(content)
         if libraries_array:
             libraries_str = libraries_array.group(1)
-            libraries = re.findall(r'["\']([^"\']+)["\']', libraries_str)
+            libraries = _QUOTED_RE.findall(libraries_str)
             spec_data['libraries'] = libraries
         else:
             # Single library
-            library = re.search(r's\.libraries?\s*=\s*["\']([^"\']+)["\']', content)
+            library = _LIBRARY_RE.search(content)
             if library:
                 spec_data['libraries'] = [library.group(1)]
         
@@ -250,7 +307,7 @@ class CocoaPodsExtractor(BaseExtractor):
         """Extract PackageMetadata from parsed spec data."""
         
         # Basic metadata
-        name = spec_data.get('name', Path(file_path).stem.replace('.podspec', '').replace('.json', ''))
+        name = spec_data.get('name') or self._name_from_path(file_path)
         version = spec_data.get('version', NO_ASSERTION)
         
         # Description (prefer description over summary)
@@ -288,18 +345,14 @@ class CocoaPodsExtractor(BaseExtractor):
             dependencies.update(deps_data)
         
         # Keywords from platforms and frameworks
-        keywords = []
-        if 'platforms' in spec_data:
-            platforms = spec_data['platforms']
-            if isinstance(platforms, dict):
-                keywords.extend(platforms.keys())
-        
-        if 'frameworks' in spec_data:
-            frameworks = spec_data['frameworks']
-            if isinstance(frameworks, list):
-                keywords.extend(frameworks)
-            elif isinstance(frameworks, str):
-                keywords.append(frameworks)
+        platforms = spec_data.get('platforms')
+        frameworks = spec_data.get('frameworks')
+        if isinstance(frameworks, str):
+            frameworks = [frameworks]
+        keywords = list(dict.fromkeys(chain(
+            platforms.keys() if isinstance(platforms, dict) else (),
+            frameworks if isinstance(frameworks, list) else (),
+        )))
         
         # License detection
         licenses = []
@@ -309,14 +362,7 @@ class CocoaPodsExtractor(BaseExtractor):
                 license_type = license_data.get('type')
                 license_file = license_data.get('file')
                 if license_type:
-                    # Format license text for better osslili detection
-                    if len(license_type) < 20 and ':' not in license_type:
-                        formatted_text = f"License: {license_type}"
-                    else:
-                        formatted_text = license_type
-                    detected = self.detect_licenses_from_text(formatted_text)
-                    if detected:
-                        licenses.extend(detected)
+                    licenses.extend(self.detect_declared_license(license_type))
                 elif license_file:
                     # Try to read license file if it exists
                     license_file_path = Path(file_path).parent / license_file
@@ -330,14 +376,7 @@ class CocoaPodsExtractor(BaseExtractor):
                         except Exception:
                             pass
             elif isinstance(license_data, str):
-                # Format license text for better osslili detection
-                if len(license_data) < 20 and ':' not in license_data:
-                    formatted_text = f"License: {license_data}"
-                else:
-                    formatted_text = license_data
-                detected = self.detect_licenses_from_text(formatted_text)
-                if detected:
-                    licenses.extend(detected)
+                licenses.extend(self.detect_declared_license(license_data))
         
         # If no license found, try to find LICENSE files
         if not licenses:
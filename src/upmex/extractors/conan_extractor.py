@@ -12,6 +12,18 @@ from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, LicenseInfo, NO_ASSERTION
 
 
+# conanfile.py attribute patterns, compiled once per process
+_ATTRIBUTE_RES = {
+    attr: re.compile(rf'^\s*{attr}\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+    for attr in ('name', 'version', 'description', 'license', 'author', 'url', 'homepage', 'requires')
+}
+_DESC_MULTILINE_RE = re.compile(r'^\s*description\s*=\s*"""(.*?)"""', re.MULTILINE | re.DOTALL)
+_REQUIRES_LIST_RE = re.compile(r'^\s*requires\s*=\s*\[(.*?)\]', re.MULTILINE | re.DOTALL)
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_REFERENCE_RE = re.compile(r'([^/]+)/([^@]+)')
+_AUTHOR_EMAIL_RE = re.compile(r'[\(<]([^)>]+@[^)>]+)[\)>]')
+
+
 class ConanExtractor(BaseExtractor):
     """Extractor for Conan C/C++ packages."""
     
@@ -219,40 +231,40 @@ class ConanExtractor(BaseExtractor):
         )
         
         # Extract name
-        name_match = re.search(r'^\s*name\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        name_match = _ATTRIBUTE_RES['name'].search(content)
         if name_match:
             metadata.name = name_match.group(1)
         
         # Extract version
-        version_match = re.search(r'^\s*version\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        version_match = _ATTRIBUTE_RES['version'].search(content)
         if version_match:
             metadata.version = version_match.group(1)
         
         # Extract description
-        desc_match = re.search(r'^\s*description\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        desc_match = _ATTRIBUTE_RES['description'].search(content)
         if not desc_match:
             # Try multiline description
-            desc_match = re.search(r'^\s*description\s*=\s*"""(.*?)"""', content, re.MULTILINE | re.DOTALL)
+            desc_match = _DESC_MULTILINE_RE.search(content)
         if desc_match:
             metadata.description = desc_match.group(1).strip()
         
         # Extract license
-        license_match = re.search(r'^\s*license\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        license_match = _ATTRIBUTE_RES['license'].search(content)
         if license_match:
             metadata.licenses = self._parse_licenses(license_match.group(1))
         
         # Extract author
-        author_match = re.search(r'^\s*author\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        author_match = _ATTRIBUTE_RES['author'].search(content)
         if author_match:
             metadata.authors = [self._parse_author(author_match.group(1))]
         
         # Extract URL
-        url_match = re.search(r'^\s*url\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        url_match = _ATTRIBUTE_RES['url'].search(content)
         if url_match:
             metadata.repository = url_match.group(1)
         
         # Extract homepage
-        homepage_match = re.search(r'^\s*homepage\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+        homepage_match = _ATTRIBUTE_RES['homepage'].search(content)
         if homepage_match:
             metadata.homepage = homepage_match.group(1)
         else:
@@ -286,7 +298,7 @@ class ConanExtractor(BaseExtractor):
         full_requires = sections.get('full_requires', [])
         if full_requires and full_requires[0]:
             # Format: package/version@user/channel: hash
-            match = re.match(r'([^/]+)/([^@]+)', full_requires[0])
+            match = _REFERENCE_RE.match(full_requires[0])
             if match:
                 name = match.group(1)
                 version = match.group(2)
@@ -439,7 +451,7 @@ class ConanExtractor(BaseExtractor):
         author_dict = {}
         
         # Parse "Name (email)" or "Name <email>" format
-        email_match = re.search(r'[\(<]([^)>]+@[^)>]+)[\)>]', author_str)
+        email_match = _AUTHOR_EMAIL_RE.search(author_str)
         if email_match:
             email = email_match.group(1)
             name = author_str[:author_str.index(email_match.group(0))].strip()
@@ -542,11 +554,11 @@ class ConanExtractor(BaseExtractor):
         dependencies = []
         
         # Find requires list or string
-        requires_match = re.search(r'^\s*requires\s*=\s*\[(.*?)\]', content, re.MULTILINE | re.DOTALL)
+        requires_match = _REQUIRES_LIST_RE.search(content)
         if requires_match:
             # Parse list of requirements
             req_str = requires_match.group(1)
-            for req in re.findall(r'["\']([^"\']+)["\']', req_str):
+            for req in _QUOTED_RE.findall(req_str):
                 if '/' in req:
                     dep_name, dep_version = req.split('/', 1)
                     dep_version = dep_version.split('@')[0] if '@' in dep_version else dep_version
@@ -561,7 +573,7 @@ class ConanExtractor(BaseExtractor):
                     })
         else:
             # Try single string require
-            requires_match = re.search(r'^\s*requires\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
+            requires_match = _ATTRIBUTE_RES['requires'].search(content)
             if requires_match:
                 req = requires_match.group(1)
                 if '/' in req:
@@ -1,13 +1,13 @@
 """Conda package extractor for .tar.bz2 and .conda formats."""
 
-import json
 import tarfile
 import zipfile
 import tempfile
 import os
 import io
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, BinaryIO, Tuple
 import yaml
 try:
     import zstandard as zstd
@@ -16,6 +16,14 @@ except ImportError:
     HAS_ZSTD = False
 from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, NO_ASSERTION
+from ..utils.json_utils import loads
+from ..utils.yaml_utils import SAFE_LOADER
+
+# Leading bytes of every bzip2 stream
+_BZIP2_MAGIC = b'BZh'
+
+# Metadata files read from tar-based conda package contents
+_TAR_METADATA_MEMBERS = frozenset({'info/index.json', 'info/recipe/meta.yaml', 'info/recipe.json'})
 
 
 class CondaExtractor(BaseExtractor):
@@ -59,9 +67,14 @@ class CondaExtractor(BaseExtractor):
             True if it contains conda package structure
         """
         try:
+            # Reject non-bzip2 files from their magic bytes before decompressing
+            with open(package_path, 'rb') as f:
+                if f.read(3) != _BZIP2_MAGIC:
+                    return False
+            
             with tarfile.open(package_path, 'r:bz2') as tar:
                 # Look for info/index.json which is required in conda packages
-                for member in tar.getmembers():
+                for member in tar:
                     if member.name == 'info/index.json':
                         return True
         except Exception:
@@ -77,14 +90,33 @@ class CondaExtractor(BaseExtractor):
         Returns:
             PackageMetadata object
         """
+        return self._extract(package_path)
+    
+    def extract_from_bytes(self, data: bytes, filename: str) -> PackageMetadata:
+        """Extract metadata from an in-memory Conda package.
+        
+        Conda metadata lives entirely inside the archive, so the bytes are
+        read through a BytesIO instead of a temporary file.
+        
+        Args:
+            data: Raw package archive bytes
+            filename: Package file name, e.g. "numpy-1.21.0-py39_0.conda"
+            
+        Returns:
+            PackageMetadata object
+        """
+        return self._extract(filename, io.BytesIO(data))
+    
+    def _extract(self, package_path: str, fileobj: Optional[BinaryIO] = None) -> PackageMetadata:
+        """Dispatch on the package file name, reading from fileobj if given."""
         path = Path(package_path)
         
         try:
             # Extract metadata based on package format
             if path.suffix == '.conda':
-                return self._extract_from_conda_format(package_path)
+                return self._extract_from_conda_format(package_path, fileobj)
             elif path.name.endswith('.tar.bz2'):
-                return self._extract_from_tar_bz2(package_path)
+                return self._extract_from_tar_bz2(package_path, fileobj)
             else:
                 return self._create_minimal_metadata(
                     name=path.stem,
@@ -98,11 +130,13 @@ class CondaExtractor(BaseExtractor):
                 error=str(e)
             )
     
-    def _extract_from_conda_format(self, package_path: str) -> PackageMetadata:
+    def _extract_from_conda_format(self, package_path: str,
+                                   fileobj: Optional[BinaryIO] = None) -> PackageMetadata:
         """Extract metadata from .conda format (zip-based).
 
         Args:
             package_path: Path to .conda package
+            fileobj: Optional file object to read instead of package_path
 
         Returns:
             PackageMetadata object
@@ -111,54 +145,36 @@ class CondaExtractor(BaseExtractor):
         recipe_dict = {}
 
         try:
-            with zipfile.ZipFile(package_path, 'r') as zf:
+            with zipfile.ZipFile(fileobj or package_path, 'r') as zf:
                 # Check for new conda format v2 with .tar.zst files
-                info_files = [f for f in zf.namelist() if f.startswith('info-') and f.endswith('.tar.zst')]
+                names = zf.namelist()
+                name_set = set(names)
+                info_files = [f for f in names if f.startswith('info-') and f.endswith('.tar.zst')]
 
                 if info_files and HAS_ZSTD:
-                    # New format with zstandard compression
+                    # New format with zstandard compression; stream the
+                    # decompressed tar instead of materializing it in memory
                     for info_file in info_files:
                         with zf.open(info_file) as zst_file:
-                            # Decompress zstd
                             dctx = zstd.ZstdDecompressor()
-                            decompressed = dctx.decompress(zst_file.read())
-
-                            # Extract tar content
-                            tar_io = io.BytesIO(decompressed)
-                            with tarfile.open(fileobj=tar_io, mode='r') as tar:
-                                # Look for index.json
-                                for member in tar.getmembers():
-                                    if member.name == 'info/index.json':
-                                        f = tar.extractfile(member)
-                                        if f:
-                                            metadata_dict = json.load(f)
-                                            break
-
-                                # Look for recipe files
-                                for member in tar.getmembers():
-                                    if member.name == 'info/recipe/meta.yaml':
-                                        f = tar.extractfile(member)
-                                        if f:
-                                            recipe_dict = yaml.safe_load(f)
-                                            break
-                                    elif member.name == 'info/recipe.json':
-                                        f = tar.extractfile(member)
-                                        if f:
-                                            recipe_dict = json.load(f)
-                                            break
+                            with dctx.stream_reader(zst_file) as reader, \
+                                    tarfile.open(fileobj=reader, mode='r|') as tar:
+                                index, recipe = self._read_info_members(tar)
+                        metadata_dict = index or metadata_dict
+                        recipe_dict = recipe or recipe_dict
 
                 # Old format: Extract info/index.json (if directly in zip)
-                elif 'info/index.json' in zf.namelist():
+                elif 'info/index.json' in name_set:
                     with zf.open('info/index.json') as f:
-                        metadata_dict = json.load(f)
+                        metadata_dict = loads(f.read())
 
                     # Extract info/recipe/meta.yaml (optional)
-                    if 'info/recipe/meta.yaml' in zf.namelist():
+                    if 'info/recipe/meta.yaml' in name_set:
                         with zf.open('info/recipe/meta.yaml') as f:
-                            recipe_dict = yaml.safe_load(f)
-                    elif 'info/recipe.json' in zf.namelist():
+                            recipe_dict = yaml.load(f, Loader=SAFE_LOADER)
+                    elif 'info/recipe.json' in name_set:
                         with zf.open('info/recipe.json') as f:
-                            recipe_dict = json.load(f)
+                            recipe_dict = loads(f.read())
         except Exception as e:
             return self._create_minimal_metadata(
                 name=Path(package_path).stem,
@@ -168,11 +184,13 @@ class CondaExtractor(BaseExtractor):
 
         return self._parse_conda_metadata(metadata_dict, recipe_dict)
     
-    def _extract_from_tar_bz2(self, package_path: str) -> PackageMetadata:
+    def _extract_from_tar_bz2(self, package_path: str,
+                              fileobj: Optional[BinaryIO] = None) -> PackageMetadata:
         """Extract metadata from .tar.bz2 conda package.
         
         Args:
             package_path: Path to .tar.bz2 package
+            fileobj: Optional file object to read instead of package_path
             
         Returns:
             PackageMetadata object
@@ -181,31 +199,8 @@ class CondaExtractor(BaseExtractor):
         recipe_dict = {}
         
         try:
-            with tarfile.open(package_path, 'r:bz2') as tar:
-                # Extract info/index.json (required)
-                try:
-                    index_member = tar.getmember('info/index.json')
-                    index_file = tar.extractfile(index_member)
-                    if index_file:
-                        metadata_dict = json.load(index_file)
-                except KeyError:
-                    pass
-                
-                # Extract info/recipe/meta.yaml (optional)
-                try:
-                    recipe_member = tar.getmember('info/recipe/meta.yaml')
-                    recipe_file = tar.extractfile(recipe_member)
-                    if recipe_file:
-                        recipe_dict = yaml.safe_load(recipe_file)
-                except KeyError:
-                    # Try JSON format
-                    try:
-                        recipe_member = tar.getmember('info/recipe.json')
-                        recipe_file = tar.extractfile(recipe_member)
-                        if recipe_file:
-                            recipe_dict = json.load(recipe_file)
-                    except KeyError:
-                        pass
+            with tarfile.open(package_path, 'r:bz2', fileobj=fileobj) as tar:
+                metadata_dict, recipe_dict = self._read_info_members(tar)
         except Exception as e:
             return self._create_minimal_metadata(
                 name=Path(package_path).stem,
@@ -215,6 +210,38 @@ class CondaExtractor(BaseExtractor):
         
         return self._parse_conda_metadata(metadata_dict, recipe_dict)
     
+    def _read_info_members(self, tar: tarfile.TarFile) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Parse index.json and the recipe from a tar stream in a single pass.
+        
+        Members are walked in archive order rather than via getmember(),
+        which indexes (and so decompresses) the whole archive. conda-build
+        writes info/ first, so the walk stops once past it. Each member is
+        parsed as soon as it is reached, which also works on non-seekable
+        streams.
+        
+        Args:
+            tar: Open tar archive
+            
+        Returns:
+            Tuple of (index.json dict, recipe dict); recipe/meta.yaml is
+            preferred over recipe.json
+        """
+        parsed = {}
+        for member in tar:
+            if member.name in _TAR_METADATA_MEMBERS:
+                member_file = tar.extractfile(member)
+                if not member_file:
+                    continue
+                if member.name.endswith('.yaml'):
+                    parsed[member.name] = yaml.load(member_file, Loader=SAFE_LOADER)
+                else:
+                    parsed[member.name] = loads(member_file.read())
+            elif 'info/index.json' in parsed and not member.name.startswith('info/'):
+                break
+        
+        recipe = parsed.get('info/recipe/meta.yaml') or parsed.get('info/recipe.json') or {}
+        return parsed.get('info/index.json', {}), recipe
+    
     def _parse_conda_metadata(self, index_json: Dict[str, Any], recipe: Dict[str, Any]) -> PackageMetadata:
         """Parse metadata from conda package files.
         
@@ -280,14 +307,7 @@ class CondaExtractor(BaseExtractor):
         licenses = []
         license_info = index_json.get('license') or (recipe.get('about', {}).get('license') if recipe else None)
         if license_info:
-            # Format license text for better osslili detection
-            if len(license_info) < 20 and ':' not in license_info:
-                formatted_text = f"License: {license_info}"
-            else:
-                formatted_text = license_info
-            detected = self.detect_licenses_from_text(formatted_text)
-            if detected:
-                licenses.extend(detected)
+            licenses.extend(self.detect_declared_license(license_info))
         
         # Extract authors/maintainers
         authors = []
@@ -306,26 +326,15 @@ class CondaExtractor(BaseExtractor):
                 if isinstance(author, str):
                     authors.append({'name': author, 'email': NO_ASSERTION})
         
-        # Keywords from features and other metadata
-        keywords = []
-        
-        # Add channel if present
+        # Keywords from channel, subdir/platform, features and track features
         channel = index_json.get('channel')
-        if channel:
-            keywords.append(f"channel:{channel}")
-        
-        # Add subdir/platform
         subdir = index_json.get('subdir')
-        if subdir:
-            keywords.append(subdir)
-        
-        # Add features
-        features = index_json.get('features', [])
-        keywords.extend(features)
-        
-        # Add track features
-        track_features = index_json.get('track_features', [])
-        keywords.extend(track_features)
+        keywords = list(dict.fromkeys(chain(
+            [f"channel:{channel}"] if channel else (),
+            [subdir] if subdir else (),
+            self._as_feature_list(index_json.get('features')),
+            self._as_feature_list(index_json.get('track_features')),
+        )))
         
         # Build complete raw metadata
         raw_metadata = {
@@ -350,6 +359,14 @@ class CondaExtractor(BaseExtractor):
             raw_metadata=raw_metadata
         )
     
+    def _as_feature_list(self, features: Any) -> List[str]:
+        """Normalize features/track_features, which conda stores as a list or a space-separated string."""
+        if not features:
+            return []
+        if isinstance(features, str):
+            return features.split()
+        return list(features)
+    
     def _create_minimal_metadata(self, name: str, version: str, error: str = None) -> PackageMetadata:
         """Create minimal metadata when extraction fails.
         
@@ -1,12 +1,105 @@
 """Gradle build file extractor."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, NO_ASSERTION
 
 
+# Gradle script patterns, compiled once per process
+_REPOSITORY_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'url\s*=\s*["\']([^"\']+github[^"\']+)["\']',
+    r'url\s*=\s*["\']([^"\']+gitlab[^"\']+)["\']',
+    r'url\s*=\s*["\']([^"\']+bitbucket[^"\']+)["\']',
+    r'scm\s*\{[^}]*url\s*=\s*["\']([^"\']+)["\']',
+    r'vcs\s*\{[^}]*url\s*=\s*["\']([^"\']+)["\']',
+))
+_KOTLIN_REPOSITORY_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'url\.set\(["\']([^"\']+)["\']',
+    r'vcs\s*\{[^}]*url\.set\(["\']([^"\']+)["\']',
+))
+_PUBLISHING_POM_RE = re.compile(r'publishing\s*\{[^}]*pom\s*\{([^}]+)\}', re.MULTILINE | re.DOTALL)
+_URL_RES = tuple(re.compile(p) for p in (
+    r'url\s*=\s*["\']([^"\']+)["\']',
+    r'website\s*=\s*["\']([^"\']+)["\']',
+    r'homepage\s*=\s*["\']([^"\']+)["\']',
+))
+_KOTLIN_URL_RES = tuple(re.compile(p) for p in (
+    r'url\.set\(["\']([^"\']+)["\']',
+    r'website\.set\(["\']([^"\']+)["\']',
+))
+_DEPENDENCIES_BLOCK_RE = re.compile(
+    r'dependencies\s*\{([^}]+(?:\{[^}]+\}[^}]+)*)\}', re.MULTILINE | re.DOTALL
+)
+# Dependency configurations and the category each one is reported under
+_DEPENDENCY_CATEGORIES = {
+    'implementation': 'implementation',
+    'compile': 'implementation',
+    'runtime': 'runtime',
+    'runtimeOnly': 'runtime',
+    'api': 'api',
+    'testImplementation': 'test',
+    'testCompile': 'test',
+    'testRuntime': 'test',
+}
+# One scan over the dependencies block for every configuration
+_DEPENDENCY_RE = re.compile(
+    r'(?P<config>testImplementation|testCompile|testRuntime|implementation|compile|runtimeOnly|runtime|api)'
+    r'\s*\(?["\']([^"\']+)["\']\)?'
+)
+_AUTHOR_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'developer\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\'][^}]*email\s*=\s*["\']([^"\']+)["\']',
+    r'author\s*=\s*["\']([^"\']+)["\']',
+    r'developers\s*\{[^}]*developer\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
+))
+_KOTLIN_AUTHOR_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'developer\s*\{[^}]*name\.set\(["\']([^"\']+)["\']\)[^}]*email\.set\(["\']([^"\']+)["\']\)',
+    r'name\.set\(["\']([^"\']+)["\']\)[^}]*email\.set\(["\']([^"\']+)["\']\)',
+))
+_LICENSE_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'license\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
+    r'licenses\s*\{[^}]*license\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
+    r'license\s*=\s*["\']([^"\']+)["\']',
+))
+_KOTLIN_LICENSE_RES = tuple(re.compile(p, re.MULTILINE | re.DOTALL) for p in (
+    r'license\s*\{[^}]*name\.set\(["\']([^"\']+)["\']\)',
+    r'name\.set\(["\']([^"\']+)["\']\)',
+))
+_KEYWORD_LIST_RES = tuple(re.compile(p, re.MULTILINE) for p in (
+    r'tags\s*=\s*\[([^\]]+)\]',
+    r'labels\s*=\s*\[([^\]]+)\]',
+    r'keywords\s*=\s*\[([^\]]+)\]',
+))
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+
+
+@lru_cache(maxsize=None)
+def _field_patterns(field: str, alt_field: str, is_kotlin: bool) -> Tuple[re.Pattern, ...]:
+    """Compile the assignment patterns for a Gradle field, once per field."""
+    if is_kotlin:
+        # Kotlin DSL patterns
+        patterns = [
+            rf'{field}\s*=\s*"([^"]+)"',
+            rf'{field}\s*=\s*\'([^\']+)\'',
+            rf'{alt_field}\s*=\s*"([^"]+)"',
+            rf'{alt_field}\s*=\s*\'([^\']+)\'',
+            rf'{field}\s*\(\s*"([^"]+)"\s*\)',
+            rf'{field}\s*\(\s*\'([^\']+)\'\s*\)',
+        ]
+    else:
+        # Groovy DSL patterns
+        patterns = [
+            rf'{field}\s*=\s*["\']([^"\']+)["\']',
+            rf'{field}\s+["\']([^"\']+)["\']',
+            rf'{alt_field}\s*=\s*["\']([^"\']+)["\']',
+            rf'{alt_field}\s+["\']([^"\']+)["\']',
+        ]
+    # Drop the duplicates produced when field and alt_field are the same
+    return tuple(re.compile(p, re.MULTILINE) for p in dict.fromkeys(patterns))
+
+
 class GradleExtractor(BaseExtractor):
     """Extractor for Gradle build files."""
     
@@ -35,6 +128,12 @@ class GradleExtractor(BaseExtractor):
             
             metadata.name = project_name
             metadata.version = self._extract_field(content, 'version', 'version', is_kotlin_dsl)
+            
+            # Settings scripts only declare the project structure, so the
+            # build-script fields below never appear in them
+            if path.name.startswith('settings.gradle'):
+                return metadata
+            
             metadata.description = self._extract_field(content, 'description', 'description', is_kotlin_dsl)
             
             # Extract group (organization)
@@ -75,29 +174,8 @@ class GradleExtractor(BaseExtractor):
     
     def _extract_field(self, content: str, field: str, alt_field: str, is_kotlin: bool) -> Optional[str]:
         """Extract a field value from Gradle script."""
-        patterns = []
-        
-        if is_kotlin:
-            # Kotlin DSL patterns
-            patterns = [
-                rf'{field}\s*=\s*"([^"]+)"',
-                rf'{field}\s*=\s*\'([^\']+)\'',
-                rf'{alt_field}\s*=\s*"([^"]+)"',
-                rf'{alt_field}\s*=\s*\'([^\']+)\'',
-                rf'{field}\s*\(\s*"([^"]+)"\s*\)',
-                rf'{field}\s*\(\s*\'([^\']+)\'\s*\)',
-            ]
-        else:
-            # Groovy DSL patterns
-            patterns = [
-                rf'{field}\s*=\s*["\']([^"\']+)["\']',
-                rf'{field}\s+["\']([^"\']+)["\']',
-                rf'{alt_field}\s*=\s*["\']([^"\']+)["\']',
-                rf'{alt_field}\s+["\']([^"\']+)["\']',
-            ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE)
+        for pattern in _field_patterns(field, alt_field, is_kotlin):
+            match = pattern.search(content)
             if match:
                 return match.group(1).strip()
         
@@ -106,22 +184,10 @@ class GradleExtractor(BaseExtractor):
     def _extract_repository(self, content: str, is_kotlin: bool) -> Optional[str]:
         """Extract repository URL from Gradle script."""
         # Look for vcs/scm URL
-        patterns = [
-            r'url\s*=\s*["\']([^"\']+github[^"\']+)["\']',
-            r'url\s*=\s*["\']([^"\']+gitlab[^"\']+)["\']',
-            r'url\s*=\s*["\']([^"\']+bitbucket[^"\']+)["\']',
-            r'scm\s*\{[^}]*url\s*=\s*["\']([^"\']+)["\']',
-            r'vcs\s*\{[^}]*url\s*=\s*["\']([^"\']+)["\']',
-        ]
-        
-        if is_kotlin:
-            patterns.extend([
-                r'url\.set\(["\']([^"\']+)["\']',
-                r'vcs\s*\{[^}]*url\.set\(["\']([^"\']+)["\']',
-            ])
+        patterns = _REPOSITORY_RES + _KOTLIN_REPOSITORY_RES if is_kotlin else _REPOSITORY_RES
         
         for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+            match = pattern.search(content)
             if match:
                 url = match.group(1)
                 # Clean up URL
@@ -135,29 +201,15 @@ class GradleExtractor(BaseExtractor):
     
     def _extract_url(self, content: str, is_kotlin: bool) -> Optional[str]:
         """Extract homepage URL from Gradle script."""
-        patterns = [
-            r'url\s*=\s*["\']([^"\']+)["\']',
-            r'website\s*=\s*["\']([^"\']+)["\']',
-            r'homepage\s*=\s*["\']([^"\']+)["\']',
-        ]
-        
-        if is_kotlin:
-            patterns.extend([
-                r'url\.set\(["\']([^"\']+)["\']',
-                r'website\.set\(["\']([^"\']+)["\']',
-            ])
+        patterns = _URL_RES + _KOTLIN_URL_RES if is_kotlin else _URL_RES
         
         # Look in publishing or pom configuration
-        publishing_match = re.search(
-            r'publishing\s*\{[^}]*pom\s*\{([^}]+)\}',
-            content,
-            re.MULTILINE | re.DOTALL
-        )
+        publishing_match = _PUBLISHING_POM_RE.search(content)
         
         if publishing_match:
             pom_content = publishing_match.group(1)
             for pattern in patterns:
-                match = re.search(pattern, pom_content)
+                match = pattern.search(pom_content)
                 if match:
                     url = match.group(1)
                     if url.startswith('http'):
@@ -176,36 +228,14 @@ class GradleExtractor(BaseExtractor):
         }
         
         # Find dependencies block
-        dep_pattern = r'dependencies\s*\{([^}]+(?:\{[^}]+\}[^}]+)*)\}'
-        dep_match = re.search(dep_pattern, content, re.MULTILINE | re.DOTALL)
+        dep_match = _DEPENDENCIES_BLOCK_RE.search(content)
         
         if dep_match:
             dep_block = dep_match.group(1)
             
-            # Patterns for different dependency configurations
-            patterns = {
-                'implementation': r'implementation\s*\(?["\']([^"\']+)["\']\)?',
-                'compile': r'compile\s*\(?["\']([^"\']+)["\']\)?',
-                'runtime': r'runtime\s*\(?["\']([^"\']+)["\']\)?',
-                'runtimeOnly': r'runtimeOnly\s*\(?["\']([^"\']+)["\']\)?',
-                'api': r'api\s*\(?["\']([^"\']+)["\']\)?',
-                'testImplementation': r'testImplementation\s*\(?["\']([^"\']+)["\']\)?',
-                'testCompile': r'testCompile\s*\(?["\']([^"\']+)["\']\)?',
-                'testRuntime': r'testRuntime\s*\(?["\']([^"\']+)["\']\)?',
-            }
-            
-            for config, pattern in patterns.items():
-                matches = re.findall(pattern, dep_block)
-                for dep in matches:
-                    # Categorize dependencies
-                    if 'test' in config.lower():
-                        dependencies['test'].append(dep)
-                    elif config in ['implementation', 'compile']:
-                        dependencies['implementation'].append(dep)
-                    elif config == 'api':
-                        dependencies['api'].append(dep)
-                    elif 'runtime' in config.lower():
-                        dependencies['runtime'].append(dep)
+            # Each configuration is reported under its category
+            for match in _DEPENDENCY_RE.finditer(dep_block):
+                dependencies[_DEPENDENCY_CATEGORIES[match.group('config')]].append(match.group(2))
         
         # Clean up empty categories
         return {k: v for k, v in dependencies.items() if v}
@@ -214,22 +244,11 @@ class GradleExtractor(BaseExtractor):
         """Extract author information from Gradle script."""
         authors = []
         
-        # Look in publishing/pom section
-        patterns = [
-            r'developer\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\'][^}]*email\s*=\s*["\']([^"\']+)["\']',
-            r'author\s*=\s*["\']([^"\']+)["\']',
-            r'developers\s*\{[^}]*developer\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
-        ]
-        
-        # Add Kotlin-specific patterns
-        if is_kotlin:
-            patterns.extend([
-                r'developer\s*\{[^}]*name\.set\(["\']([^"\']+)["\']\)[^}]*email\.set\(["\']([^"\']+)["\']\)',
-                r'name\.set\(["\']([^"\']+)["\']\)[^}]*email\.set\(["\']([^"\']+)["\']\)',
-            ])
+        # Look in publishing/pom section, plus Kotlin-specific patterns
+        patterns = _AUTHOR_RES + _KOTLIN_AUTHOR_RES if is_kotlin else _AUTHOR_RES
         
         for pattern in patterns:
-            matches = re.findall(pattern, content, re.MULTILINE | re.DOTALL)
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, tuple) and len(match) == 2:
                     authors.append({
@@ -254,22 +273,11 @@ class GradleExtractor(BaseExtractor):
     
     def _extract_license(self, content: str, is_kotlin: bool):
         """Extract license information from Gradle script."""
-        # Look for license in publishing/pom section
-        patterns = [
-            r'license\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
-            r'licenses\s*\{[^}]*license\s*\{[^}]*name\s*=\s*["\']([^"\']+)["\']',
-            r'license\s*=\s*["\']([^"\']+)["\']',
-        ]
-        
-        # Add Kotlin-specific patterns
-        if is_kotlin:
-            patterns.extend([
-                r'license\s*\{[^}]*name\.set\(["\']([^"\']+)["\']\)',
-                r'name\.set\(["\']([^"\']+)["\']\)',
-            ])
+        # Look for license in publishing/pom section, plus Kotlin-specific patterns
+        patterns = _LICENSE_RES + _KOTLIN_LICENSE_RES if is_kotlin else _LICENSE_RES
         
         for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+            match = pattern.search(content)
             if match:
                 license_text = match.group(1)
                 # Format license text for better osslili detection
@@ -288,18 +296,12 @@ class GradleExtractor(BaseExtractor):
         """Extract keywords/tags from Gradle script."""
         keywords = []
         
-        patterns = [
-            r'tags\s*=\s*\[([^\]]+)\]',
-            r'labels\s*=\s*\[([^\]]+)\]',
-            r'keywords\s*=\s*\[([^\]]+)\]',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.MULTILINE)
+        for pattern in _KEYWORD_LIST_RES:
+            match = pattern.search(content)
             if match:
                 tags_str = match.group(1)
                 # Parse the list of tags
-                tags = re.findall(r'["\']([^"\']+)["\']', tags_str)
+                tags = _QUOTED_RE.findall(tags_str)
                 keywords.extend(tags)
         
         return list(set(keywords)) if keywords else []
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Java/Maven package extractor."""
 
+import os
 import zipfile
 import xml.etree.ElementTree as ET
 import re
@@ -10,13 +11,29 @@ from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, NO_ASSERTION
 
 
+# POM header comment patterns, compiled once per process
+_HEADER_LICENSE_RE = re.compile(r'<!--.*?Licensed under the (.*?) License.*?-->', re.DOTALL | re.IGNORECASE)
+_HEADER_COPYRIGHT_RE = re.compile(
+    r'<!--.*?Copyright.*?(\d{4}).*?(?:by\s+)?(.*?)(?:\n|-->)', re.DOTALL | re.IGNORECASE
+)
+_ALL_RIGHTS_RESERVED_RE = re.compile(r'\s*All rights reserved\.?\s*', re.IGNORECASE)
+# Characters Maven accepts in groupId, artifactId and version coordinates
+_MAVEN_COORDINATE_RE = re.compile(r'[A-Za-z0-9_.+\-]+')
+
+
 class JavaExtractor(BaseExtractor):
     """Extractor for Java JAR and Maven packages."""
     
-    def __init__(self, registry_mode: bool = False):
-        """Initialize the Java extractor."""
+    def __init__(self, registry_mode: bool = False, cache_dir: Optional[str] = None):
+        """Initialize the Java extractor.
+
+        Args:
+            registry_mode: Whether to fetch parent POMs from Maven Central
+            cache_dir: Optional directory for caching fetched parent POMs
+        """
         super().__init__(registry_mode)
         self.maven_central_url = "https://repo1.maven.org/maven2"
+        self.cache_dir = Path(cache_dir) if cache_dir else None
     
     def extract(self, package_path: str) -> PackageMetadata:
         """Extract metadata from Java package."""
@@ -47,7 +64,6 @@ class JavaExtractor(BaseExtractor):
                 
                 # Extract copyright information
                 import tempfile
-                import os
                 with tempfile.TemporaryDirectory() as temp_dir:
                     try:
                         # Extract limited files for copyright scanning
@@ -292,6 +308,52 @@ class JavaExtractor(BaseExtractor):
         
         return metadata
     
+    def _load_parent_pom(self, group_id: str, artifact_id: str, version: str) -> Optional[bytes]:
+        """Load raw parent POM bytes from the cache or Maven Central.
+
+        Args:
+            group_id: Maven group ID
+            artifact_id: Maven artifact ID
+            version: Maven version
+
+        Returns:
+            POM file content or None if it could not be retrieved
+        """
+        # Coordinates come from the package itself; reject anything that could
+        # escape the cache directory or the Maven Central URL layout
+        for coordinate in (group_id, artifact_id, version):
+            if not _MAVEN_COORDINATE_RE.fullmatch(coordinate) or coordinate in ('.', '..'):
+                return None
+
+        # Snapshot POMs change under the same version, so they are never cached
+        cache_path = None
+        if self.cache_dir and not version.endswith('-SNAPSHOT'):
+            cache_root = self.cache_dir.resolve()
+            cache_path = (cache_root / group_id / artifact_id / f"{version}.pom").resolve()
+            if cache_root not in cache_path.parents:
+                return None
+            if cache_path.is_file():
+                return cache_path.read_bytes()
+
+        group_path = group_id.replace('.', '/')
+        pom_url = f"{self.maven_central_url}/{group_path}/{artifact_id}/{version}/{artifact_id}-{version}.pom"
+
+        response = requests.get(pom_url, timeout=10)
+        if response.status_code != 200:
+            return None
+
+        if cache_path:
+            try:
+                # Write then rename so an interrupted write never leaves a truncated POM
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(response.content)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Error caching parent POM: {e}")
+
+        return response.content
+
     def _fetch_parent_pom(self, group_id: str, artifact_id: str, version: str) -> Optional[Dict[str, Any]]:
         """Fetch parent POM from Maven Central.
         
@@ -304,15 +366,10 @@ class JavaExtractor(BaseExtractor):
             Dictionary with extracted parent metadata or None
         """
         try:
-            # Construct Maven Central URL
-            group_path = group_id.replace('.', '/')
-            pom_url = f"{self.maven_central_url}/{group_path}/{artifact_id}/{version}/{artifact_id}-{version}.pom"
-            
-            # Fetch POM
-            response = requests.get(pom_url, timeout=10)
-            if response.status_code == 200:
+            pom_content = self._load_parent_pom(group_id, artifact_id, version)
+            if pom_content is not None:
                 # Parse POM content
-                root = ET.fromstring(response.content)
+                root = ET.fromstring(pom_content)
                 ns = {'maven': 'http://maven.apache.org/POM/4.0.0'}
                 
                 parent_data = {}
@@ -431,7 +488,7 @@ class JavaExtractor(BaseExtractor):
                     parent_data['licenses'] = licenses
                 
                 # Also check for license/author info in header comments
-                header_data = self._parse_pom_header(response.text)
+                header_data = self._parse_pom_header(pom_content.decode('utf-8', errors='replace'))
                 if header_data:
                     if 'authors' in header_data and not parent_data.get('authors'):
                         parent_data['authors'] = header_data['authors']
@@ -470,19 +527,17 @@ class JavaExtractor(BaseExtractor):
             header_data = {}
             
             # Look for license in header comments (common in Apache projects)
-            license_pattern = r'<!--.*?Licensed under the (.*?) License.*?-->'
-            license_match = re.search(license_pattern, pom_content, re.DOTALL | re.IGNORECASE)
+            license_match = _HEADER_LICENSE_RE.search(pom_content)
             if license_match:
                 header_data['license'] = license_match.group(1).strip()
             
             # Look for copyright/author in comments
-            copyright_pattern = r'<!--.*?Copyright.*?(\d{4}).*?(?:by\s+)?(.*?)(?:\n|-->)'
-            copyright_match = re.search(copyright_pattern, pom_content, re.DOTALL | re.IGNORECASE)
+            copyright_match = _HEADER_COPYRIGHT_RE.search(pom_content)
             if copyright_match:
                 author = copyright_match.group(2).strip()
                 if author and not author.startswith('<!--'):
                     # Clean up common patterns
-                    author = re.sub(r'\s*All rights reserved\.?\s*', '', author, flags=re.IGNORECASE)
+                    author = _ALL_RIGHTS_RESERVED_RE.sub('', author)
                     author = author.strip()
                     if author:
                         header_data['authors'] = [{'name': author, 'email': None}]
@@ -1,9 +1,9 @@
 """NPM package extractor - REFACTORED."""
 
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict
 from .base import BaseExtractor
+from ..utils.json_utils import loads
 from ..core.models import (
     PackageMetadata,
     PackageType,
@@ -99,7 +99,7 @@ class NpmExtractor(BaseExtractor):
                 print("Warning: Empty package.json content, skipping")
                 return
 
-            data = json.loads(content)
+            data = loads(content)
 
             # Skip if data is empty or not a dict
             if not data or not isinstance(data, dict):
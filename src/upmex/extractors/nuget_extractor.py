@@ -40,38 +40,42 @@ class NuGetExtractor(BaseExtractor):
 
         try:
             with zipfile.ZipFile(package_path, 'r') as zip_file:
+                names = zip_file.namelist()
                 nuspec_file = None
                 license_files = []
                 
-                # Find .nuspec file and LICENSE files
-                for file_info in zip_file.namelist():
-                    if file_info.endswith('.nuspec'):
-                        nuspec_file = file_info
-                    elif 'LICENSE' in file_info.upper() or 'LICENCE' in file_info.upper():
-                        license_files.append(file_info)
+                # Find .nuspec file and LICENSE files by name only; no other
+                # entry is decompressed
+                for name in names:
+                    if name.endswith('.nuspec'):
+                        nuspec_file = name
+                    else:
+                        upper_name = name.upper()
+                        if 'LICENSE' in upper_name or 'LICENCE' in upper_name:
+                            license_files.append(name)
                 
                 if nuspec_file:
                     # Parse .nuspec XML file
                     nuspec_content = zip_file.read(nuspec_file)
                     self._parse_nuspec(nuspec_content, metadata)
                 
+                # A <license type="file"> element names the file to read first
+                declared_file = metadata.raw_metadata.get('license_file')
+                if declared_file:
+                    declared_file = declared_file.replace('\\', '/')
+                    if declared_file in names:
+                        license_files = [declared_file] + [f for f in license_files if f != declared_file]
+                
                 # Try to detect license from LICENSE files if not found in nuspec
                 if not metadata.licenses and license_files:
                     for license_file in license_files:
                         license_content = zip_file.read(license_file).decode('utf-8', errors='ignore')
-                        license_info = self.detect_licenses_from_text(
+                        license_infos = self.detect_licenses_from_text(
                             license_content,
                             filename=license_file
                         )
-                        if license_info:
-                            from ..core.models import LicenseInfo, LicenseConfidenceLevel
-                            metadata.licenses.append(LicenseInfo(
-                                spdx_id=license_info.spdx_id,
-                                confidence=license_info.confidence,
-                                confidence_level=LicenseConfidenceLevel(license_info.confidence_level),
-                                detection_method=license_info.detection_method,
-                                file_path=license_info.file_path
-                            ))
+                        if license_infos:
+                            metadata.licenses.extend(license_infos)
                             break
 
         except Exception as e:
@@ -100,16 +104,21 @@ class NuGetExtractor(BaseExtractor):
                 metadata_elem = root.find('metadata')
             
             if metadata_elem is not None:
+                # Index metadata children by local name once, so each field
+                # lookup is a dict hit whether or not the nuspec is namespaced
+                fields = {}
+                for child in metadata_elem:
+                    if isinstance(child.tag, str):
+                        fields.setdefault(child.tag.rpartition('}')[2], child)
+                
                 # Extract basic metadata
-                self._extract_text(metadata_elem, 'id', metadata, 'name', namespaces)
-                self._extract_text(metadata_elem, 'version', metadata, 'version', namespaces)
-                self._extract_text(metadata_elem, 'description', metadata, 'description', namespaces)
-                self._extract_text(metadata_elem, 'projectUrl', metadata, 'homepage', namespaces)
+                self._extract_text(fields, 'id', metadata, 'name')
+                self._extract_text(fields, 'version', metadata, 'version')
+                self._extract_text(fields, 'description', metadata, 'description')
+                self._extract_text(fields, 'projectUrl', metadata, 'homepage')
                 
                 # Extract repository information
-                repository_elem = metadata_elem.find(f'{ns_prefix}repository', namespaces)
-                if repository_elem is None:
-                    repository_elem = metadata_elem.find('repository')
+                repository_elem = fields.get('repository')
                 
                 if repository_elem is not None:
                     repo_url = repository_elem.get('url')
@@ -118,10 +127,10 @@ class NuGetExtractor(BaseExtractor):
                 
                 # If no repository element, try repositoryUrl
                 if metadata.repository == NO_ASSERTION:
-                    self._extract_text(metadata_elem, 'repositoryUrl', metadata, 'repository', namespaces)
+                    self._extract_text(fields, 'repositoryUrl', metadata, 'repository')
                 
                 # Extract authors
-                authors_text = self._get_text(metadata_elem, 'authors', namespaces)
+                authors_text = self._get_text(fields, 'authors')
                 if authors_text:
                     # Authors are comma-separated
                     authors = [a.strip() for a in authors_text.split(',')]
@@ -133,7 +142,7 @@ class NuGetExtractor(BaseExtractor):
                             })
                 
                 # Extract owners (similar to maintainers)
-                owners_text = self._get_text(metadata_elem, 'owners', namespaces)
+                owners_text = self._get_text(fields, 'owners')
                 if owners_text:
                     owners = [o.strip() for o in owners_text.split(',')]
                     for owner in owners:
@@ -144,15 +153,13 @@ class NuGetExtractor(BaseExtractor):
                             })
                 
                 # Extract tags (keywords)
-                tags_text = self._get_text(metadata_elem, 'tags', namespaces)
+                tags_text = self._get_text(fields, 'tags')
                 if tags_text:
                     metadata.keywords = [t.strip() for t in tags_text.split() if t.strip()]
                 
                 # Extract license information
                 # Modern NuGet uses license element
-                license_elem = metadata_elem.find(f'{ns_prefix}license', namespaces)
-                if license_elem is None:
-                    license_elem = metadata_elem.find('license')
+                license_elem = fields.get('license')
                 
                 if license_elem is not None:
                     license_type = license_elem.get('type', 'expression')
@@ -179,7 +186,7 @@ class NuGetExtractor(BaseExtractor):
                 
                 # Fallback to licenseUrl for older packages
                 if not metadata.licenses:
-                    license_url = self._get_text(metadata_elem, 'licenseUrl', namespaces)
+                    license_url = self._get_text(fields, 'licenseUrl')
                     if license_url:
                         # Try to detect license from URL
                         if 'opensource.org/licenses/' in license_url.lower():
@@ -208,17 +215,13 @@ class NuGetExtractor(BaseExtractor):
                         metadata.raw_metadata['license_url'] = license_url
                 
                 # Extract dependencies
-                dependencies_elem = metadata_elem.find(f'{ns_prefix}dependencies', namespaces)
-                if dependencies_elem is None:
-                    dependencies_elem = metadata_elem.find('dependencies')
+                dependencies_elem = fields.get('dependencies')
                 
                 if dependencies_elem is not None:
                     self._parse_dependencies(dependencies_elem, metadata, namespaces)
                 
                 # Extract framework assemblies
-                framework_assemblies = metadata_elem.find(f'{ns_prefix}frameworkAssemblies', namespaces)
-                if framework_assemblies is None:
-                    framework_assemblies = metadata_elem.find('frameworkAssemblies')
+                framework_assemblies = fields.get('frameworkAssemblies')
                 
                 if framework_assemblies is not None:
                     for assembly in framework_assemblies:
@@ -228,28 +231,28 @@ class NuGetExtractor(BaseExtractor):
                             metadata.dependencies['runtime'].append(f"{assembly_name} (framework: {target_framework})")
                 
                 # Extract minimum client version
-                min_client = self._get_text(metadata_elem, 'minClientVersion', namespaces)
+                min_client = self._get_text(fields, 'minClientVersion')
                 if min_client:
                     metadata.classifiers.append(f"NuGet Client :: >= {min_client}")
                 
                 # Extract release notes
-                release_notes = self._get_text(metadata_elem, 'releaseNotes', namespaces)
+                release_notes = self._get_text(fields, 'releaseNotes')
                 if release_notes:
                     metadata.raw_metadata['release_notes'] = release_notes
                 
                 # Extract icon URL
-                icon_url = self._get_text(metadata_elem, 'iconUrl', namespaces)
+                icon_url = self._get_text(fields, 'iconUrl')
                 if icon_url:
                     metadata.raw_metadata['icon_url'] = icon_url
                 
                 # Extract copyright
-                copyright_text = self._get_text(metadata_elem, 'copyright', namespaces)
+                copyright_text = self._get_text(fields, 'copyright')
                 if copyright_text:
                     metadata.copyright = copyright_text
                     metadata.raw_metadata['copyright'] = copyright_text
                 
                 # Require license acceptance
-                require_license = self._get_text(metadata_elem, 'requireLicenseAcceptance', namespaces)
+                require_license = self._get_text(fields, 'requireLicenseAcceptance')
                 if require_license and require_license.lower() == 'true':
                     metadata.raw_metadata['require_license_acceptance'] = True
                 
@@ -319,36 +322,30 @@ class NuGetExtractor(BaseExtractor):
                     else:
                         metadata.dependencies['runtime'].append(dep_str)
 
-    def _extract_text(self, parent, tag: str, metadata: PackageMetadata, attr: str, namespaces: dict) -> None:
+    def _extract_text(self, fields: Dict[str, Any], tag: str, metadata: PackageMetadata, attr: str) -> None:
         """Extract text from XML element and set metadata attribute.
         
         Args:
-            parent: Parent XML element
+            fields: Metadata child elements keyed by local tag name
             tag: Tag name to find
             metadata: PackageMetadata object
             attr: Attribute name to set
-            namespaces: XML namespaces
         """
-        text = self._get_text(parent, tag, namespaces)
+        text = self._get_text(fields, tag)
         if text:
             setattr(metadata, attr, text)
 
-    def _get_text(self, parent, tag: str, namespaces: dict) -> Optional[str]:
+    def _get_text(self, fields: Dict[str, Any], tag: str) -> Optional[str]:
         """Get text content from XML element.
         
         Args:
-            parent: Parent XML element
+            fields: Metadata child elements keyed by local tag name
             tag: Tag name to find
-            namespaces: XML namespaces
             
         Returns:
             Text content or None
         """
-        ns_prefix = 'ns:' if namespaces else ''
-        elem = parent.find(f'{ns_prefix}{tag}', namespaces)
-        if elem is None:
-            elem = parent.find(tag)
-        
+        elem = fields.get(tag)
         if elem is not None and elem.text:
             return elem.text.strip()
         return None
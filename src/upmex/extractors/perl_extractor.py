@@ -11,6 +11,34 @@ from pathlib import Path
 from .base import BaseExtractor
 from ..core.models import PackageMetadata, PackageType, LicenseInfo, NO_ASSERTION, LicenseConfidenceLevel
 
+# CPAN::Meta license strings mapped to SPDX identifiers
+_PERL_LICENSE_MAP = {
+    'perl_5': 'Artistic-1.0 OR GPL-1.0-or-later',
+    'perl': 'Artistic-1.0 OR GPL-1.0-or-later',
+    'artistic_1': 'Artistic-1.0',
+    'artistic_2': 'Artistic-2.0',
+    'apache_2_0': 'Apache-2.0',
+    'apache': 'Apache-2.0',
+    'bsd': 'BSD-3-Clause',
+    'freebsd': 'BSD-2-Clause-FreeBSD',
+    'gpl_1': 'GPL-1.0',
+    'gpl_2': 'GPL-2.0',
+    'gpl_3': 'GPL-3.0',
+    'lgpl_2_1': 'LGPL-2.1',
+    'lgpl_3_0': 'LGPL-3.0',
+    'mit': 'MIT',
+    'mozilla_1_1': 'MPL-1.1',
+    'mozilla_2_0': 'MPL-2.0',
+    'open_source': 'OSI-Approved',
+    'unrestricted': 'Unlicense',
+    'unknown': None,
+    'restricted': 'Proprietary'
+}
+
+# License file names: any name with one of these prefixes, or an exact name
+_LICENSE_FILE_PREFIXES = ('LICENSE', 'LICENCE', 'COPYING')
+_LICENSE_FILE_NAMES = {'COPYRIGHT': 3, 'ARTISTIC': 4, 'GPL': 5}
+
 
 class PerlExtractor(BaseExtractor):
     """Extractor for Perl/CPAN packages."""
@@ -309,30 +337,7 @@ class PerlExtractor(BaseExtractor):
         Returns:
             SPDX license identifier or None
         """
-        license_mapping = {
-            'perl_5': 'Artistic-1.0 OR GPL-1.0-or-later',
-            'perl': 'Artistic-1.0 OR GPL-1.0-or-later',
-            'artistic_1': 'Artistic-1.0',
-            'artistic_2': 'Artistic-2.0',
-            'apache_2_0': 'Apache-2.0',
-            'apache': 'Apache-2.0',
-            'bsd': 'BSD-3-Clause',
-            'freebsd': 'BSD-2-Clause-FreeBSD',
-            'gpl_1': 'GPL-1.0',
-            'gpl_2': 'GPL-2.0',
-            'gpl_3': 'GPL-3.0',
-            'lgpl_2_1': 'LGPL-2.1',
-            'lgpl_3_0': 'LGPL-3.0',
-            'mit': 'MIT',
-            'mozilla_1_1': 'MPL-1.1',
-            'mozilla_2_0': 'MPL-2.0',
-            'open_source': 'OSI-Approved',
-            'unrestricted': 'Unlicense',
-            'unknown': None,
-            'restricted': 'Proprietary'
-        }
-        
-        return license_mapping.get(perl_license.lower(), perl_license)
+        return _PERL_LICENSE_MAP.get(perl_license.lower(), perl_license)
     
     def _extract_dependencies(self, prereqs: Dict[str, Any]) -> List[Dict[str, str]]:
         """Extract dependencies from prereqs section.
@@ -384,29 +389,22 @@ class PerlExtractor(BaseExtractor):
         Returns:
             List of paths to license files
         """
-        license_files = []
-        license_patterns = [
-            'LICENSE', 'LICENSE.*', 'LICENCE', 'LICENCE.*',
-            'COPYING', 'COPYING.*', 'COPYRIGHT',
-            'ARTISTIC', 'GPL'
-        ]
-        
-        for pattern in license_patterns:
-            # Check exact match
-            if '.' not in pattern:
-                file_path = os.path.join(package_dir, pattern)
-                if os.path.exists(file_path) and os.path.isfile(file_path):
-                    license_files.append(file_path)
-            else:
-                # Check pattern match
-                base_pattern = pattern.replace('.*', '')
-                for file_name in os.listdir(package_dir):
-                    if file_name.startswith(base_pattern):
-                        file_path = os.path.join(package_dir, file_name)
-                        if os.path.isfile(file_path):
-                            license_files.append(file_path)
-        
-        return license_files
+        # One directory scan; LICENSE* files come first, then LICENCE*, and so on
+        matches = []
+        with os.scandir(package_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in _LICENSE_FILE_NAMES:
+                    rank = _LICENSE_FILE_NAMES[name]
+                elif name.startswith(_LICENSE_FILE_PREFIXES):
+                    rank = next(i for i, prefix in enumerate(_LICENSE_FILE_PREFIXES)
+                                if name.startswith(prefix))
+                else:
+                    continue
+                if entry.is_file():
+                    matches.append((rank, name, entry.path))
+        
+        return [path for _, _, path in sorted(matches)]
 
     def can_extract(self, package_path: str) -> bool:
         """Check if this extractor can handle the package.
@@ -12,12 +12,16 @@ import re
 
 from .base import BaseExtractor
 from ..core.models import NO_ASSERTION, PackageMetadata, PackageType
+from ..utils.yaml_utils import SAFE_LOADER
 
 logger = logging.getLogger(__name__)
 
+# Members every gem archive carries
+_GEM_MEMBERS = frozenset({'metadata.gz', 'data.tar.gz'})
+
 
 # Custom YAML loader that ignores Ruby-specific tags
-class RubyYAMLLoader(yaml.SafeLoader):
+class RubyYAMLLoader(SAFE_LOADER):
     """Custom YAML loader for Ruby gem metadata."""
     pass
 
@@ -64,20 +68,22 @@ class RubyExtractor(BaseExtractor):
         try:
             # Open the gem file (tar archive)
             with tarfile.open(package_path, 'r') as gem_tar:
-                # Extract metadata.gz
-                metadata_member = None
+                # Index members by name once; the first entry wins on duplicates
+                members = {}
                 for member in gem_tar.getmembers():
-                    if member.name == 'metadata.gz':
-                        metadata_member = member
-                        break
+                    members.setdefault(member.name, member)
+                
+                # Extract metadata.gz
+                metadata_member = members.get('metadata.gz')
                 
                 if metadata_member:
                     # Extract and decompress metadata
                     metadata_file = gem_tar.extractfile(metadata_member)
                     if metadata_file:
-                        metadata_content = gzip.decompress(metadata_file.read())
-                        # Ruby gems use custom YAML tags, use our custom loader
-                        gemspec = yaml.load(metadata_content.decode('utf-8'), Loader=RubyYAMLLoader)
+                        # Decompress while parsing; Ruby gems use custom YAML
+                        # tags, use our custom loader
+                        with gzip.GzipFile(fileobj=metadata_file) as gz:
+                            gemspec = yaml.load(gz, Loader=RubyYAMLLoader)
                         
                         # Extract basic metadata
                         if gemspec.get('name'):
@@ -216,30 +222,25 @@ class RubyExtractor(BaseExtractor):
                 
                 # Try to detect license from LICENSE file in data.tar.gz
                 if not metadata.licenses:
-                    data_member = None
-                    for member in gem_tar.getmembers():
-                        if member.name == 'data.tar.gz':
-                            data_member = member
-                            break
-                    
+                    data_member = members.get('data.tar.gz')
                     if data_member:
                         data_file = gem_tar.extractfile(data_member)
                         if data_file:
-                            # Open the nested tar.gz
-                            with gzip.open(data_file, 'rb') as gz:
-                                with tarfile.open(fileobj=gz, mode='r') as data_tar:
-                                    for member in data_tar.getmembers():
-                                        if member.isfile() and 'LICENSE' in member.name.upper():
-                                            license_file = data_tar.extractfile(member)
-                                            if license_file:
-                                                license_content = license_file.read().decode('utf-8', errors='ignore')
-                                                license_infos = self.detect_licenses_from_text(
-                                                    license_content,
-                                                    filename=member.name
-                                                )
-                                                if license_infos:
-                                                    metadata.licenses.extend(license_infos)
-                                                break
+                            # Stream the nested tar.gz so decompression stops at
+                            # the first LICENSE file instead of indexing the payload
+                            with tarfile.open(fileobj=data_file, mode='r|gz') as data_tar:
+                                for member in data_tar:
+                                    if member.isfile() and 'LICENSE' in member.name.upper():
+                                        license_file = data_tar.extractfile(member)
+                                        if license_file:
+                                            license_content = license_file.read().decode('utf-8', errors='ignore')
+                                            license_infos = self.detect_licenses_from_text(
+                                                license_content,
+                                                filename=member.name
+                                            )
+                                            if license_infos:
+                                                metadata.licenses.extend(license_infos)
+                                            break
 
         except Exception as e:
             logger.error(f"Error extracting Ruby gem metadata: {e}")
@@ -283,9 +284,8 @@ class RubyExtractor(BaseExtractor):
         if path.suffix in ['.tar', '.gz']:
             try:
                 with tarfile.open(package_path, 'r') as tar:
-                    members = tar.getnames()
                     # Ruby gems contain metadata.gz, data.tar.gz, and checksums.yaml.gz
-                    if 'metadata.gz' in members and 'data.tar.gz' in members:
+                    if _GEM_MEMBERS.issubset(tar.getnames()):
                         return True
             except:
                 pass
@@ -301,9 +301,8 @@ class RubyExtractor(BaseExtractor):
         if package_path.suffix in ['.tar', '.gz']:
             try:
                 with tarfile.open(str(package_path), 'r') as tar:
-                    members = tar.getnames()
                     # Ruby gems contain metadata.gz, data.tar.gz, and checksums.yaml.gz
-                    if 'metadata.gz' in members and 'data.tar.gz' in members:
+                    if _GEM_MEMBERS.issubset(tar.getnames()):
                         return 'ruby_gem'
             except:
                 pass
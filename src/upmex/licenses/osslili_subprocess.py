@@ -27,11 +27,25 @@ class OssliliSubprocessDetector:
         Returns:
             List of detected licenses with confidence scores
         """
-        licenses = []
-        
         if content is None:
-            return licenses
+            return []
+        
+        return self.scan_content(file_path, content) or []
+    
+    def scan_content(self, file_path: str, content: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run the osslili CLI on content written to a temporary file.
+        
+        Args:
+            file_path: Path to the file (used for naming and the file suffix)
+            content: File content to analyze
             
+        Returns:
+            Detected licenses (possibly empty), or None if osslili could not
+            be run or failed, so callers can tell a failure from no match
+        """
+        licenses = []
+        
         try:
             # Write content to temporary file for osslili to process
             # Use .txt suffix if file has no extension (e.g., LICENSE files)
@@ -49,7 +63,11 @@ class OssliliSubprocessDetector:
                     timeout=10
                 )
                 
-                if result.returncode == 0 and result.stdout:
+                if result.returncode != 0:
+                    logger.debug(f"Osslili exited with status {result.returncode} for {file_path}")
+                    return None
+                
+                if result.stdout:
                     # Parse JSON output - skip non-JSON header lines
                     stdout_lines = result.stdout.splitlines()
                     json_start = -1
@@ -118,6 +136,7 @@ class OssliliSubprocessDetector:
                 
         except Exception as e:
             logger.debug(f"Osslili subprocess detection failed for {file_path}: {e}")
+            return None
             
         return licenses
     
@@ -2,8 +2,6 @@
 Unified license detector that uses OSSlili for all license detection.
 """
 
-import os
-import tempfile
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 import logging
@@ -113,23 +111,15 @@ class UnifiedLicenseDetector:
         Returns:
             License info if detected
         """
-        # Create a temporary file with the metadata content to let OSLiLi handle it
         if 'license' in metadata:
             license_value = metadata['license']
             if isinstance(license_value, str) and license_value:
                 # Create a simple package.json-like content for OSSlili to parse
                 content = f'{{"license": "{license_value}"}}'
                 try:
-                    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp:
-                        tmp.write(content)
-                        tmp_path = tmp.name
-
-                    try:
-                        licenses = self.osslili_detector.detect_from_file(file_path, content)
-                        if licenses:
-                            return licenses[0]  # Return first detected license
-                    finally:
-                        os.unlink(tmp_path)
+                    licenses = self.osslili_detector.detect_from_file(file_path, content)
+                    if licenses:
+                        return licenses[0]  # Return first detected license
                 except Exception as e:
                     logger.debug(f"Metadata detection via OSSlili failed: {e}")
 
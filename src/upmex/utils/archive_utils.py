@@ -1,13 +1,34 @@
 """Archive extraction utilities."""
 
+import re
 import tarfile
 import zipfile
 import tempfile
 import os
-from typing import Dict, List, Optional, Callable
+from functools import lru_cache
+from typing import Dict, List, Optional, Callable, Tuple
 from pathlib import Path
 
 
+@lru_cache(maxsize=32)
+def _substring_matcher(patterns: Tuple[str, ...]) -> Callable[[str], Optional[re.Match]]:
+    """Compile filename patterns into one search that matches any of them.
+    
+    Patterns that contain another pattern can never add a match, so they are
+    dropped before the alternation is built.
+    
+    Args:
+        patterns: Substrings to look for in member names (must be non-empty)
+        
+    Returns:
+        Bound search function; truthy when the name contains any pattern
+    """
+    needed = [p for p in patterns if not any(q != p and q in p for q in patterns)]
+    # Longest first so the alternation never stops on a shorter prefix
+    needed.sort(key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, dict.fromkeys(needed)))).search
+
+
 def extract_from_tar(archive_path: str, 
                     target_patterns: Optional[List[str]] = None,
                     callback: Optional[Callable] = None) -> Dict[str, bytes]:
@@ -25,12 +46,12 @@ def extract_from_tar(archive_path: str,
     
     try:
         with tarfile.open(archive_path, 'r:*') as tar:
+            matches = _substring_matcher(tuple(target_patterns)) if target_patterns else None
             for member in tar.getmembers():
                 if member.isfile():
                     # Check if we should extract this file
-                    if target_patterns:
-                        if not any(pattern in member.name for pattern in target_patterns):
-                            continue
+                    if matches and not matches(member.name):
+                        continue
                     
                     # Extract file content
                     try:
@@ -67,11 +88,11 @@ def extract_from_zip(archive_path: str,
     
     try:
         with zipfile.ZipFile(archive_path, 'r') as zip_file:
+            matches = _substring_matcher(tuple(target_patterns)) if target_patterns else None
             for name in zip_file.namelist():
                 # Check if we should extract this file
-                if target_patterns:
-                    if not any(pattern in name for pattern in target_patterns):
-                        continue
+                if matches and not matches(name):
+                    continue
                 
                 # Extract file content
                 try:
@@ -139,30 +160,31 @@ def find_file_in_archive(archive_path: str,
         Dictionary of filename to content, or None if not found
     """
     results = {}
+    if not filename_patterns:
+        return None
     
     # Determine archive type
     is_tar = archive_path.endswith(('.tar', '.tar.gz', '.tar.bz2', '.tgz', '.tar.xz'))
+    # One search per member name instead of a loop over every pattern
+    matches = _substring_matcher(tuple(filename_patterns))
     
     try:
         if is_tar:
             with tarfile.open(archive_path, 'r:*') as tar:
                 for member in tar.getmembers():
-                    if member.isfile():
-                        for pattern in filename_patterns:
-                            if pattern in member.name or member.name.endswith(pattern):
-                                file_obj = tar.extractfile(member)
-                                if file_obj:
-                                    results[member.name] = file_obj.read()
-                                    if return_first:
-                                        return results
+                    if member.isfile() and matches(member.name):
+                        file_obj = tar.extractfile(member)
+                        if file_obj:
+                            results[member.name] = file_obj.read()
+                            if return_first:
+                                return results
         else:
             with zipfile.ZipFile(archive_path, 'r') as zip_file:
                 for name in zip_file.namelist():
-                    for pattern in filename_patterns:
-                        if pattern in name or name.endswith(pattern):
-                            results[name] = zip_file.read(name)
-                            if return_first:
-                                return results
+                    if matches(name):
+                        results[name] = zip_file.read(name)
+                        if return_first:
+                            return results
     except:
         return None
     
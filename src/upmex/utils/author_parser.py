@@ -3,6 +3,10 @@
 import re
 from typing import Dict, List, Optional, Union
 
+# "Name <email>" and "Name (email)" author formats
+_ANGLE_EMAIL_RE = re.compile(r'<([^>]+@[^>]+)>')
+_PAREN_EMAIL_RE = re.compile(r'\(([^)]+@[^)]+)\)')
+
 
 def parse_author_string(author: Union[str, Dict]) -> Optional[Dict[str, str]]:
     """Parse author string into structured format.
@@ -39,7 +43,7 @@ def parse_author_string(author: Union[str, Dict]) -> Optional[Dict[str, str]]:
     author_dict = {}
     
     # Try to parse "Name <email>" format
-    email_match = re.search(r'<([^>]+@[^>]+)>', author_str)
+    email_match = _ANGLE_EMAIL_RE.search(author_str)
     if email_match:
         email = email_match.group(1).strip()
         name = author_str[:author_str.index('<')].strip()
@@ -51,7 +55,7 @@ def parse_author_string(author: Union[str, Dict]) -> Optional[Dict[str, str]]:
     
     # Try to parse "Name (email)" format
     elif '(' in author_str and ')' in author_str:
-        email_match = re.search(r'\(([^)]+@[^)]+)\)', author_str)
+        email_match = _PAREN_EMAIL_RE.search(author_str)
         if email_match:
             email = email_match.group(1).strip()
             name = author_str[:author_str.index('(')].strip()
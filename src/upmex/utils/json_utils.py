@@ -0,0 +1,50 @@
+"""JSON helpers; parsing uses orjson when it is installed."""
+
+import json
+from typing import Any, Union
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when available.
+
+    orjson rejects a byte order mark and the non-UTF-8 encodings that
+    json.loads detects on bytes, so those inputs fall back to json.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize an object to a JSON string.
+
+    Output always comes from json.dumps, so it is the same whether or not
+    orjson is installed. orjson cannot reproduce its separators, ASCII
+    escaping, NaN handling or float formatting.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to indent nested values by two spaces
+        sort_keys: Whether to sort dictionary keys
+
+    Returns:
+        JSON string
+    """
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
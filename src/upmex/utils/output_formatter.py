@@ -1,8 +1,8 @@
 """Output formatting utilities for various formats."""
 
-import json
 from typing import Any, Dict
 from ..core.models import PackageMetadata
+from .json_utils import dumps
 
 
 class OutputFormatter:
@@ -44,9 +44,7 @@ class OutputFormatter:
             Formatted string
         """
         if format == 'json':
-            if self.pretty:
-                return json.dumps(data, indent=2, sort_keys=True)
-            return json.dumps(data)
+            return dumps(data, indent=self.pretty, sort_keys=self.pretty)
         else:
             return str(data)
     
@@ -59,10 +57,7 @@ class OutputFormatter:
         Returns:
             JSON string
         """
-        data = metadata.to_dict()
-        if self.pretty:
-            return json.dumps(data, indent=2, sort_keys=True)
-        return json.dumps(data)
+        return dumps(metadata.to_dict(), indent=self.pretty, sort_keys=self.pretty)
     
     def to_text(self, metadata: PackageMetadata) -> str:
         """Convert metadata to human-readable text.
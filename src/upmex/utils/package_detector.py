@@ -6,6 +6,40 @@ from pathlib import Path
 from typing import Optional
 from ..core.models import PackageType
 
+# Exact file names that identify a package type
+_NAME_TYPES = {
+    'build.gradle': PackageType.GRADLE,
+    'build.gradle.kts': PackageType.GRADLE,
+    'settings.gradle': PackageType.GRADLE,
+    'settings.gradle.kts': PackageType.GRADLE,
+    'conanfile.py': PackageType.CONAN,
+    'conanfile.txt': PackageType.CONAN,
+    'go.mod': PackageType.GO_MODULE,
+}
+
+# File extensions that identify a package type without inspecting contents
+_SUFFIX_TYPES = {
+    '.podspec': PackageType.COCOAPODS,
+    '.conda': PackageType.CONDA,
+    '.whl': PackageType.PYTHON_WHEEL,
+    '.gem': PackageType.RUBY_GEM,
+    '.crate': PackageType.RUST_CRATE,
+    '.mod': PackageType.GO_MODULE,
+    '.nupkg': PackageType.NUGET,
+    '.rpm': PackageType.RPM,
+    '.deb': PackageType.DEB,
+}
+
+# Leading bytes of the archive formats we inspect; a POSIX tar carries its
+# magic at offset 257 of the first 512-byte header block
+_ZIP_MAGIC = b'PK\x03\x04'
+_GZIP_MAGIC = b'\x1f\x8b'
+_BZIP2_MAGIC = b'BZh'
+_TAR_MAGIC = b'ustar'
+_TAR_MAGIC_OFFSET = 257
+
+_CONAN_MARKERS = ('conanfile.py', 'conanfile.txt', 'conaninfo.txt', 'conanmanifest.txt')
+
 
 def detect_package_type(package_path: str) -> PackageType:
     """Detect the type of a package file.
@@ -18,52 +52,23 @@ def detect_package_type(package_path: str) -> PackageType:
     """
     path = Path(package_path)
     
-    # Check for Gradle build files
-    if path.name in ['build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts']:
-        return PackageType.GRADLE
+    # Files identified purely by name or extension need no archive inspection
+    package_type = _NAME_TYPES.get(path.name) or _SUFFIX_TYPES.get(path.suffix)
+    if package_type:
+        return package_type
     
-    # Check for CocoaPods podspec files
-    if path.suffix == '.podspec' or path.name.endswith('.podspec.json'):
+    # Check for CocoaPods JSON podspec files
+    if path.name.endswith('.podspec.json'):
         return PackageType.COCOAPODS
     
-    # Check for Conan files
-    if path.name in ['conanfile.py', 'conanfile.txt']:
-        return PackageType.CONAN
-    
-    # Check for Conda packages
-    if path.suffix == '.conda':
-        return PackageType.CONDA
-    
-    # Check by extension first
-    if path.suffix == '.whl':
-        return PackageType.PYTHON_WHEEL
-    
-    if path.suffix == '.gem':
-        return PackageType.RUBY_GEM
-    
-    if path.suffix == '.crate':
-        return PackageType.RUST_CRATE
-    
-    if path.suffix == '.mod' or path.name == 'go.mod':
-        return PackageType.GO_MODULE
-    
-    if path.suffix == '.nupkg':
-        return PackageType.NUGET
-    
-    if path.suffix == '.rpm':
-        return PackageType.RPM
-    
-    if path.suffix == '.deb':
-        return PackageType.DEB
-    
     if path.suffix in ['.jar', '.war', '.ear']:
         # Check if it's a Maven package
-        if _is_maven_package(package_path):
+        if _sniff_archive(package_path) == 'zip' and _is_maven_package(package_path):
             return PackageType.MAVEN
         return PackageType.JAR
     
     # Check for archive formats
-    if path.name.endswith('.zip'):
+    if path.name.endswith('.zip') and _sniff_archive(package_path) == 'zip':
         # Check for Go module (zip with go.mod)
         if _is_go_module(package_path):
             return PackageType.GO_MODULE
@@ -73,41 +78,47 @@ def detect_package_type(package_path: str) -> PackageType:
     
     # Check for Python sdist or Conda packages
     if path.name.endswith(('.tar.gz', '.tgz', '.tar.bz2')):
-        # Check for Conda package (.tar.bz2 with info/index.json)
-        if path.name.endswith('.tar.bz2') and _is_conda_package(package_path):
-            return PackageType.CONDA
-        
-        # Check for Rust crate (tar.gz with Cargo.toml)
-        if _is_rust_crate(package_path):
-            return PackageType.RUST_CRATE
-        
-        # Check for Ruby gem (can be .tar format)
-        if _is_ruby_gem(package_path):
-            return PackageType.RUBY_GEM
-        
-        # Check for Perl package (tar.gz with META.json or META.yml)
-        if _is_perl_package(package_path):
-            return PackageType.PERL
-        
-        # Check for Conan package (tar.gz with conanfile.py or conaninfo.txt)
-        if _is_conan_package(package_path):
-            return PackageType.CONAN
-        
-        if _is_python_sdist(package_path):
-            return PackageType.PYTHON_SDIST
-        
-        # Check for NPM package
-        if _is_npm_package(package_path):
-            return PackageType.NPM
-    
-    # Check for .tgz which is commonly NPM
-    if path.suffix == '.tgz':
-        if _is_npm_package(package_path):
-            return PackageType.NPM
+        archive_format = _sniff_archive(package_path)
+        if archive_format in ('gzip', 'bz2', 'tar'):
+            package_type = _classify_tarball(
+                package_path,
+                conda=archive_format == 'bz2' and path.name.endswith('.tar.bz2'),
+                rust=archive_format == 'gzip',
+            )
+            if package_type:
+                return package_type
     
     return PackageType.UNKNOWN
 
 
+def _sniff_archive(archive_path: str) -> Optional[str]:
+    """Identify an archive container from its first header block.
+
+    Only the leading 512 bytes are read, so files that are not archives are
+    rejected without opening (and, for tarballs, decompressing) them.
+
+    Args:
+        archive_path: Path to the candidate archive
+
+    Returns:
+        'zip', 'gzip', 'bz2' or 'tar', or None if no known magic matches
+    """
+    try:
+        with open(archive_path, 'rb') as f:
+            head = f.read(512)
+    except OSError:
+        return None
+    if head.startswith(_ZIP_MAGIC):
+        return 'zip'
+    if head.startswith(_GZIP_MAGIC):
+        return 'gzip'
+    if head.startswith(_BZIP2_MAGIC):
+        return 'bz2'
+    if head[_TAR_MAGIC_OFFSET:_TAR_MAGIC_OFFSET + len(_TAR_MAGIC)] == _TAR_MAGIC:
+        return 'tar'
+    return None
+
+
 def _is_maven_package(jar_path: str) -> bool:
     """Check if a JAR file is a Maven package."""
     try:
@@ -121,58 +132,11 @@ def _is_maven_package(jar_path: str) -> bool:
 
 
 def _is_python_sdist(archive_path: str) -> bool:
-    """Check if an archive is a Python source distribution."""
+    """Check if a zip archive is a Python source distribution."""
     try:
-        if archive_path.endswith('.zip'):
-            with zipfile.ZipFile(archive_path, 'r') as zf:
-                for name in zf.namelist():
-                    if 'PKG-INFO' in name or 'setup.py' in name or 'pyproject.toml' in name:
-                        return True
-        else:
-            with tarfile.open(archive_path, 'r:*') as tf:
-                for member in tf.getmembers():
-                    if 'PKG-INFO' in member.name or 'setup.py' in member.name or 'pyproject.toml' in member.name:
-                        return True
-    except:
-        pass
-    return False
-
-
-def _is_npm_package(archive_path: str) -> bool:
-    """Check if an archive is an NPM package."""
-    try:
-        with tarfile.open(archive_path, 'r:*') as tf:
-            for member in tf.getmembers():
-                if member.name.endswith('package.json'):
-                    # Read and check if it looks like NPM package.json
-                    content = tf.extractfile(member).read()
-                    if b'"name"' in content or b'"version"' in content:
-                        return True
-    except:
-        pass
-    return False
-
-
-def _is_ruby_gem(archive_path: str) -> bool:
-    """Check if an archive is a Ruby gem."""
-    try:
-        with tarfile.open(archive_path, 'r:*') as tf:
-            members = tf.getnames()
-            # Ruby gems contain metadata.gz and data.tar.gz
-            if 'metadata.gz' in members and 'data.tar.gz' in members:
-                return True
-    except:
-        pass
-    return False
-
-
-def _is_rust_crate(archive_path: str) -> bool:
-    """Check if an archive is a Rust crate."""
-    try:
-        with tarfile.open(archive_path, 'r:gz') as tf:
-            for member in tf.getmembers():
-                # Rust crates contain Cargo.toml
-                if 'Cargo.toml' in member.name:
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            for name in zf.namelist():
+                if _is_sdist_member(name):
                     return True
     except:
         pass
@@ -181,7 +145,6 @@ def _is_rust_crate(archive_path: str) -> bool:
 
 def _is_go_module(archive_path: str) -> bool:
     """Check if an archive is a Go module."""
-    import zipfile
     try:
         with zipfile.ZipFile(archive_path, 'r') as zf:
             for name in zf.namelist():
@@ -193,43 +156,58 @@ def _is_go_module(archive_path: str) -> bool:
     return False
 
 
-def _is_conda_package(archive_path: str) -> bool:
-    """Check if a .tar.bz2 file is a Conda package."""
-    try:
-        with tarfile.open(archive_path, 'r:bz2') as tar:
-            # Conda packages contain info/index.json
-            for member in tar.getmembers():
-                if member.name == 'info/index.json':
-                    return True
-    except:
-        pass
-    return False
+def _is_sdist_member(name: str) -> bool:
+    """Check if an archive member marks a Python source distribution."""
+    return 'PKG-INFO' in name or 'setup.py' in name or 'pyproject.toml' in name
 
 
-def _is_perl_package(archive_path: str) -> bool:
-    """Check if an archive is a Perl/CPAN package."""
-    try:
-        with tarfile.open(archive_path, 'r:*') as tf:
-            for member in tf.getmembers():
-                # Perl packages contain META.json or META.yml
-                if 'META.json' in member.name or 'META.yml' in member.name:
-                    return True
-                # Also check for MYMETA files
-                if 'MYMETA.json' in member.name or 'MYMETA.yml' in member.name:
-                    return True
-    except:
-        pass
-    return False
+def _classify_tarball(archive_path: str, conda: bool, rust: bool) -> Optional[PackageType]:
+    """Classify a tarball from a single streamed pass over its members.
 
+    Members are read in archive order without seeking, so the archive is
+    decompressed at most once.  Conda and Rust markers take precedence over
+    every other type and end the pass as soon as they are seen; the remaining
+    types are decided from the names collected, in order of priority.
+
+    Args:
+        archive_path: Path to the tarball
+        conda: Whether a Conda info/index.json can identify the archive
+        rust: Whether a Cargo.toml can identify the archive
 
-def _is_conan_package(archive_path: str) -> bool:
-    """Check if an archive is a Conan C/C++ package."""
+    Returns:
+        Detected PackageType, or None if no marker is found
+    """
+    names = set()
+    has_npm_manifest = False
     try:
-        with tarfile.open(archive_path, 'r:*') as tf:
-            for member in tf.getmembers():
-                # Conan packages contain conanfile.py, conanfile.txt, or conaninfo.txt
-                if any(name in member.name for name in ['conanfile.py', 'conanfile.txt', 'conaninfo.txt', 'conanmanifest.txt']):
-                    return True
+        with tarfile.open(archive_path, 'r|*') as tf:
+            for member in tf:
+                name = member.name
+                # Conda packages contain info/index.json, written first by conda-build
+                if conda and name == 'info/index.json':
+                    return PackageType.CONDA
+                # Rust crates contain Cargo.toml
+                if rust and 'Cargo.toml' in name:
+                    return PackageType.RUST_CRATE
+                names.add(name)
+                if not has_npm_manifest and name.endswith('package.json') and member.isfile():
+                    # Read and check if it looks like NPM package.json
+                    content = tf.extractfile(member).read()
+                    has_npm_manifest = b'"name"' in content or b'"version"' in content
     except:
         pass
-    return False
\ No newline at end of file
+    
+    # Ruby gems contain metadata.gz and data.tar.gz
+    if 'metadata.gz' in names and 'data.tar.gz' in names:
+        return PackageType.RUBY_GEM
+    # Perl packages contain META.json or META.yml (MYMETA files included)
+    if any('META.json' in name or 'META.yml' in name for name in names):
+        return PackageType.PERL
+    # Conan packages contain conanfile.py, conanfile.txt, or conaninfo.txt
+    if any(marker in name for name in names for marker in _CONAN_MARKERS):
+        return PackageType.CONAN
+    if any(_is_sdist_member(name) for name in names):
+        return PackageType.PYTHON_SDIST
+    if has_npm_manifest:
+        return PackageType.NPM
+    return None
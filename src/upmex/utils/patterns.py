@@ -1,4 +1,4 @@
-"""Shared patterns for license file detection."""
+"""Shared patterns for license file and identifier detection."""
 
 import re
 from typing import List, Pattern
@@ -42,6 +42,64 @@ LICENSE_FILE_PATTERNS_REGEX = [
     re.compile(r'^GPL-LICENSE(?:\.\w+)?$', re.IGNORECASE),
 ]
 
+# Lowercased base names accepted by is_license_file, with at most one extension
+_LICENSE_FILE_STEMS = frozenset({
+    'license', 'licence', 'copying', 'copyright', 'notice', 'legal',
+    'mit-license', 'apache-license', 'bsd-license', 'gpl-license',
+})
+_EXTENSION_RE = re.compile(r'\w+')
+
+
+# SPDX identifiers commonly declared verbatim in package metadata
+COMMON_SPDX_IDS = [
+    '0BSD',
+    'AFL-3.0',
+    'AGPL-3.0-only',
+    'AGPL-3.0-or-later',
+    'Apache-1.1',
+    'Apache-2.0',
+    'Artistic-1.0',
+    'Artistic-2.0',
+    'BSD-2-Clause',
+    'BSD-3-Clause',
+    'BSD-4-Clause',
+    'BSL-1.0',
+    'CC0-1.0',
+    'CC-BY-4.0',
+    'CC-BY-SA-4.0',
+    'CDDL-1.0',
+    'EPL-1.0',
+    'EPL-2.0',
+    'EUPL-1.2',
+    'GPL-2.0-only',
+    'GPL-2.0-or-later',
+    'GPL-3.0-only',
+    'GPL-3.0-or-later',
+    'ISC',
+    'LGPL-2.1-only',
+    'LGPL-2.1-or-later',
+    'LGPL-3.0-only',
+    'LGPL-3.0-or-later',
+    'MIT',
+    'MIT-0',
+    'MPL-1.1',
+    'MPL-2.0',
+    'MS-PL',
+    'NCSA',
+    'OpenSSL',
+    'PostgreSQL',
+    'PSF-2.0',
+    'Python-2.0',
+    'Ruby',
+    'Unlicense',
+    'UPL-1.0',
+    'Zlib',
+    'ZPL-2.1',
+]
+
+# Case-insensitive lookup from a declared identifier to its canonical form
+SPDX_ID_LOOKUP = {spdx_id.casefold(): spdx_id for spdx_id in COMMON_SPDX_IDS}
+
 
 def is_license_file(filename: str) -> bool:
     """Check if a filename indicates a license file.
@@ -52,10 +110,10 @@ def is_license_file(filename: str) -> bool:
     Returns:
         True if the filename matches a license file pattern
     """
-    for pattern in LICENSE_FILE_PATTERNS_REGEX:
-        if pattern.match(filename):
-            return True
-    return False
+    stem, dot, extension = filename.lower().partition('.')
+    if stem not in _LICENSE_FILE_STEMS:
+        return False
+    return not dot or _EXTENSION_RE.fullmatch(extension) is not None
 
 
 def get_license_file_patterns() -> List[str]:
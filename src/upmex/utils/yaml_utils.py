@@ -0,0 +1,6 @@
+"""YAML loading helpers."""
+
+import yaml
+
+# Use the libyaml C loader when PyYAML was built with it
+SAFE_LOADER = yaml.CSafeLoader if hasattr(yaml, 'CSafeLoader') else yaml.SafeLoader
@@ -0,0 +1,49 @@
+"""In-memory archive builders shared by the test suites."""
+
+import io
+import tarfile
+import zipfile
+
+# Fixed timestamp so generated archives are byte-identical across runs and platforms
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def zip_bytes(entries):
+    """Build an uncompressed zip archive in memory from a name -> content mapping."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED, strict_timestamps=False) as zf:
+        for name, content in entries.items():
+            zf.writestr(zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME), content)
+    return buffer.getvalue()
+
+
+def write_zip(path, entries):
+    """Write a deterministic, uncompressed zip archive to path and return it."""
+    path.write_bytes(zip_bytes(entries))
+    return path
+
+
+def tar_bytes(entries, compress=True):
+    """Build a tar archive in memory from a name -> bytes mapping.
+
+    Compressed archives use gzip level 0, which keeps the framing that
+    suffix-driven detection expects without deflating fixture content.
+    Pass compress=False for a plain tar when the consumer sniffs the format.
+    """
+    buffer = io.BytesIO()
+    if compress:
+        tf = tarfile.open(fileobj=buffer, mode='w:gz', compresslevel=0)
+    else:
+        tf = tarfile.open(fileobj=buffer, mode='w')
+    with tf:
+        for name, content in entries.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tf.addfile(info, fileobj=io.BytesIO(content))
+    return buffer.getvalue()
+
+
+def write_tar(path, entries, compress=True):
+    """Write a tar archive built by tar_bytes to path and return it."""
+    path.write_bytes(tar_bytes(entries, compress=compress))
+    return path
@@ -1,7 +1,146 @@
 """Pytest configuration for upmex."""
 
+import hashlib
+import json
+import os
+import platform
+import shutil
 import sys
+from collections import OrderedDict
+from importlib.metadata import version as package_version, PackageNotFoundError
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# RAM-backed scratch space used for test archives on Linux
+SHM_DIR = Path("/dev/shm")
+
+# Free tmpfs space required before test temp directories move there
+SHM_MIN_FREE = 512 * 1024 * 1024
+
+# Marks a run whose pytest_configure set PYTEST_DEBUG_TEMPROOT
+_TEMPROOT_SET = pytest.StashKey[bool]()
+
+# Distinct license texts OssliliResultCache keeps in memory
+OSSLILI_MEMO_SIZE = 256
+
+
+def pytest_configure(config):
+    """Root tmp_path and tmp_path_factory in /dev/shm on Linux unless TMPDIR is set.
+
+    Only pytest's own temp directories move, through PYTEST_DEBUG_TEMPROOT;
+    tempfile.* used by the code under test still resolves to the normal
+    temp dir. Container /dev/shm mounts are often only 64 MB, so the normal
+    temp dir is kept when tmpfs has less than SHM_MIN_FREE bytes free. xdist
+    workers inherit the variable from the controller.
+    """
+    if platform.system() != "Linux" or os.environ.get("TMPDIR") or os.environ.get("PYTEST_DEBUG_TEMPROOT"):
+        return
+    if not (SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK)):
+        return
+    if shutil.disk_usage(SHM_DIR).free < SHM_MIN_FREE:
+        return
+    os.environ["PYTEST_DEBUG_TEMPROOT"] = str(SHM_DIR)
+    config.stash[_TEMPROOT_SET] = True
+
+
+def pytest_unconfigure(config):
+    """Drop the temp root override set by pytest_configure."""
+    if config.stash.get(_TEMPROOT_SET, False):
+        os.environ.pop("PYTEST_DEBUG_TEMPROOT", None)
+
+
+def _osslili_version():
+    """Installed osslili version, part of the cache key so upgrades rescan."""
+    try:
+        return package_version("osslili")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class OssliliResultCache:
+    """Cache around OssliliSubprocessDetector.scan_content for the test session.
+
+    Results depend only on the osslili version, the file suffix and the
+    content, so they are kept in a small in-memory LRU and on disk under a
+    hash of all three. Failed runs (None) are never stored.
+    """
+
+    def __init__(self, scan_content, cache_dir, memo_size=OSSLILI_MEMO_SIZE):
+        self.scan_content = scan_content
+        self.cache_dir = Path(cache_dir)
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.version = _osslili_version()
+
+    def __call__(self, file_path, content):
+        suffix = Path(file_path).suffix or '.txt'
+        key = (suffix, content)
+        licenses = self.memo.get(key)
+        if licenses is not None:
+            self.memo.move_to_end(key)
+            return [{**lic, "file": file_path} for lic in licenses]
+
+        digest = hashlib.sha256(
+            f"{self.version}\0{suffix}\0{content}".encode('utf-8', errors='replace')
+        ).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.json"
+        try:
+            licenses = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            licenses = self.scan_content(file_path, content)
+            if licenses is None:
+                return None
+            licenses = [{k: v for k, v in lic.items() if k != "file"} for lic in licenses]
+            self._store(cache_path, licenses)
+
+        self.memo[key] = licenses
+        if len(self.memo) > self.memo_size:
+            self.memo.popitem(last=False)
+        return [{**lic, "file": file_path} for lic in licenses]
+
+    def _store(self, cache_path, licenses):
+        """Write then rename, so concurrent workers never read a partial entry."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(licenses))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def osslili_cache(tmp_path_factory):
+    """Share osslili per-file detection results across the test session.
+
+    Many tests scan identical LICENSE texts; each miss costs an osslili
+    process start. The global detector's scan_content is wrapped in an
+    OssliliResultCache for the session. Under xdist the cache sits beside
+    the per-worker base temp directories so all workers of one run share it.
+    """
+    from upmex.licenses.unified_detector import get_detector
+
+    root = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        root = root.parent
+    detector = get_detector().osslili_detector
+    cache = OssliliResultCache(detector.scan_content, root / "osslili-cache")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(detector, "scan_content", cache)
+        yield cache
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as network unless RUN_NETWORK_TESTS=1."""
+    if os.environ.get("RUN_NETWORK_TESTS") == "1":
+        return
+
+    skip_network = pytest.mark.skip(reason="network test (set RUN_NETWORK_TESTS=1 to run)")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
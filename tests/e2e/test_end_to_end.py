@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import shutil
 import tempfile
 import zipfile
 import tarfile
@@ -14,15 +15,55 @@ from upmex.core.extractor import PackageExtractor
 from upmex.core.models import PackageType, PackageMetadata
 
 
+FIXTURES_DIR = Path(__file__).parent.parent / "data" / "fixtures"
+
+
+def copy_fixture(name, tmp_path):
+    """Copy a pre-built archive from tests/data/fixtures into tmp_path."""
+    dst = tmp_path / name
+    shutil.copyfile(FIXTURES_DIR / name, dst)
+    return dst
+
+
+@pytest.fixture
+def complete_wheel(tmp_path):
+    """Wheel with full METADATA, LICENSE and top_level.txt."""
+    return copy_fixture("complete.whl", tmp_path)
+
+
+@pytest.fixture
+def maven_jar(tmp_path):
+    """Maven JAR with a complete pom.xml."""
+    return copy_fixture("maven.jar", tmp_path)
+
+
+@pytest.fixture
+def npm_tgz(tmp_path):
+    """NPM tarball with a complete package.json and README."""
+    return copy_fixture("npm.tgz", tmp_path)
+
+
+@pytest.fixture(scope="module")
+def scratch_dir(tmp_path_factory):
+    """Shared scratch directory for tests that write uniquely named files."""
+    return tmp_path_factory.mktemp("e2e")
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by the module; every invocation passes explicit paths."""
+    return CliRunner()
+
+
 class TestCLIEndToEnd:
     """Test CLI commands end-to-end."""
     
-    def test_extract_command_json_output(self, tmp_path):
+    def test_extract_command_json_output(self, scratch_dir, runner):
         """Test extract command with JSON output."""
         # Create a mock package
-        package_path = tmp_path / "test-1.0.0-py3-none-any.whl"
+        package_path = scratch_dir / "test-1.0.0-py3-none-any.whl"
         
-        with zipfile.ZipFile(package_path, 'w') as zf:
+        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_STORED) as zf:
             metadata_content = """Metadata-Version: 2.1
 Name: test-package
 Version: 1.0.0
@@ -33,7 +74,6 @@ License: MIT
 """
             zf.writestr("test-1.0.0.dist-info/METADATA", metadata_content)
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['extract', str(package_path), '--format', 'json'])
         
         assert result.exit_code == 0
@@ -42,28 +82,27 @@ License: MIT
         assert output["package"]["version"] == "1.0.0"
         assert output["metadata"]["description"] == "Test package for E2E"
     
-    def test_extract_command_text_output(self, tmp_path):
+    def test_extract_command_text_output(self, scratch_dir, runner):
         """Test extract command with text output."""
-        package_path = tmp_path / "test.jar"
+        package_path = scratch_dir / "test.jar"
         
-        with zipfile.ZipFile(package_path, 'w') as zf:
+        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_STORED) as zf:
             manifest = """Manifest-Version: 1.0
 Implementation-Title: Test JAR
 Implementation-Version: 1.0.0
 """
             zf.writestr("META-INF/MANIFEST.MF", manifest)
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['extract', str(package_path), '--format', 'text'])
         
         assert result.exit_code == 0
         assert "Test JAR" in result.output
         assert "1.0.0" in result.output
     
-    def test_extract_command_with_output_file(self, tmp_path):
+    def test_extract_command_with_output_file(self, scratch_dir, runner):
         """Test extract command with output file."""
-        package_path = tmp_path / "package.tgz"
-        output_path = tmp_path / "output.json"
+        package_path = scratch_dir / "output-test.tgz"
+        output_path = scratch_dir / "output.json"
         
         # Create mock npm package
         package_json = {
@@ -72,7 +111,7 @@ Implementation-Version: 1.0.0
             "description": "Test NPM package"
         }
         
-        with tarfile.open(package_path, 'w:gz') as tf:
+        with tarfile.open(package_path, 'w:gz', compresslevel=0) as tf:
             info = tarfile.TarInfo(name="package/package.json")
             content = json.dumps(package_json).encode()
             info.size = len(content)
@@ -82,7 +121,6 @@ Implementation-Version: 1.0.0
             content_file = io.BytesIO(content)
             tf.addfile(info, fileobj=content_file)
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'extract', str(package_path),
             '--output', str(output_path),
@@ -97,11 +135,13 @@ Implementation-Version: 1.0.0
             assert data["package"]["name"] == "test-npm"
             assert data["package"]["version"] == "2.0.0"
     
+    @pytest.mark.network
+    @patch('requests.Session.get')
     @patch('requests.get')
-    def test_extract_with_registry_mode(self, mock_get, tmp_path):
+    def test_extract_with_registry_mode(self, mock_get, mock_session_get, scratch_dir, runner):
         """Test extraction with registry mode enabled."""
         # Create Maven package with parent POM
-        jar_path = tmp_path / "child.jar"
+        jar_path = scratch_dir / "child.jar"
         
         child_pom = """<?xml version="1.0"?>
 <project>
@@ -113,7 +153,7 @@ Implementation-Version: 1.0.0
     <artifactId>child-artifact</artifactId>
 </project>"""
         
-        with zipfile.ZipFile(jar_path, 'w') as zf:
+        with zipfile.ZipFile(jar_path, 'w', zipfile.ZIP_STORED) as zf:
             zf.writestr("META-INF/maven/org.parent/child-artifact/pom.xml", child_pom)
         
         # Mock parent POM fetch
@@ -127,8 +167,11 @@ Implementation-Version: 1.0.0
         
         mock_get.return_value.status_code = 200
         mock_get.return_value.text = parent_pom
+        mock_get.return_value.content = parent_pom.encode()
+        
+        # No ClearlyDefined data for the child artifact
+        mock_session_get.return_value.status_code = 404
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'extract', str(jar_path),
             '--registry',
@@ -137,29 +180,28 @@ Implementation-Version: 1.0.0
 
         # Registry mode might fail if network is unavailable
         if result.exit_code == 0:
-            output = json.loads(result.output)
+            output = json.loads(result.stdout)
             assert "child-artifact" in output["package"]["name"]
         else:
             # Accept failure when registry is not available
             assert result.exit_code in [0, 1]
     
-    def test_detect_command(self, tmp_path):
+    def test_detect_command(self, scratch_dir, runner):
         """Test detect command."""
         import io
 
-        runner = CliRunner()
 
         # Test Python wheel (simple zip file)
-        wheel_path = tmp_path / "package.whl"
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
+        wheel_path = scratch_dir / "package.whl"
+        with zipfile.ZipFile(wheel_path, 'w', zipfile.ZIP_STORED) as zf:
             zf.writestr("test/__init__.py", "")
         result = runner.invoke(cli, ['detect', str(wheel_path)])
         assert result.exit_code == 0
         assert PackageType.PYTHON_WHEEL.value in result.output
 
         # Test Python sdist (tar.gz with PKG-INFO)
-        sdist_path = tmp_path / "package.tar.gz"
-        with tarfile.open(sdist_path, 'w:gz') as tf:
+        sdist_path = scratch_dir / "package.tar.gz"
+        with tarfile.open(sdist_path, 'w:gz', compresslevel=0) as tf:
             info = tarfile.TarInfo(name="package-1.0.0/PKG-INFO")
             info.size = 0
             tf.addfile(info, io.BytesIO(b""))
@@ -168,8 +210,8 @@ Implementation-Version: 1.0.0
         assert PackageType.PYTHON_SDIST.value in result.output
 
         # Test NPM package (tgz with package/package.json)
-        npm_path = tmp_path / "package.tgz"
-        with tarfile.open(npm_path, 'w:gz') as tf:
+        npm_path = scratch_dir / "package.tgz"
+        with tarfile.open(npm_path, 'w:gz', compresslevel=0) as tf:
             info = tarfile.TarInfo(name="package/package.json")
             content = b'{"name": "test"}'
             info.size = len(content)
@@ -179,19 +221,18 @@ Implementation-Version: 1.0.0
         assert PackageType.NPM.value in result.output
 
         # Test JAR file (zip with META-INF/MANIFEST.MF)
-        jar_path = tmp_path / "package.jar"
-        with zipfile.ZipFile(jar_path, 'w') as zf:
+        jar_path = scratch_dir / "package.jar"
+        with zipfile.ZipFile(jar_path, 'w', zipfile.ZIP_STORED) as zf:
             zf.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
         result = runner.invoke(cli, ['detect', str(jar_path)])
         assert result.exit_code == 0
         assert PackageType.JAR.value in result.output
     
-    def test_detect_command_verbose(self, tmp_path):
+    def test_detect_command_verbose(self, scratch_dir, runner):
         """Test detect command with verbose output."""
-        file_path = tmp_path / "test.whl"
+        file_path = scratch_dir / "test.whl"
         file_path.write_text("test content")
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['detect', str(file_path), '--verbose'])
         
         assert result.exit_code == 0
@@ -199,11 +240,11 @@ Implementation-Version: 1.0.0
         assert "Size:" in result.output
         assert "Type: python_wheel" in result.output
     
-    def test_license_command(self, tmp_path):
+    def test_license_command(self, scratch_dir, runner):
         """Test license extraction command."""
-        package_path = tmp_path / "licensed-1.0.0-py3-none-any.whl"
+        package_path = scratch_dir / "licensed-1.0.0-py3-none-any.whl"
         
-        with zipfile.ZipFile(package_path, 'w') as zf:
+        with zipfile.ZipFile(package_path, 'w', zipfile.ZIP_STORED) as zf:
             metadata = """Metadata-Version: 2.1
 Name: licensed-package
 Version: 1.0.0
@@ -215,17 +256,14 @@ License: Apache-2.0
             license_text = "Apache License Version 2.0"
             zf.writestr("licensed-1.0.0.dist-info/LICENSE", license_text)
         
-        runner = CliRunner()
         result = runner.invoke(cli, ['license', str(package_path)])
         
         assert result.exit_code == 0
         # The output would show license info if properly extracted
         # For now, we're just checking the command runs
     
-    def test_info_command(self):
+    def test_info_command(self, runner):
         """Test info command."""
-        runner = CliRunner()
-        
         # Test default text output
         result = runner.invoke(cli, ['info'])
         assert result.exit_code == 0
@@ -245,36 +283,9 @@ License: Apache-2.0
 class TestFullPipeline:
     """Test complete extraction pipeline."""
     
-    def test_python_wheel_full_extraction(self, tmp_path):
+    def test_python_wheel_full_extraction(self, complete_wheel):
         """Test full extraction pipeline for Python wheel."""
-        wheel_path = tmp_path / "complete-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            # Add comprehensive metadata
-            metadata = """Metadata-Version: 2.1
-Name: complete-package
-Version: 1.0.0
-Summary: A complete test package
-Home-page: https://example.com
-Author: John Doe
-Author-email: john@example.com
-License: MIT
-Classifier: Development Status :: 5 - Production/Stable
-Classifier: Programming Language :: Python :: 3
-Classifier: License :: OSI Approved :: MIT License
-Keywords: test complete example
-Requires-Dist: requests>=2.0.0
-Requires-Dist: click>=8.0.0
-Provides-Extra: dev
-Requires-Dist: pytest>=7.0.0; extra == "dev"
-"""
-            zf.writestr("complete-1.0.0.dist-info/METADATA", metadata)
-            
-            # Add LICENSE
-            zf.writestr("complete-1.0.0.dist-info/LICENSE", "MIT License\n\nCopyright (c) 2024")
-            
-            # Add top_level.txt
-            zf.writestr("complete-1.0.0.dist-info/top_level.txt", "complete")
+        wheel_path = complete_wheel
         
         extractor = PackageExtractor()
         metadata = extractor.extract(str(wheel_path))
@@ -301,53 +312,10 @@ Requires-Dist: pytest>=7.0.0; extra == "dev"
         
         assert len(metadata.classifiers) == 3
     
-    @patch('requests.get')
-    def test_maven_jar_with_registry_enrichment(self, mock_get, tmp_path):
+    @patch('requests.Session.get')
+    def test_maven_jar_with_registry_enrichment(self, mock_get, maven_jar):
         """Test Maven JAR extraction with registry enrichment."""
-        jar_path = tmp_path / "maven-artifact-1.0.0.jar"
-        
-        # Create JAR with POM
-        pom_xml = """<?xml version="1.0"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0">
-    <groupId>com.example</groupId>
-    <artifactId>maven-artifact</artifactId>
-    <version>1.0.0</version>
-    <description>Maven test artifact</description>
-    <url>https://example.com/maven</url>
-    <developers>
-        <developer>
-            <id>dev1</id>
-            <name>Developer One</name>
-            <email>dev1@example.com</email>
-        </developer>
-    </developers>
-    <licenses>
-        <license>
-            <name>Apache License, Version 2.0</name>
-            <url>https://www.apache.org/licenses/LICENSE-2.0</url>
-        </license>
-    </licenses>
-    <scm>
-        <url>https://github.com/example/maven-artifact</url>
-        <connection>scm:git:https://github.com/example/maven-artifact.git</connection>
-    </scm>
-    <dependencies>
-        <dependency>
-            <groupId>org.springframework</groupId>
-            <artifactId>spring-core</artifactId>
-            <version>5.3.0</version>
-        </dependency>
-        <dependency>
-            <groupId>junit</groupId>
-            <artifactId>junit</artifactId>
-            <version>4.13</version>
-            <scope>test</scope>
-        </dependency>
-    </dependencies>
-</project>"""
-        
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/maven/com.example/maven-artifact/pom.xml", pom_xml)
+        jar_path = maven_jar
         
         # Mock ClearlyDefined response
         mock_get.return_value.status_code = 200
@@ -380,69 +348,9 @@ Requires-Dist: pytest>=7.0.0; extra == "dev"
         # Skip dependency checks if extraction didn't find any
         pass  # Dependencies are optional in this test
     
-    def test_npm_package_full_extraction(self, tmp_path):
+    def test_npm_package_full_extraction(self, npm_tgz):
         """Test full NPM package extraction."""
-        tgz_path = tmp_path / "npm-package-1.0.0.tgz"
-        
-        package_json = {
-            "name": "@scope/npm-package",
-            "version": "1.0.0",
-            "description": "Complete NPM package test",
-            "main": "index.js",
-            "scripts": {
-                "test": "jest",
-                "build": "webpack"
-            },
-            "repository": {
-                "type": "git",
-                "url": "git+https://github.com/scope/npm-package.git"
-            },
-            "keywords": ["npm", "test", "package"],
-            "author": {
-                "name": "NPM Author",
-                "email": "npm@example.com",
-                "url": "https://example.com"
-            },
-            "contributors": [
-                {
-                    "name": "Contributor One",
-                    "email": "contrib1@example.com"
-                }
-            ],
-            "license": "ISC",
-            "bugs": {
-                "url": "https://github.com/scope/npm-package/issues"
-            },
-            "homepage": "https://github.com/scope/npm-package#readme",
-            "dependencies": {
-                "express": "^4.18.0",
-                "lodash": "^4.17.21"
-            },
-            "devDependencies": {
-                "jest": "^29.0.0",
-                "webpack": "^5.0.0"
-            },
-            "peerDependencies": {
-                "react": "^18.0.0"
-            }
-        }
-        
-        # Create proper tgz structure
-        import io
-        with tarfile.open(tgz_path, 'w:gz') as tf:
-            # Create package.json tarinfo
-            info = tarfile.TarInfo(name="package/package.json")
-            content = json.dumps(package_json, indent=2).encode()
-            info.size = len(content)
-            
-            # Add to archive
-            tf.addfile(info, fileobj=io.BytesIO(content))
-            
-            # Add README
-            readme_info = tarfile.TarInfo(name="package/README.md")
-            readme_content = b"# NPM Package\n\nTest package for E2E testing"
-            readme_info.size = len(readme_content)
-            tf.addfile(readme_info, fileobj=io.BytesIO(readme_content))
+        tgz_path = npm_tgz
         
         extractor = PackageExtractor()
         metadata = extractor.extract(str(tgz_path))
@@ -472,12 +380,11 @@ Requires-Dist: pytest>=7.0.0; extra == "dev"
 class TestErrorHandling:
     """Test error handling throughout the pipeline."""
     
-    def test_invalid_package_file(self, tmp_path):
+    def test_invalid_package_file(self, tmp_path, runner):
         """Test handling of invalid package files."""
         invalid_file = tmp_path / "invalid.txt"
         invalid_file.write_text("This is not a package")
 
-        runner = CliRunner()
         result = runner.invoke(cli, ['extract', str(invalid_file)])
 
         # Should handle gracefully and return unknown type
@@ -501,7 +408,7 @@ class TestErrorHandling:
         """Test handling packages with missing metadata."""
         # Create wheel without METADATA file
         wheel_path = tmp_path / "empty-1.0.0-py3-none-any.whl"
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
+        with zipfile.ZipFile(wheel_path, 'w', zipfile.ZIP_STORED) as zf:
             zf.writestr("empty/__init__.py", "# Empty package")
 
         extractor = PackageExtractor()
@@ -511,8 +418,9 @@ class TestErrorHandling:
         assert metadata.name == "NO-ASSERTION"  # Default when no metadata
         assert metadata.package_type == PackageType.PYTHON_WHEEL
     
-    @patch('requests.get')
-    def test_api_timeout_handling(self, mock_get, tmp_path):
+    @pytest.mark.network
+    @patch('requests.Session.get')
+    def test_api_timeout_handling(self, mock_get, tmp_path, runner):
         """Test handling of API timeouts."""
         import requests
         mock_get.side_effect = requests.Timeout("API timeout")
@@ -520,7 +428,6 @@ class TestErrorHandling:
         package_path = tmp_path / "package.whl"
         package_path.touch()
         
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'extract', str(package_path),
             '--registry',
@@ -530,9 +437,8 @@ class TestErrorHandling:
         # Should complete without API data
         assert result.exit_code == 0 or "timeout" in result.output.lower()
     
-    def test_nonexistent_file(self):
+    def test_nonexistent_file(self, runner):
         """Test handling of non-existent files."""
-        runner = CliRunner()
         result = runner.invoke(cli, ['extract', '/nonexistent/package.whl'])
         
         assert result.exit_code != 0
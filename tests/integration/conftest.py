@@ -0,0 +1,244 @@
+"""Shared fixtures for integration tests."""
+
+import functools
+import json
+from pathlib import Path
+
+import pytest
+
+from upmex.api.clearlydefined import ClearlyDefinedAPI
+from upmex.api.ecosystems import EcosystemsAPI
+from upmex.extractors.python_extractor import PythonExtractor
+from upmex.extractors.npm_extractor import NpmExtractor
+from upmex.extractors.java_extractor import JavaExtractor
+
+from tests.archive_helpers import write_tar, write_zip
+
+RESPONSES_DIR = Path(__file__).resolve().parent.parent / "data" / "responses"
+
+
+@pytest.fixture(scope="module")
+def clearly_api():
+    """ClearlyDefined client without an API key."""
+    return ClearlyDefinedAPI()
+
+
+@pytest.fixture(scope="module")
+def ecosystems_api():
+    """Ecosyste.ms client without an API key."""
+    return EcosystemsAPI()
+
+
+@pytest.fixture(scope="session")
+def python_extractor():
+    """Python extractor with registry mode disabled."""
+    return PythonExtractor()
+
+
+@pytest.fixture(scope="session")
+def npm_extractor():
+    """NPM extractor with registry mode disabled."""
+    return NpmExtractor()
+
+
+@pytest.fixture(scope="session")
+def java_extractor():
+    """Java extractor with registry mode disabled."""
+    return JavaExtractor()
+
+
+@pytest.fixture(scope="session")
+def package_extractor():
+    """Auto-detecting package extractor with default configuration."""
+    from upmex.core.extractor import PackageExtractor
+    return PackageExtractor()
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response with a status code and JSON body."""
+
+    __slots__ = ('status_code', '_json', 'text', 'content')
+
+    def __init__(self, status_code=200, json=None, text=''):
+        self.status_code = status_code
+        self._json = json
+        self.text = text
+        self.content = text.encode()
+
+    def json(self):
+        return self._json
+
+
+@pytest.fixture
+def make_mock_response():
+    """Factory for fake HTTP responses with a status code and JSON body."""
+    return FakeResponse
+
+
+@functools.lru_cache(maxsize=None)
+def load_response(name):
+    """Read a recorded response body from tests/data/responses (cached)."""
+    return (RESPONSES_DIR / name).read_text()
+
+
+@pytest.fixture
+def mocked_api(requests_mock):
+    """Register recorded responses for every upstream URL the tests hit."""
+    requests_mock.get(
+        "https://api.clearlydefined.io/definitions/pypi/pypi/-/requests/2.28.0",
+        text=load_response("clearlydefined_pypi_requests_2.28.0.json"),
+    )
+    ecosystems = "https://packages.ecosyste.ms/api/v1/registries"
+    requests_mock.get(
+        f"{ecosystems}/pypi.org/packages/requests",
+        text=load_response("ecosystems_pypi_requests.json"),
+    )
+    requests_mock.get(
+        f"{ecosystems}/pypi.org/packages/requests/versions/2.28.0",
+        text=load_response("ecosystems_pypi_requests_2.28.0.json"),
+    )
+    requests_mock.get(
+        "https://repo1.maven.org/maven2/org/springframework/boot/spring-boot-starter-parent/2.5.0/"
+        "spring-boot-starter-parent-2.5.0.pom",
+        text=load_response("spring-boot-starter-parent-2.5.0.pom"),
+    )
+    return requests_mock
+
+
+@pytest.fixture(scope="session")
+def sample_wheel(tmp_path_factory):
+    """Wheel with METADATA describing test-package 1.0.0."""
+    metadata_content = """Metadata-Version: 2.1
+Name: test-package
+Version: 1.0.0
+Summary: A test package
+Author: Test Author
+Author-email: test@example.com
+License: MIT
+Classifier: Programming Language :: Python :: 3
+Requires-Dist: requests>=2.0.0
+"""
+    path = tmp_path_factory.mktemp("whl") / "test-1.0.0-py3-none-any.whl"
+    return write_zip(path, {"test-1.0.0.dist-info/METADATA": metadata_content})
+
+
+@pytest.fixture(scope="session")
+def sample_sdist(tmp_path_factory):
+    """Source distribution with a PKG-INFO for test-sdist 2.0.0."""
+    pkg_info = """Metadata-Version: 2.1
+Name: test-sdist
+Version: 2.0.0
+Summary: Test sdist package
+Author: Sdist Author
+License: Apache-2.0
+"""
+    path = tmp_path_factory.mktemp("sdist") / "test-1.0.0.tar.gz"
+    return write_tar(path, {"test-1.0.0/PKG-INFO": pkg_info.encode()})
+
+
+@pytest.fixture(scope="session")
+def sample_npm_tgz(tmp_path_factory):
+    """NPM tarball for @scope/test-package 1.0.0."""
+    package_json = {
+        "name": "@scope/test-package",
+        "version": "1.0.0",
+        "description": "Test npm package",
+        "author": {
+            "name": "NPM Author",
+            "email": "npm@example.com"
+        },
+        "license": "ISC",
+        "repository": {
+            "type": "git",
+            "url": "https://github.com/test/repo.git"
+        },
+        "dependencies": {
+            "express": "^4.0.0"
+        },
+        "devDependencies": {
+            "jest": "^27.0.0"
+        },
+        "keywords": ["test", "npm"]
+    }
+    path = tmp_path_factory.mktemp("npm") / "test-1.0.0.tgz"
+    return write_tar(path, {"package/package.json": json.dumps(package_json).encode("utf-8")})
+
+
+@pytest.fixture(scope="session")
+def sample_maven_jar(tmp_path_factory):
+    """Maven JAR with an embedded pom.xml."""
+    pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <groupId>com.example</groupId>
+    <artifactId>test-artifact</artifactId>
+    <version>1.0.0</version>
+    <description>Test Maven package</description>
+    <url>https://example.com</url>
+    <developers>
+        <developer>
+            <name>Maven Developer</name>
+            <email>maven@example.com</email>
+        </developer>
+    </developers>
+    <scm>
+        <url>https://github.com/example/test.git</url>
+    </scm>
+    <dependencies>
+        <dependency>
+            <groupId>junit</groupId>
+            <artifactId>junit</artifactId>
+            <version>4.12</version>
+            <scope>test</scope>
+        </dependency>
+    </dependencies>
+</project>"""
+    path = tmp_path_factory.mktemp("jar") / "test-1.0.0.jar"
+    return write_zip(path, {"META-INF/maven/com.example/test-artifact/pom.xml": pom_xml})
+
+
+@pytest.fixture(scope="session")
+def sample_manifest_jar(tmp_path_factory):
+    """Plain JAR with only a MANIFEST.MF."""
+    manifest_content = """Manifest-Version: 1.0
+Implementation-Title: Simple JAR
+Implementation-Version: 2.0.0
+Implementation-Vendor: Test Vendor
+"""
+    path = tmp_path_factory.mktemp("jar") / "simple.jar"
+    return write_zip(path, {"META-INF/MANIFEST.MF": manifest_content})
+
+
+@pytest.fixture(scope="session")
+def child_pom_jar(tmp_path_factory):
+    """Maven JAR whose pom.xml references a Spring Boot parent POM."""
+    child_pom = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+    <parent>
+        <groupId>org.springframework.boot</groupId>
+        <artifactId>spring-boot-starter-parent</artifactId>
+        <version>2.5.0</version>
+    </parent>
+    <artifactId>my-app</artifactId>
+</project>"""
+    path = tmp_path_factory.mktemp("jar") / "child.jar"
+    return write_zip(path, {"META-INF/maven/org.springframework.boot/my-app/pom.xml": child_pom})
+
+
+@pytest.fixture(scope="session")
+def maven_pom_cache(tmp_path_factory):
+    """Parent POM cache directory seeded with the Spring Boot parent POM."""
+    cache_dir = tmp_path_factory.mktemp("maven-cache")
+    pom_path = cache_dir / "org.springframework.boot" / "spring-boot-starter-parent" / "2.5.0.pom"
+    pom_path.parent.mkdir(parents=True)
+    pom_path.write_text(load_response("spring-boot-starter-parent-2.5.0.pom"))
+    return cache_dir
+
+
+@pytest.fixture(scope="session")
+def minimal_wheel(tmp_path_factory):
+    """Minimal wheel with a package module and bare METADATA."""
+    path = tmp_path_factory.mktemp("whl") / "package-1.0.0-py3-none-any.whl"
+    return write_zip(path, {
+        "package/__init__.py": "",
+        "package-1.0.0.dist-info/METADATA": "Name: package\nVersion: 1.0.0\n",
+    })
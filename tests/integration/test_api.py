@@ -1,7 +1,7 @@
 """Integration tests for API clients."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 import requests
 
 from upmex.api.clearlydefined import ClearlyDefinedAPI
@@ -16,34 +16,17 @@ class TestClearlyDefinedAPI:
         """Test initialization with API key."""
         api = ClearlyDefinedAPI(api_key="test-key")
         assert api.api_key == "test-key"
-        assert api.headers["Authorization"] == "Bearer test-key"
+        assert api.session.headers["Authorization"] == "Bearer test-key"
     
     def test_init_without_api_key(self):
         """Test initialization without API key."""
         api = ClearlyDefinedAPI()
         assert api.api_key is None
-        assert "Authorization" not in api.headers
+        assert "Authorization" not in api.session.headers
     
-    @patch('requests.get')
-    def test_get_definition_success(self, mock_get):
+    def test_get_definition_success(self, mocked_api, clearly_api):
         """Test successful package definition retrieval."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "coordinates": {
-                "type": "pypi",
-                "provider": "pypi",
-                "name": "requests",
-                "revision": "2.28.0"
-            },
-            "licensed": {
-                "declared": "Apache-2.0"
-            }
-        }
-        mock_get.return_value = mock_response
-        
-        api = ClearlyDefinedAPI()
-        result = api.get_definition(
+        result = clearly_api.get_definition(
             PackageType.PYTHON_WHEEL,
             None,
             "requests",
@@ -52,19 +35,19 @@ class TestClearlyDefinedAPI:
         
         assert result is not None
         assert result["licensed"]["declared"] == "Apache-2.0"
-        mock_get.assert_called_once()
-        assert "pypi/-/requests/2.28.0" in mock_get.call_args[0][0]
+        assert mocked_api.call_count == 1
+        assert "pypi/-/requests/2.28.0" in mocked_api.last_request.url
+        
+        license_info = clearly_api.extract_license_info(result)
+        assert license_info["spdx_id"] == "Apache-2.0"
+        assert license_info["source"] == "ClearlyDefined"
     
-    @patch('requests.get')
-    def test_get_definition_with_namespace(self, mock_get):
+    @patch('requests.Session.get')
+    def test_get_definition_with_namespace(self, mock_get, clearly_api, make_mock_response):
         """Test package definition with namespace."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"licensed": {"declared": "MIT"}}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_mock_response(200, {"licensed": {"declared": "MIT"}})
         
-        api = ClearlyDefinedAPI()
-        result = api.get_definition(
+        result = clearly_api.get_definition(
             PackageType.NPM,
             "@angular",
             "core",
@@ -75,15 +58,12 @@ class TestClearlyDefinedAPI:
         # ClearlyDefined uses npmjs as provider for scoped packages
         assert "npm/npmjs/@angular/core/12.0.0" in mock_get.call_args[0][0]
     
-    @patch('requests.get')
-    def test_get_definition_not_found(self, mock_get):
+    @patch('requests.Session.get')
+    def test_get_definition_not_found(self, mock_get, clearly_api, make_mock_response):
         """Test handling of 404 response."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_mock_response(404)
         
-        api = ClearlyDefinedAPI()
-        result = api.get_definition(
+        result = clearly_api.get_definition(
             PackageType.PYTHON_WHEEL,
             None,
             "nonexistent",
@@ -92,13 +72,12 @@ class TestClearlyDefinedAPI:
         
         assert result is None
     
-    @patch('requests.get')
-    def test_get_definition_network_error(self, mock_get):
+    @patch('requests.Session.get')
+    def test_get_definition_network_error(self, mock_get, clearly_api):
         """Test handling of network errors."""
         mock_get.side_effect = requests.RequestException("Network error")
         
-        api = ClearlyDefinedAPI()
-        result = api.get_definition(
+        result = clearly_api.get_definition(
             PackageType.PYTHON_WHEEL,
             None,
             "requests",
@@ -107,57 +86,34 @@ class TestClearlyDefinedAPI:
         
         assert result is None
     
-    def test_map_package_type(self):
+    @pytest.mark.parametrize("package_type,expected", [
+        (PackageType.PYTHON_WHEEL, {"type": "pypi", "provider": "pypi"}),
+        (PackageType.PYTHON_SDIST, {"type": "pypi", "provider": "pypi"}),
+        (PackageType.NPM, {"type": "npm", "provider": "npmjs"}),
+        (PackageType.MAVEN, {"type": "maven", "provider": "mavencentral"}),
+        (PackageType.JAR, {"type": "maven", "provider": "mavencentral"}),
+        (PackageType.UNKNOWN, None),
+    ])
+    def test_map_package_type(self, clearly_api, package_type, expected):
         """Test package type mapping."""
-        api = ClearlyDefinedAPI()
-
-        assert api._map_package_type(PackageType.PYTHON_WHEEL) == {"type": "pypi", "provider": "pypi"}
-        assert api._map_package_type(PackageType.PYTHON_SDIST) == {"type": "pypi", "provider": "pypi"}
-        assert api._map_package_type(PackageType.NPM) == {"type": "npm", "provider": "npmjs"}
-        assert api._map_package_type(PackageType.MAVEN) == {"type": "maven", "provider": "mavencentral"}
-        assert api._map_package_type(PackageType.JAR) == {"type": "maven", "provider": "mavencentral"}
-        assert api._map_package_type(PackageType.UNKNOWN) is None
-    
-    def test_extract_license_info_declared(self):
-        """Test extracting declared license."""
-        api = ClearlyDefinedAPI()
-        definition = {
-            "licensed": {
-                "declared": "MIT"
-            }
-        }
-        
-        result = api.extract_license_info(definition)
+        assert clearly_api._map_package_type(package_type) == expected
+    
+    @pytest.mark.parametrize("definition,spdx_id,confidence", [
+        ({"licensed": {"declared": "MIT"}}, "MIT", 1.0),
+        ({"licensed": {"discovered": {"expressions": ["Apache-2.0", "MIT"]}}}, "Apache-2.0", 0.8),
+    ], ids=["declared", "discovered"])
+    def test_extract_license_info(self, clearly_api, definition, spdx_id, confidence):
+        """Test extracting declared and discovered licenses."""
+        result = clearly_api.extract_license_info(definition)
         assert result is not None
-        assert result["spdx_id"] == "MIT"
+        assert result["spdx_id"] == spdx_id
         assert result["source"] == "ClearlyDefined"
-        assert result["confidence"] == 1.0
-    
-    def test_extract_license_info_discovered(self):
-        """Test extracting discovered license."""
-        api = ClearlyDefinedAPI()
-        definition = {
-            "licensed": {
-                "discovered": {
-                    "expressions": ["Apache-2.0", "MIT"]
-                }
-            }
-        }
-        
-        result = api.extract_license_info(definition)
-        assert result is not None
-        assert result["spdx_id"] == "Apache-2.0"
-        assert result["confidence"] == 0.8
+        assert result["confidence"] == confidence
     
-    def test_extract_license_info_none(self):
+    @pytest.mark.parametrize("definition", [{}, {"licensed": {}}])
+    def test_extract_license_info_none(self, clearly_api, definition):
         """Test when no license info available."""
-        api = ClearlyDefinedAPI()
-        
-        result = api.extract_license_info({})
-        assert result is None
-        
-        result = api.extract_license_info({"licensed": {}})
-        assert result is None
+        assert clearly_api.extract_license_info(definition) is None
 
 
 class TestEcosystemsAPI:
@@ -167,56 +123,41 @@ class TestEcosystemsAPI:
         """Test initialization with API key."""
         api = EcosystemsAPI(api_key="test-key")
         assert api.api_key == "test-key"
-        assert api.headers["Authorization"] == "Bearer test-key"
+        assert api.session.headers["Authorization"] == "Bearer test-key"
     
     def test_init_without_api_key(self):
         """Test initialization without API key."""
         api = EcosystemsAPI()
         assert api.api_key is None
-        assert "Authorization" not in api.headers
+        assert "Authorization" not in api.session.headers
     
-    @patch('requests.get')
-    def test_get_package_info_success(self, mock_get):
+    def test_get_package_info_success(self, mocked_api, ecosystems_api):
         """Test successful package info retrieval."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "name": "requests",
-            "description": "Python HTTP library",
-            "homepage": "https://requests.readthedocs.io",
-            "repository_url": "https://github.com/psf/requests",
-            "licenses": ["Apache-2.0"],
-            "keywords": ["http", "requests"]
-        }
-        mock_get.return_value = mock_response
-        
-        api = EcosystemsAPI()
-        result = api.get_package_info(
+        result = ecosystems_api.get_package_info(
             PackageType.PYTHON_WHEEL,
             "requests",
             "2.28.0"
         )
         
         assert result is not None
-        assert result["name"] == "requests"
         assert result["repository_url"] == "https://github.com/psf/requests"
         # API makes two calls: one for package info, one for version info
-        assert mock_get.call_count == 2
+        assert mocked_api.call_count == 2
         # Check that both package and version endpoints were called
-        call_urls = [call[0][0] for call in mock_get.call_args_list]
-        assert any("pypi.org/packages/requests" in url for url in call_urls)
+        call_urls = [request.url for request in mocked_api.request_history]
+        assert any(url.endswith("pypi.org/packages/requests") for url in call_urls)
         assert any("pypi.org/packages/requests/versions/2.28.0" in url for url in call_urls)
+        
+        metadata = ecosystems_api.extract_metadata(result)
+        assert metadata["description"] == "Python HTTP library"
+        assert metadata["repository"] == "https://github.com/psf/requests"
     
-    @patch('requests.get')
-    def test_get_package_info_without_version(self, mock_get):
+    @patch('requests.Session.get')
+    def test_get_package_info_without_version(self, mock_get, ecosystems_api, make_mock_response):
         """Test package info retrieval without version."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"name": "express"}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_mock_response(200, {"name": "express"})
         
-        api = EcosystemsAPI()
-        result = api.get_package_info(
+        result = ecosystems_api.get_package_info(
             PackageType.NPM,
             "express"
         )
@@ -225,13 +166,12 @@ class TestEcosystemsAPI:
         assert "npmjs.org/packages/express" in mock_get.call_args[0][0]
         assert "/versions/" not in mock_get.call_args[0][0]
     
-    @patch('requests.get')
-    def test_get_package_info_network_error(self, mock_get):
+    @patch('requests.Session.get')
+    def test_get_package_info_network_error(self, mock_get, ecosystems_api):
         """Test handling of network errors."""
         mock_get.side_effect = requests.RequestException("Network error")
         
-        api = EcosystemsAPI()
-        result = api.get_package_info(
+        result = ecosystems_api.get_package_info(
             PackageType.NPM,
             "express",
             "5.0.0"
@@ -239,20 +179,21 @@ class TestEcosystemsAPI:
         
         assert result is None
     
-    def test_map_package_type(self):
+    @pytest.mark.parametrize("package_type,expected", [
+        (PackageType.PYTHON_WHEEL, "pypi.org"),
+        (PackageType.PYTHON_SDIST, "pypi.org"),
+        (PackageType.NPM, "npmjs.org"),
+        (PackageType.MAVEN, "repo.maven.apache.org"),
+        (PackageType.JAR, "repo.maven.apache.org"),
+        (PackageType.UNKNOWN, None),
+    ])
+    def test_map_package_type(self, ecosystems_api, package_type, expected):
         """Test package type mapping to registry."""
-        api = EcosystemsAPI()
-        
-        assert api._map_package_type(PackageType.PYTHON_WHEEL) == "pypi.org"
-        assert api._map_package_type(PackageType.PYTHON_SDIST) == "pypi.org"
-        assert api._map_package_type(PackageType.NPM) == "npmjs.org"
-        assert api._map_package_type(PackageType.MAVEN) == "repo.maven.apache.org"
-        assert api._map_package_type(PackageType.JAR) == "repo.maven.apache.org"
-        assert api._map_package_type(PackageType.UNKNOWN) is None
+        assert ecosystems_api._map_package_type(package_type) == expected
     
-    def test_extract_metadata_full(self):
+    def test_extract_metadata_full(self, ecosystems_api):
         """Test metadata extraction with all fields."""
-        api = EcosystemsAPI()
+        api = ecosystems_api
         package_info = {
             "description": "Test package",
             "homepage": "https://example.com",
@@ -273,9 +214,9 @@ class TestEcosystemsAPI:
         assert metadata["keywords"] == ["test", "example"]
         assert metadata["maintainers"] == [{"name": "John Doe", "email": "john@example.com"}]
     
-    def test_extract_metadata_single_license(self):
+    def test_extract_metadata_single_license(self, ecosystems_api):
         """Test metadata extraction with single license field."""
-        api = EcosystemsAPI()
+        api = ecosystems_api
         package_info = {
             "license": "MIT"
         }
@@ -283,81 +224,15 @@ class TestEcosystemsAPI:
         metadata = api.extract_metadata(package_info)
         assert metadata["licenses"] == ["MIT"]
     
-    def test_extract_metadata_empty(self):
+    def test_extract_metadata_empty(self, ecosystems_api):
         """Test metadata extraction with empty input."""
-        api = EcosystemsAPI()
+        api = ecosystems_api
         metadata = api.extract_metadata({})
         assert metadata == {}
     
-    def test_extract_metadata_error_handling(self):
+    def test_extract_metadata_error_handling(self, ecosystems_api):
         """Test error handling in metadata extraction."""
-        api = EcosystemsAPI()
+        api = ecosystems_api
         # Pass invalid data that would cause an exception
         metadata = api.extract_metadata(None)
         assert metadata == {}
-
-
-class TestAPIIntegration:
-    """Test integration between APIs and extractors."""
-    
-    @patch('requests.get')
-    def test_clearlydefined_enrichment(self, mock_get):
-        """Test enriching metadata with ClearlyDefined."""
-        # Mock ClearlyDefined response
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "licensed": {
-                "declared": "Apache-2.0",
-                "facets": {
-                    "core": {
-                        "discovered": {
-                            "expressions": ["Apache-2.0"]
-                        }
-                    }
-                }
-            }
-        }
-        
-        api = ClearlyDefinedAPI()
-        definition = api.get_definition(
-            PackageType.PYTHON_WHEEL,
-            None,
-            "requests",
-            "2.28.0"
-        )
-        
-        license_info = api.extract_license_info(definition)
-        
-        assert license_info is not None
-        assert license_info["spdx_id"] == "Apache-2.0"
-        assert license_info["source"] == "ClearlyDefined"
-    
-    @patch('requests.get')
-    def test_ecosystems_enrichment(self, mock_get):
-        """Test enriching metadata with Ecosyste.ms."""
-        # Mock Ecosyste.ms response
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            "name": "express",
-            "description": "Fast, unopinionated web framework",
-            "repository_url": "https://github.com/expressjs/express",
-            "licenses": ["MIT"],
-            "keywords": ["express", "framework", "web"],
-            "maintainers": [
-                {"name": "Express Team"}
-            ]
-        }
-        
-        api = EcosystemsAPI()
-        package_info = api.get_package_info(
-            PackageType.NPM,
-            "express",
-            "4.18.0"
-        )
-        
-        metadata = api.extract_metadata(package_info)
-        
-        assert metadata["description"] == "Fast, unopinionated web framework"
-        assert metadata["repository"] == "https://github.com/expressjs/express"
-        assert "express" in metadata["keywords"]
-        assert len(metadata["maintainers"]) > 0
\ No newline at end of file
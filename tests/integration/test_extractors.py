@@ -1,44 +1,21 @@
 """Integration tests for package extractors."""
 
 import pytest
-import tempfile
-import zipfile
-import tarfile
-import json
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-from upmex.extractors.python_extractor import PythonExtractor
-from upmex.extractors.npm_extractor import NpmExtractor
+from unittest.mock import patch
+
 from upmex.extractors.java_extractor import JavaExtractor
 from upmex.core.models import PackageType
 
+from tests.archive_helpers import write_tar
+
 
 class TestPythonExtractor:
     """Test Python package extraction."""
-    
-    def test_extract_wheel_metadata(self, tmp_path):
+
+    def test_extract_wheel_metadata(self, sample_wheel, python_extractor):
         """Test extracting metadata from a wheel file."""
-        # Create a mock wheel file
-        wheel_path = tmp_path / "test-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            # Add METADATA file
-            metadata_content = """Metadata-Version: 2.1
-Name: test-package
-Version: 1.0.0
-Summary: A test package
-Author: Test Author
-Author-email: test@example.com
-License: MIT
-Classifier: Programming Language :: Python :: 3
-Requires-Dist: requests>=2.0.0
-"""
-            zf.writestr("test-1.0.0.dist-info/METADATA", metadata_content)
-        
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        
+        metadata = python_extractor.extract(str(sample_wheel))
+
         assert metadata.name == "test-package"
         assert metadata.version == "1.0.0"
         assert metadata.description == "A test package"
@@ -48,28 +25,10 @@ Requires-Dist: requests>=2.0.0
         assert metadata.authors[0]["email"] == "test@example.com"
         runtime_deps = metadata.dependencies.get("runtime", [])
         assert any("requests" in dep for dep in runtime_deps)
-    
-    def test_extract_sdist_metadata(self, tmp_path):
+
+    def test_extract_sdist_metadata(self, sample_sdist, python_extractor):
         """Test extracting metadata from sdist tar.gz."""
-        import io
-        sdist_path = tmp_path / "test-1.0.0.tar.gz"
-
-        # Create PKG-INFO content
-        pkg_info = """Metadata-Version: 2.1
-Name: test-sdist
-Version: 2.0.0
-Summary: Test sdist package
-Author: Sdist Author
-License: Apache-2.0
-"""
-
-        with tarfile.open(sdist_path, 'w:gz') as tf:
-            info = tarfile.TarInfo(name="test-1.0.0/PKG-INFO")
-            info.size = len(pkg_info.encode())
-            tf.addfile(info, fileobj=io.BytesIO(pkg_info.encode()))
-
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(sdist_path))
+        metadata = python_extractor.extract(str(sample_sdist))
 
         assert metadata.name == "test-sdist"
         assert metadata.version == "2.0.0"
@@ -78,45 +37,11 @@ License: Apache-2.0
 
 class TestNpmExtractor:
     """Test NPM package extraction."""
-    
-    def test_extract_npm_metadata(self, tmp_path):
+
+    def test_extract_npm_metadata(self, sample_npm_tgz, npm_extractor):
         """Test extracting metadata from npm tgz package."""
-        npm_path = tmp_path / "test-1.0.0.tgz"
-        
-        # Create package.json content
-        package_json = {
-            "name": "@scope/test-package",
-            "version": "1.0.0",
-            "description": "Test npm package",
-            "author": {
-                "name": "NPM Author",
-                "email": "npm@example.com"
-            },
-            "license": "ISC",
-            "repository": {
-                "type": "git",
-                "url": "https://github.com/test/repo.git"
-            },
-            "dependencies": {
-                "express": "^4.0.0"
-            },
-            "devDependencies": {
-                "jest": "^27.0.0"
-            },
-            "keywords": ["test", "npm"]
-        }
-        
-        # Create the tgz structure
-        import io
-        with tarfile.open(npm_path, 'w:gz') as tf:
-            info = tarfile.TarInfo(name="package/package.json")
-            content = json.dumps(package_json).encode()
-            info.size = len(content)
-            tf.addfile(info, fileobj=io.BytesIO(content))
-
-        extractor = NpmExtractor()
-        metadata = extractor.extract(str(npm_path))
-        
+        metadata = npm_extractor.extract(str(sample_npm_tgz))
+
         assert metadata.name == "@scope/test-package"
         assert metadata.version == "1.0.0"
         assert metadata.description == "Test npm package"
@@ -126,47 +51,25 @@ class TestNpmExtractor:
         assert "jest" in metadata.dependencies.get("dev", [])
         assert "test" in metadata.keywords
 
+    def test_extract_npm_metadata_with_bom(self, npm_extractor, tmp_path):
+        """Test that a package.json starting with a UTF-8 BOM still parses."""
+        package_json = b'\xef\xbb\xbf{"name": "bom-package", "version": "2.0.0"}'
+        tgz = tmp_path / "bom-package-2.0.0.tgz"
+        write_tar(tgz, {"package/package.json": package_json})
+
+        metadata = npm_extractor.extract(str(tgz))
+
+        assert metadata.name == "bom-package"
+        assert metadata.version == "2.0.0"
+
 
 class TestJavaExtractor:
     """Test Java/Maven package extraction."""
-    
-    def test_extract_maven_metadata(self, tmp_path):
+
+    def test_extract_maven_metadata(self, sample_maven_jar, java_extractor):
         """Test extracting metadata from Maven JAR."""
-        jar_path = tmp_path / "test-1.0.0.jar"
-        
-        # Create POM XML content
-        pom_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0">
-    <groupId>com.example</groupId>
-    <artifactId>test-artifact</artifactId>
-    <version>1.0.0</version>
-    <description>Test Maven package</description>
-    <url>https://example.com</url>
-    <developers>
-        <developer>
-            <name>Maven Developer</name>
-            <email>maven@example.com</email>
-        </developer>
-    </developers>
-    <scm>
-        <url>https://github.com/example/test.git</url>
-    </scm>
-    <dependencies>
-        <dependency>
-            <groupId>junit</groupId>
-            <artifactId>junit</artifactId>
-            <version>4.12</version>
-            <scope>test</scope>
-        </dependency>
-    </dependencies>
-</project>"""
-        
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/maven/com.example/test-artifact/pom.xml", pom_xml)
-        
-        extractor = JavaExtractor()
-        metadata = extractor.extract(str(jar_path))
-        
+        metadata = java_extractor.extract(str(sample_maven_jar))
+
         assert metadata.name == "com.example:test-artifact"
         assert metadata.version == "1.0.0"
         assert metadata.description == "Test Maven package"
@@ -176,23 +79,11 @@ class TestJavaExtractor:
         assert len(metadata.authors) > 0
         assert metadata.authors[0]["name"] == "Maven Developer"
         assert metadata.authors[0]["email"] == "maven@example.com"
-    
-    def test_extract_jar_manifest(self, tmp_path):
+
+    def test_extract_jar_manifest(self, sample_manifest_jar, java_extractor):
         """Test extracting from JAR with only MANIFEST.MF."""
-        jar_path = tmp_path / "simple.jar"
-        
-        manifest_content = """Manifest-Version: 1.0
-Implementation-Title: Simple JAR
-Implementation-Version: 2.0.0
-Implementation-Vendor: Test Vendor
-"""
-        
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/MANIFEST.MF", manifest_content)
-        
-        extractor = JavaExtractor()
-        metadata = extractor.extract(str(jar_path))
-        
+        metadata = java_extractor.extract(str(sample_manifest_jar))
+
         assert metadata.name == "Simple JAR"
         assert metadata.version == "2.0.0"
         assert metadata.package_type == PackageType.JAR
@@ -203,60 +94,85 @@ Implementation-Vendor: Test Vendor
 
 class TestRegistryMode:
     """Test registry mode functionality."""
-    
-    @patch('requests.get')
-    def test_maven_parent_pom_fetch(self, mock_get, tmp_path):
+
+    def test_maven_parent_pom_fetch(self, mocked_api, child_pom_jar):
         """Test fetching parent POM from Maven Central."""
-        jar_path = tmp_path / "child.jar"
-        
-        # Child POM with parent reference
-        child_pom = """<?xml version="1.0" encoding="UTF-8"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0">
-    <parent>
-        <groupId>org.springframework.boot</groupId>
-        <artifactId>spring-boot-starter-parent</artifactId>
-        <version>2.5.0</version>
-    </parent>
-    <artifactId>my-app</artifactId>
-</project>"""
-        
-        # Mock parent POM response
-        parent_pom = """<?xml version="1.0" encoding="UTF-8"?>
-<project xmlns="http://maven.apache.org/POM/4.0.0">
-    <groupId>org.springframework.boot</groupId>
-    <artifactId>spring-boot-starter-parent</artifactId>
-    <version>2.5.0</version>
-    <description>Parent POM for Spring Boot</description>
-</project>"""
-        
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.text = parent_pom
-        
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/maven/org.springframework.boot/my-app/pom.xml", child_pom)
-        
         extractor = JavaExtractor(registry_mode=True)
-        metadata = extractor.extract(str(jar_path))
-        
+        metadata = extractor.extract(str(child_pom_jar))
+
         assert metadata.name == "org.springframework.boot:my-app"
-        assert mock_get.called
+        assert mocked_api.called
 
+    def test_maven_parent_pom_from_cache(self, requests_mock, maven_pom_cache, child_pom_jar):
+        """Test that a cached parent POM is used without hitting Maven Central."""
+        extractor = JavaExtractor(registry_mode=True, cache_dir=str(maven_pom_cache))
+        with patch('upmex.extractors.java_extractor.requests.get') as mock_get:
+            metadata = extractor.extract(str(child_pom_jar))
 
-class TestExtractorAutoDetection:
-    """Test automatic package type detection and extraction."""
-    
-    def test_detect_and_extract_wheel(self, tmp_path):
-        """Test detection and extraction of wheel files."""
-        wheel_path = tmp_path / "package-1.0.0-py3-none-any.whl"
+        mock_get.assert_not_called()
+        assert metadata.name == "org.springframework.boot:my-app"
+        assert metadata.description == "Parent POM for Spring Boot"
+
+    def test_maven_parent_pom_written_to_cache(self, mocked_api, child_pom_jar, tmp_path):
+        """Test that a fetched parent POM is stored in the cache directory."""
+        extractor = JavaExtractor(registry_mode=True, cache_dir=str(tmp_path))
+        extractor.extract(str(child_pom_jar))
+
+        cached = tmp_path / "org.springframework.boot" / "spring-boot-starter-parent" / "2.5.0.pom"
+        assert cached.is_file()
+        assert b"Parent POM for Spring Boot" in cached.read_bytes()
+
+    @pytest.mark.parametrize("group_id, artifact_id, version", [
+        ("..", "..", "outside"),
+        ("com.example", "../../escape", "1.0"),
+        ("/etc", "passwd", "1.0"),
+        ("com.example", "lib", "1.0/../../x"),
+        ("com.example", "lib", "1.0\n"),
+    ])
+    def test_maven_parent_pom_rejects_unsafe_coordinates(self, tmp_path, group_id, artifact_id, version):
+        """Test that coordinates which could escape the cache directory are never used."""
+        cache_dir = tmp_path / "cache"
+        extractor = JavaExtractor(registry_mode=True, cache_dir=str(cache_dir))
+        with patch('upmex.extractors.java_extractor.requests.get') as mock_get:
+            assert extractor._load_parent_pom(group_id, artifact_id, version) is None
+
+        mock_get.assert_not_called()
+        assert list(tmp_path.rglob("*.pom")) == []
+
+    def test_maven_parent_pom_cache_write_leaves_no_temp_file(self, mocked_api, child_pom_jar, tmp_path):
+        """Test that the parent POM is written to the cache through a rename."""
+        extractor = JavaExtractor(registry_mode=True, cache_dir=str(tmp_path))
+        extractor.extract(str(child_pom_jar))
+
+        assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == ["2.5.0.pom"]
+
+    def test_maven_snapshot_parent_pom_not_cached(self, tmp_path):
+        """Test that -SNAPSHOT parent POMs are fetched every time and never cached."""
+        extractor = JavaExtractor(registry_mode=True, cache_dir=str(tmp_path))
+        with patch('upmex.extractors.java_extractor.requests.get') as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.content = b"<project/>"
+            extractor._load_parent_pom("com.example", "parent", "1.0-SNAPSHOT")
+            extractor._load_parent_pom("com.example", "parent", "1.0-SNAPSHOT")
+
+        assert mock_get.call_count == 2
+        assert list(tmp_path.rglob("*")) == []
+
+    def test_package_extractor_wires_maven_cache_dir(self, tmp_path):
+        """Test that the extraction cache_dir setting reaches the Java extractor."""
+        from upmex.core.extractor import PackageExtractor
 
-        # Create a minimal valid wheel file
-        import zipfile
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            zf.writestr("package/__init__.py", "")
-            zf.writestr("package-1.0.0.dist-info/METADATA", "Name: package\nVersion: 1.0.0\n")
+        extractor = PackageExtractor({"extraction": {"cache_dir": str(tmp_path), "cache_enabled": True}})
+        assert extractor.extractors[PackageType.MAVEN].cache_dir == tmp_path / "maven"
+
+        disabled = PackageExtractor({"extraction": {"cache_dir": str(tmp_path), "cache_enabled": False}})
+        assert disabled.extractors[PackageType.MAVEN].cache_dir is None
 
-        from upmex.core.extractor import PackageExtractor
 
-        extractor = PackageExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        assert metadata.package_type == PackageType.PYTHON_WHEEL
\ No newline at end of file
+class TestExtractorAutoDetection:
+    """Test automatic package type detection and extraction."""
+
+    def test_detect_and_extract_wheel(self, minimal_wheel, package_extractor):
+        """Test detection and extraction of wheel files."""
+        metadata = package_extractor.extract(str(minimal_wheel))
+        assert metadata.package_type == PackageType.PYTHON_WHEEL
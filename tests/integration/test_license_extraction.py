@@ -2,74 +2,122 @@
 
 import pytest
 import tempfile
-import zipfile
-import tarfile
 import json
 from pathlib import Path
 
-from upmex.core.extractor import PackageExtractor
-from upmex.extractors.python_extractor import PythonExtractor
-from upmex.extractors.npm_extractor import NpmExtractor
-from upmex.extractors.java_extractor import JavaExtractor
+from tests.archive_helpers import write_tar, write_zip
 
 
-class TestLicenseExtraction:
-    """Test license extraction from real package formats."""
-    
-    def test_python_wheel_license_extraction(self, tmp_path):
-        """Test extracting license from Python wheel."""
-        wheel_path = tmp_path / "test-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            # Add METADATA with license
-            metadata_content = """Metadata-Version: 2.1
+# Same LICENSE text as the committed e2e wheel fixture and the Ruby gem tests, so
+# the session-wide osslili cache scans it only once
+MIT_LICENSE_TEXT = "MIT License\n\nCopyright (c) 2024"
+
+# (case id, METADATA text, LICENSE file text or None, accepted SPDX ids for the
+# first detected license; empty means no license should be found)
+WHEEL_LICENSE_CASES = [
+    ("license-file", """Metadata-Version: 2.1
 Name: test-package
 Version: 1.0.0
 License: MIT
 Classifier: License :: OSI Approved :: MIT License
-"""
-            zf.writestr("test-1.0.0.dist-info/METADATA", metadata_content)
-            
-            # Add LICENSE file
-            zf.writestr("test-1.0.0.dist-info/LICENSE", "MIT License\n\nCopyright (c) 2024")
-        
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        
+""", MIT_LICENSE_TEXT, ("MIT",)),
+    ("dual", """Metadata-Version: 2.1
+Name: dual-licensed
+Version: 1.0.0
+License: MIT OR Apache-2.0
+Classifier: License :: OSI Approved :: MIT License
+Classifier: License :: OSI Approved :: Apache Software License
+""", None, ("MIT", "Apache-2.0")),
+    # No explicit License field, only classifier; BSD could be either variant
+    ("classifier", """Metadata-Version: 2.1
+Name: classifier-test
+Version: 1.0.0
+Classifier: Development Status :: 4 - Beta
+Classifier: License :: OSI Approved :: BSD License
+Classifier: Programming Language :: Python :: 3
+""", None, ("BSD-2-Clause", "BSD-3-Clause")),
+    ("no-license", """Metadata-Version: 2.1
+Name: no-license
+Version: 1.0.0
+Summary: Package without license
+""", None, ()),
+]
+
+
+# (package name, serialized package.json, expected SPDX id, minimum confidence);
+# the JSON is encoded once at import rather than in every test
+NPM_LICENSE_CASES = [
+    ("test-npm", json.dumps({
+        "name": "test-npm",
+        "version": "1.0.0",
+        "license": "Apache-2.0",
+        "description": "Test package"
+    }).encode(), "Apache-2.0", 0.6),
+    ("proprietary-package", json.dumps({
+        "name": "proprietary-package",
+        "version": "1.0.0",
+        "license": "Proprietary",
+        "private": True
+    }).encode(), "Proprietary", 0.0),
+]
+
+
+@pytest.fixture(scope="session", params=WHEEL_LICENSE_CASES, ids=[case[0] for case in WHEEL_LICENSE_CASES])
+def license_wheel(request, tmp_path_factory):
+    """Wheel for one license case, written once per session."""
+    case_id, metadata_content, license_text, expected = request.param
+    wheel_path = tmp_path_factory.mktemp("license-wheels") / f"{case_id}-1.0.0-py3-none-any.whl"
+
+    entries = {f"{case_id}-1.0.0.dist-info/METADATA": metadata_content}
+    if license_text is not None:
+        entries[f"{case_id}-1.0.0.dist-info/LICENSE"] = license_text
+
+    return write_zip(wheel_path, entries), expected
+
+
+@pytest.fixture(scope="session", params=NPM_LICENSE_CASES, ids=[case[0] for case in NPM_LICENSE_CASES])
+def npm_license_tarball(request, tmp_path_factory):
+    """Plain tar for one NPM license case, written once per session.
+
+    NpmExtractor opens tarballs with 'r:*', so an uncompressed .tar skips
+    gzip entirely.
+    """
+    name, package_json, expected_spdx, min_confidence = request.param
+    tar_path = tmp_path_factory.mktemp("npm-licenses") / f"{name}-1.0.0.tar"
+    write_tar(tar_path, {"package/package.json": package_json}, compress=False)
+    return tar_path, expected_spdx, min_confidence
+
+
+class TestLicenseExtraction:
+    """Test license extraction from real package formats."""
+    
+    def test_wheel_license_extraction(self, license_wheel, python_extractor):
+        """Test extracting licenses from wheel METADATA and LICENSE files."""
+        wheel_path, expected = license_wheel
+
+        metadata = python_extractor.extract(str(wheel_path))
+
+        if not expected:
+            assert len(metadata.licenses) == 0
+            return
+
         assert len(metadata.licenses) > 0
-        assert metadata.licenses[0].spdx_id == "MIT"
+        assert metadata.licenses[0].spdx_id in expected
         assert metadata.licenses[0].confidence >= 0.6
         assert metadata.licenses[0].detection_method in ["osslili_tag", "regex_field", "regex_pattern"]
     
-    def test_npm_package_license_extraction(self, tmp_path):
-        """Test extracting license from NPM package."""
-        tgz_path = tmp_path / "test-1.0.0.tgz"
-        
-        package_json = {
-            "name": "test-npm",
-            "version": "1.0.0",
-            "license": "Apache-2.0",
-            "description": "Test package"
-        }
+    def test_npm_license_extraction(self, npm_extractor, npm_license_tarball):
+        """Test extracting the license field from NPM packages."""
+        tar_path, expected_spdx, min_confidence = npm_license_tarball
         
-        with tarfile.open(tgz_path, 'w:gz') as tf:
-            import io
-            info = tarfile.TarInfo(name="package/package.json")
-            content = json.dumps(package_json).encode()
-            info.size = len(content)
-            tf.addfile(info, fileobj=io.BytesIO(content))
-        
-        extractor = NpmExtractor()
-        metadata = extractor.extract(str(tgz_path))
+        metadata = npm_extractor.extract(str(tar_path))
         
         assert len(metadata.licenses) > 0
-        assert metadata.licenses[0].spdx_id == "Apache-2.0"
-        assert metadata.licenses[0].confidence >= 0.6  # Adjusted for actual detection confidence
+        assert metadata.licenses[0].spdx_id == expected_spdx
+        assert metadata.licenses[0].confidence >= min_confidence
     
-    def test_maven_jar_license_extraction(self, tmp_path):
+    def test_maven_jar_license_extraction(self, tmp_path, java_extractor):
         """Test extracting license from Maven JAR."""
-        jar_path = tmp_path / "test-1.0.0.jar"
-        
         pom_xml = """<?xml version="1.0"?>
 <project>
     <groupId>com.example</groupId>
@@ -83,42 +131,16 @@ Classifier: License :: OSI Approved :: MIT License
     </licenses>
 </project>"""
         
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/maven/com.example/test/pom.xml", pom_xml)
+        jar_path = write_zip(tmp_path / "test-1.0.0.jar", {"META-INF/maven/com.example/test/pom.xml": pom_xml})
         
-        extractor = JavaExtractor()
-        metadata = extractor.extract(str(jar_path))
+        metadata = java_extractor.extract(str(jar_path))
         
         assert len(metadata.licenses) > 0
         assert metadata.licenses[0].spdx_id == "BSD-3-Clause"
         assert metadata.licenses[0].detection_method in ["osslili_tag", "regex_field", "regex_pattern"]
     
-    def test_dual_license_extraction(self, tmp_path):
-        """Test extracting dual licenses."""
-        wheel_path = tmp_path / "dual-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            metadata_content = """Metadata-Version: 2.1
-Name: dual-licensed
-Version: 1.0.0
-License: MIT OR Apache-2.0
-Classifier: License :: OSI Approved :: MIT License
-Classifier: License :: OSI Approved :: Apache Software License
-"""
-            zf.writestr("dual-1.0.0.dist-info/METADATA", metadata_content)
-        
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        
-        # Should detect at least one license
-        assert len(metadata.licenses) > 0
-        # First detected should be from the License field
-        assert metadata.licenses[0].spdx_id in ["MIT", "Apache-2.0"]
-    
-    def test_spdx_identifier_extraction(self, tmp_path):
+    def test_spdx_identifier_extraction(self, tmp_path, java_extractor):
         """Test extracting SPDX-License-Identifier."""
-        jar_path = tmp_path / "spdx-1.0.0.jar"
-        
         # POM with SPDX identifier in header comment
         pom_xml = """<?xml version="1.0"?>
 <!-- SPDX-License-Identifier: GPL-3.0 -->
@@ -128,96 +150,28 @@ Classifier: License :: OSI Approved :: Apache Software License
     <version>1.0.0</version>
 </project>"""
         
-        with zipfile.ZipFile(jar_path, 'w') as zf:
-            zf.writestr("META-INF/maven/com.example/spdx-test/pom.xml", pom_xml)
+        jar_path = write_zip(tmp_path / "spdx-1.0.0.jar", {"META-INF/maven/com.example/spdx-test/pom.xml": pom_xml})
         
-        extractor = JavaExtractor()
-        metadata = extractor.extract(str(jar_path))
+        metadata = java_extractor.extract(str(jar_path))
         
         # The Java extractor's header comment parsing should detect GPL-3.0
         # Even without explicit license tags
         if metadata.licenses:
             assert any(lic.spdx_id == "GPL-3.0" for lic in metadata.licenses)
     
-    def test_classifier_license_extraction(self, tmp_path):
-        """Test extracting license from Python classifiers."""
-        wheel_path = tmp_path / "classifier-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            # No explicit License field, only classifier
-            metadata_content = """Metadata-Version: 2.1
-Name: classifier-test
-Version: 1.0.0
-Classifier: Development Status :: 4 - Beta
-Classifier: License :: OSI Approved :: BSD License
-Classifier: Programming Language :: Python :: 3
-"""
-            zf.writestr("classifier-1.0.0.dist-info/METADATA", metadata_content)
-        
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        
-        assert len(metadata.licenses) > 0
-        # Should detect BSD (could be BSD-2-Clause or BSD-3-Clause)
-        assert "BSD" in metadata.licenses[0].spdx_id
-    
-    def test_no_license_extraction(self, tmp_path):
-        """Test when no license is present."""
-        wheel_path = tmp_path / "nolicense-1.0.0-py3-none-any.whl"
-        
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            metadata_content = """Metadata-Version: 2.1
-Name: no-license
-Version: 1.0.0
-Summary: Package without license
-"""
-            zf.writestr("nolicense-1.0.0.dist-info/METADATA", metadata_content)
-        
-        extractor = PythonExtractor()
-        metadata = extractor.extract(str(wheel_path))
-        
-        # Should have no licenses detected
-        assert len(metadata.licenses) == 0
-    
-    def test_proprietary_license_extraction(self, tmp_path):
-        """Test extracting proprietary license."""
-        tgz_path = tmp_path / "proprietary-1.0.0.tgz"
-        
-        package_json = {
-            "name": "proprietary-package",
-            "version": "1.0.0",
-            "license": "Proprietary",
-            "private": True
-        }
-        
-        with tarfile.open(tgz_path, 'w:gz') as tf:
-            import io
-            info = tarfile.TarInfo(name="package/package.json")
-            content = json.dumps(package_json).encode()
-            info.size = len(content)
-            tf.addfile(info, fileobj=io.BytesIO(content))
-        
-        extractor = NpmExtractor()
-        metadata = extractor.extract(str(tgz_path))
-        
-        assert len(metadata.licenses) > 0
-        assert metadata.licenses[0].spdx_id == "Proprietary"
-    
-    def test_full_pipeline_license_extraction(self, tmp_path):
+    def test_full_pipeline_license_extraction(self, tmp_path, package_extractor):
         """Test license extraction through the full pipeline."""
         wheel_path = tmp_path / "full-1.0.0-py3-none-any.whl"
         
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            metadata_content = """Metadata-Version: 2.1
+        metadata_content = """Metadata-Version: 2.1
 Name: full-test
 Version: 1.0.0
 License: ISC
 """
-            zf.writestr("full-1.0.0.dist-info/METADATA", metadata_content)
+        write_zip(wheel_path, {"full-1.0.0.dist-info/METADATA": metadata_content})
         
         # Use the main PackageExtractor
-        extractor = PackageExtractor()
-        metadata = extractor.extract(str(wheel_path))
+        metadata = package_extractor.extract(str(wheel_path))
         
         assert metadata.name == "full-test"
         # License extraction might require more complete metadata
@@ -0,0 +1,50 @@
+"""Tests for archive utility functions."""
+
+import io
+import tarfile
+import zipfile
+from unittest.mock import patch
+
+from upmex.utils.archive_utils import find_file_in_archive
+from upmex.utils.patterns import LICENSE_FILE_NAMES
+
+
+class TestFindFileInArchive:
+    """Test searching archives for files by name pattern."""
+
+    def test_zip_member_read_once_for_overlapping_patterns(self, tmp_path):
+        """Test that a member matching several patterns is only read once."""
+        archive = tmp_path / "pkg.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            # Matches both 'LICENSE' and 'LICENSE.txt'
+            zf.writestr("pkg/LICENSE.txt", "MIT License")
+            zf.writestr("pkg/NOTICE", "Notice")
+            zf.writestr("pkg/module.py", "")
+
+        with patch.object(zipfile.ZipFile, 'read', autospec=True,
+                          side_effect=lambda self, name: b"content") as mock_read:
+            results = find_file_in_archive(str(archive), LICENSE_FILE_NAMES, return_first=False)
+
+        assert set(results) == {"pkg/LICENSE.txt", "pkg/NOTICE"}
+        assert mock_read.call_count == 2
+
+    def test_tar_returns_all_matches(self, tmp_path):
+        """Test collecting every matching member from a tarball."""
+        archive = tmp_path / "pkg.tar"
+        with tarfile.open(archive, 'w') as tf:
+            for name, content in [("pkg/LICENSE.txt", b"MIT License"), ("pkg/COPYING", b"GPL")]:
+                info = tarfile.TarInfo(name=name)
+                info.size = len(content)
+                tf.addfile(info, fileobj=io.BytesIO(content))
+
+        results = find_file_in_archive(str(archive), LICENSE_FILE_NAMES, return_first=False)
+
+        assert results == {"pkg/LICENSE.txt": b"MIT License", "pkg/COPYING": b"GPL"}
+
+    def test_no_match_returns_none(self, tmp_path):
+        """Test that an archive without matches returns None."""
+        archive = tmp_path / "pkg.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr("pkg/module.py", "")
+
+        assert find_file_in_archive(str(archive), LICENSE_FILE_NAMES, return_first=False) is None
@@ -4,36 +4,80 @@ import json
 import pytest
 from pathlib import Path
 from click.testing import CliRunner
-from upmex.cli import cli
+from upmex.cli import cli, get_extractor
 from upmex.core.models import PackageMetadata, PackageType
 
+from tests.archive_helpers import write_zip
+
+
+# Placeholders substituted in EXTRACT_CASES argument lists
+SAMPLE = object()
+OUTPUT = object()
+
+
+def check_json(result, output_file):
+    data = json.loads(result.output)
+    assert data['package']['name'] == 'test-package'
+    assert data['package']['version'] == '1.0.0'
+    assert data['package']['type'] == 'python_wheel'
+
+
+def check_pretty(result, output_file):
+    assert '  "package"' in result.output  # Indented JSON
+    assert 'test-package' in result.output
+
+
+def check_text(result, output_file):
+    assert 'Package: test-package' in result.output
+    assert 'Version: 1.0.0' in result.output
+    assert 'Type: python_wheel' in result.output
+
+
+def check_output_file(result, output_file):
+    assert output_file.exists()
+    data = json.loads(output_file.read_text())
+    assert data['package']['name'] == 'test-package'
+
+
+def check_quiet(result, output_file):
+    assert 'Output written to' not in result.output
+
+
+EXTRACT_CASES = [
+    (['extract', SAMPLE], check_json),
+    (['extract', '--pretty', SAMPLE], check_pretty),
+    (['extract', '--format', 'text', SAMPLE], check_text),
+    (['extract', SAMPLE, '-o', OUTPUT], check_output_file),
+    (['--quiet', 'extract', SAMPLE, '-o', OUTPUT], check_quiet),
+]
+EXTRACT_IDS = ["json", "pretty", "text", "output-file", "quiet"]
+
 
 class TestCLI:
     """Test CLI commands."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def runner(self):
-        """Create a CLI runner."""
+        """Create a CLI runner shared by all CLI tests."""
         return CliRunner()
     
-    @pytest.fixture
-    def sample_package(self, tmp_path):
-        """Create a sample package file."""
-        import zipfile
-        
+    @pytest.fixture(scope="session")
+    def sample_package(self, tmp_path_factory):
+        """Create a sample package file shared read-only by all CLI tests."""
         # Create a minimal wheel file
-        wheel_path = tmp_path / "test_package-1.0.0-py3-none-any.whl"
-        with zipfile.ZipFile(wheel_path, 'w') as zf:
-            # Add minimal metadata
-            metadata = """Name: test-package
+        wheel_path = tmp_path_factory.mktemp("pkgs") / "test_package-1.0.0-py3-none-any.whl"
+        # Add minimal metadata
+        metadata = """Name: test-package
 Version: 1.0.0
 Summary: Test package for CLI testing
 Author: Test Author
 Author-email: test@example.com
 License: MIT
 """
-            zf.writestr("test_package-1.0.0.dist-info/METADATA", metadata)
-            zf.writestr("test_package/__init__.py", "# Test package")
+        write_zip(wheel_path, {
+            "test_package-1.0.0.dist-info/METADATA": metadata,
+            "test_package/__init__.py": "# Test package",
+        })
         
         return str(wheel_path)
     
@@ -81,49 +125,21 @@ License: MIT
         assert result.exit_code == 2  # Click returns 2 for invalid arguments
         assert 'Error' in result.output
     
-    def test_extract_command(self, runner, sample_package):
-        """Test extract command."""
-        result = runner.invoke(cli, ['extract', sample_package])
-        assert result.exit_code == 0
-        
-        # Parse JSON output
-        data = json.loads(result.output)
-        assert data['package']['name'] == 'test-package'
-        assert data['package']['version'] == '1.0.0'
-        assert data['package']['type'] == 'python_wheel'
-    
-    def test_extract_command_pretty(self, runner, sample_package):
-        """Test extract command with pretty print."""
-        result = runner.invoke(cli, ['extract', '--pretty', sample_package])
-        assert result.exit_code == 0
-        assert '  "package"' in result.output  # Indented JSON
-        assert 'test-package' in result.output
-    
-    def test_extract_command_text_format(self, runner, sample_package):
-        """Test extract command with text format."""
-        result = runner.invoke(cli, ['extract', '--format', 'text', sample_package])
-        assert result.exit_code == 0
-        assert 'Package: test-package' in result.output
-        assert 'Version: 1.0.0' in result.output
-        assert 'Type: python_wheel' in result.output
-    
-    def test_extract_with_output_file(self, runner, sample_package, tmp_path):
-        """Test extract command with output file."""
+    @pytest.mark.parametrize("args,check", EXTRACT_CASES, ids=EXTRACT_IDS)
+    def test_extract_variants(self, runner, sample_package, tmp_path, args, check):
+        """Test extract command output formats and options."""
         output_file = tmp_path / 'output.json'
-        result = runner.invoke(cli, ['extract', sample_package, '-o', str(output_file)])
+        args = [sample_package if a == SAMPLE else str(output_file) if a == OUTPUT else a
+                for a in args]
+        result = runner.invoke(cli, args)
         assert result.exit_code == 0
-        assert output_file.exists()
-        
-        # Check output file content
-        data = json.loads(output_file.read_text())
-        assert data['package']['name'] == 'test-package'
+        check(result, output_file)
     
-    def test_extract_quiet_mode(self, runner, sample_package, tmp_path):
-        """Test extract command in quiet mode."""
-        output_file = tmp_path / 'output.json'
-        result = runner.invoke(cli, ['--quiet', 'extract', sample_package, '-o', str(output_file)])
-        assert result.exit_code == 0
-        assert 'Output written to' not in result.output
+    def test_extractor_reused_across_invocations(self):
+        """Test that the CLI extractor is only rebuilt when config changes."""
+        first = get_extractor({"registry_mode": False})
+        assert get_extractor({"registry_mode": False}) is first
+        assert get_extractor({"registry_mode": True}) is not first
     
     def test_license_command(self, runner, sample_package):
         """Test license command."""
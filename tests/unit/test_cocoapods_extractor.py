@@ -1,8 +1,6 @@
 """Tests for CocoaPods extractor."""
 
 import json
-import tempfile
-import os
 from pathlib import Path
 from datetime import datetime
 
@@ -11,75 +9,70 @@ from src.upmex.extractors.cocoapods_extractor import CocoaPodsExtractor
 from src.upmex.core.models import PackageType, NO_ASSERTION
 
 
+# Alamofire .podspec.json serialized once at import
+ALAMOFIRE_PODSPEC_JSON = json.dumps({
+    "name": "Alamofire",
+    "version": "5.6.4",
+    "summary": "Elegant HTTP Networking in Swift",
+    "description": "Alamofire is an HTTP networking library written in Swift.",
+    "homepage": "https://github.com/Alamofire/Alamofire",
+    "license": {
+        "type": "MIT",
+        "file": "LICENSE"
+    },
+    "authors": {
+        "Alamofire Software Foundation": "info@alamofire.org"
+    },
+    "source": {
+        "git": "https://github.com/Alamofire/Alamofire.git",
+        "tag": "5.6.4"
+    },
+    "platforms": {
+        "ios": "10.0",
+        "osx": "10.12",
+        "tvos": "10.0",
+        "watchos": "3.0"
+    },
+    "dependencies": {
+        "runtime": [
+            "SwiftyJSON ~> 5.0"
+        ]
+    },
+    "frameworks": ["Foundation", "CFNetwork"]
+}).encode('utf-8')
+
+
 class TestCocoaPodsExtractor:
     """Test CocoaPods package extraction."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.extractor = CocoaPodsExtractor()
+    @classmethod
+    def setup_class(cls):
+        """Set up an extractor shared by all tests (extractors are stateless)."""
+        cls.extractor = CocoaPodsExtractor()
     
     def test_extract_json_podspec_metadata(self):
         """Test extracting metadata from .podspec.json file."""
-        podspec_json = {
-            "name": "Alamofire",
-            "version": "5.6.4",
-            "summary": "Elegant HTTP Networking in Swift",
-            "description": "Alamofire is an HTTP networking library written in Swift.",
-            "homepage": "https://github.com/Alamofire/Alamofire",
-            "license": {
-                "type": "MIT",
-                "file": "LICENSE"
-            },
-            "authors": {
-                "Alamofire Software Foundation": "info@alamofire.org"
-            },
-            "source": {
-                "git": "https://github.com/Alamofire/Alamofire.git",
-                "tag": "5.6.4"
-            },
-            "platforms": {
-                "ios": "10.0",
-                "osx": "10.12",
-                "tvos": "10.0",
-                "watchos": "3.0"
-            },
-            "dependencies": {
-                "runtime": [
-                    "SwiftyJSON ~> 5.0"
-                ]
-            },
-            "frameworks": ["Foundation", "CFNetwork"]
-        }
+        metadata = self.extractor.extract_from_bytes(ALAMOFIRE_PODSPEC_JSON, 'Pod.podspec.json')
+        
+        assert metadata.name == "Alamofire"
+        assert metadata.version == "5.6.4"
+        assert metadata.package_type == PackageType.COCOAPODS
+        assert metadata.description == "Alamofire is an HTTP networking library written in Swift."
+        assert metadata.homepage == "https://github.com/Alamofire/Alamofire"
+        assert metadata.repository == "https://github.com/Alamofire/Alamofire.git"
+        
+        # Check authors
+        assert len(metadata.authors) == 1
+        assert metadata.authors[0]['name'] == "Alamofire Software Foundation"
+        assert metadata.authors[0]['email'] == "info@alamofire.org"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec.json', delete=False) as f:
-            json.dump(podspec_json, f)
-            temp_path = f.name
+        # Check dependencies
+        assert "runtime" in metadata.dependencies
+        assert "SwiftyJSON ~> 5.0" in metadata.dependencies["runtime"]
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "Alamofire"
-            assert metadata.version == "5.6.4"
-            assert metadata.package_type == PackageType.COCOAPODS
-            assert metadata.description == "Alamofire is an HTTP networking library written in Swift."
-            assert metadata.homepage == "https://github.com/Alamofire/Alamofire"
-            assert metadata.repository == "https://github.com/Alamofire/Alamofire.git"
-            
-            # Check authors
-            assert len(metadata.authors) == 1
-            assert metadata.authors[0]['name'] == "Alamofire Software Foundation"
-            assert metadata.authors[0]['email'] == "info@alamofire.org"
-            
-            # Check dependencies
-            assert "runtime" in metadata.dependencies
-            assert "SwiftyJSON ~> 5.0" in metadata.dependencies["runtime"]
-            
-            # Check keywords (from platforms and frameworks)
-            assert "ios" in metadata.keywords
-            assert "Foundation" in metadata.keywords
-            
-        finally:
-            os.unlink(temp_path)
+        # Check keywords (from platforms and frameworks)
+        assert "ios" in metadata.keywords
+        assert "Foundation" in metadata.keywords
     
     def test_extract_ruby_podspec_metadata(self):
         """Test extracting metadata from .podspec Ruby DSL file."""
@@ -109,38 +102,30 @@ Pod::Spec.new do |s|
 end
 '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec', delete=False) as f:
-            f.write(podspec_content)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(podspec_content.encode('utf-8'), 'Pod.podspec')
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "AFNetworking"
-            assert metadata.version == "4.0.1"
-            assert metadata.package_type == PackageType.COCOAPODS
-            assert "AFNetworking is a delightful iOS and OS X networking framework" in metadata.description
-            assert metadata.homepage == "https://github.com/AFNetworking/AFNetworking"
-            assert metadata.repository == "https://github.com/AFNetworking/AFNetworking.git"
-            
-            # Check authors
-            assert len(metadata.authors) == 2
-            author_names = [author['name'] for author in metadata.authors]
-            assert "Matt Thompson" in author_names
-            assert "Alamofire Software Foundation" in author_names
-            
-            # Check dependencies
-            assert "runtime" in metadata.dependencies
-            deps = metadata.dependencies["runtime"]
-            assert any("Reachability" in dep for dep in deps)
-            assert any("Security" in dep for dep in deps)
-            
-            # Check keywords from frameworks
-            assert "Foundation" in metadata.keywords
-            assert "UIKit" in metadata.keywords
-            
-        finally:
-            os.unlink(temp_path)
+        assert metadata.name == "AFNetworking"
+        assert metadata.version == "4.0.1"
+        assert metadata.package_type == PackageType.COCOAPODS
+        assert "AFNetworking is a delightful iOS and OS X networking framework" in metadata.description
+        assert metadata.homepage == "https://github.com/AFNetworking/AFNetworking"
+        assert metadata.repository == "https://github.com/AFNetworking/AFNetworking.git"
+        
+        # Check authors
+        assert len(metadata.authors) == 2
+        author_names = [author['name'] for author in metadata.authors]
+        assert "Matt Thompson" in author_names
+        assert "Alamofire Software Foundation" in author_names
+        
+        # Check dependencies
+        assert "runtime" in metadata.dependencies
+        deps = metadata.dependencies["runtime"]
+        assert any("Reachability" in dep for dep in deps)
+        assert any("Security" in dep for dep in deps)
+        
+        # Check keywords from frameworks
+        assert "Foundation" in metadata.keywords
+        assert "UIKit" in metadata.keywords
     
     def test_extract_minimal_podspec(self):
         """Test extracting metadata from minimal .podspec file."""
@@ -156,27 +141,19 @@ Pod::Spec.new do |s|
 end
 '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec', delete=False) as f:
-            f.write(podspec_content)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(podspec_content.encode('utf-8'), 'Pod.podspec')
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "SimpleLib"
-            assert metadata.version == "1.0.0"
-            assert metadata.package_type == PackageType.COCOAPODS
-            assert metadata.description == "A simple library"
-            assert metadata.homepage == "https://example.com"
-            assert metadata.repository == "https://example.com/SimpleLib.git"
-            
-            # Check single author (string format)
-            assert len(metadata.authors) == 1
-            assert metadata.authors[0]['name'] == "Developer"
-            assert metadata.authors[0]['email'] == NO_ASSERTION
-            
-        finally:
-            os.unlink(temp_path)
+        assert metadata.name == "SimpleLib"
+        assert metadata.version == "1.0.0"
+        assert metadata.package_type == PackageType.COCOAPODS
+        assert metadata.description == "A simple library"
+        assert metadata.homepage == "https://example.com"
+        assert metadata.repository == "https://example.com/SimpleLib.git"
+        
+        # Check single author (string format)
+        assert len(metadata.authors) == 1
+        assert metadata.authors[0]['name'] == "Developer"
+        assert metadata.authors[0]['email'] == NO_ASSERTION
     
     def test_extract_with_string_license(self):
         """Test extracting metadata with string license format."""
@@ -191,30 +168,22 @@ end
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec.json', delete=False) as f:
-            json.dump(podspec_json, f)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(json.dumps(podspec_json).encode('utf-8'), 'Pod.podspec.json')
+        
+        assert metadata.name == "TestPod"
+        assert metadata.version == "2.0.0"
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "TestPod"
-            assert metadata.version == "2.0.0"
-            
-            # Check license detection
-            assert len(metadata.licenses) > 0
-            # Should detect Apache-2.0
-            license_ids = [license.spdx_id for license in metadata.licenses]
-            assert "Apache-2.0" in license_ids
-            
-            # Check authors array format
-            assert len(metadata.authors) == 2
-            author_names = [author['name'] for author in metadata.authors]
-            assert "Dev One" in author_names
-            assert "Dev Two" in author_names
-            
-        finally:
-            os.unlink(temp_path)
+        # Check license detection
+        assert len(metadata.licenses) > 0
+        # Should detect Apache-2.0
+        license_ids = [license.spdx_id for license in metadata.licenses]
+        assert "Apache-2.0" in license_ids
+        
+        # Check authors array format
+        assert len(metadata.authors) == 2
+        author_names = [author['name'] for author in metadata.authors]
+        assert "Dev One" in author_names
+        assert "Dev Two" in author_names
     
     def test_extract_with_http_source(self):
         """Test extracting metadata with HTTP source."""
@@ -227,19 +196,11 @@ Pod::Spec.new do |s|
 end
 '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec', delete=False) as f:
-            f.write(podspec_content)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(podspec_content.encode('utf-8'), 'Pod.podspec')
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "HttpPod"
-            assert metadata.version == "1.5.0"
-            assert metadata.repository == "https://example.com/download/HttpPod-1.5.0.tar.gz"
-            
-        finally:
-            os.unlink(temp_path)
+        assert metadata.name == "HttpPod"
+        assert metadata.version == "1.5.0"
+        assert metadata.repository == "https://example.com/download/HttpPod-1.5.0.tar.gz"
     
     def test_extract_with_platform_requirements(self):
         """Test extracting metadata with platform requirements."""
@@ -256,50 +217,55 @@ Pod::Spec.new do |s|
 end
 '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec', delete=False) as f:
-            f.write(podspec_content)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(podspec_content.encode('utf-8'), 'Pod.podspec')
+        
+        assert metadata.name == "PlatformPod"
+        assert metadata.version == "3.0.0"
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "PlatformPod"
-            assert metadata.version == "3.0.0"
-            
-            # Check that platform names are in keywords
-            assert "ios" in metadata.keywords
-            assert "osx" in metadata.keywords
-            assert "tvos" in metadata.keywords
-            assert "watchos" in metadata.keywords
-            
-            # Check raw metadata contains platform info
-            assert "platforms" in metadata.raw_metadata
-            platforms = metadata.raw_metadata["platforms"]
-            assert platforms["ios"] == "12.0"
-            assert platforms["osx"] == "10.14"
-            
-        finally:
-            os.unlink(temp_path)
+        # Check that platform names are in keywords
+        assert "ios" in metadata.keywords
+        assert "osx" in metadata.keywords
+        assert "tvos" in metadata.keywords
+        assert "watchos" in metadata.keywords
+        
+        # Check raw metadata contains platform info
+        assert "platforms" in metadata.raw_metadata
+        platforms = metadata.raw_metadata["platforms"]
+        assert platforms["ios"] == "12.0"
+        assert platforms["osx"] == "10.14"
+    
+    def test_deployment_target_overrides_platform(self):
+        """Test that deployment targets take precedence over s.platform."""
+        podspec_content = '''
+Pod::Spec.new do |s|
+  s.name = "MixedPod"
+  s.version = "1.0.0"
+  s.platform = :ios, "8.0"
+  s.ios.deployment_target = "10.0"
+  s.tvos_deployment_target = "11.0"
+  s.dependency "Alamofire", "~> 5.0"
+  s.dependency "SnapKit"
+end
+'''
+        
+        spec_data = self.extractor._parse_ruby_dsl(podspec_content)
+        
+        assert spec_data['name'] == "MixedPod"
+        assert spec_data['platforms'] == {"ios": "10.0", "tvos": "11.0"}
+        assert spec_data['dependencies']['runtime'] == ["Alamofire ~> 5.0", "SnapKit"]
     
     def test_extract_invalid_json(self):
         """Test handling of invalid JSON podspec."""
         invalid_json = '{"name": "Invalid", "version": "1.0.0"'  # Missing closing brace
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.podspec.json', delete=False) as f:
-            f.write(invalid_json)
-            temp_path = f.name
+        metadata = self.extractor.extract_from_bytes(invalid_json.encode('utf-8'), 'Pod.podspec.json')
         
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            # Should create minimal metadata with error
-            # The name should be derived from the temp filename, not the invalid JSON
-            assert metadata.version == NO_ASSERTION
-            assert metadata.package_type == PackageType.COCOAPODS
-            assert "extraction_error" in metadata.raw_metadata
-            
-        finally:
-            os.unlink(temp_path)
+        # Should create minimal metadata with error
+        # The name should be derived from the filename, not the invalid JSON
+        assert metadata.name == "Pod"
+        assert metadata.version == NO_ASSERTION
+        assert metadata.package_type == PackageType.COCOAPODS
+        assert "extraction_error" in metadata.raw_metadata
     
     def test_extract_nonexistent_file(self):
         """Test handling of nonexistent file."""
@@ -309,24 +275,11 @@ end
         assert metadata.version == NO_ASSERTION
         assert metadata.package_type == PackageType.COCOAPODS
     
-    def test_package_detection(self):
+    def test_package_detection(self, tmp_path):
         """Test that package detection works correctly."""
         from src.upmex.utils.package_detector import detect_package_type
         
-        # Test .podspec file
-        with tempfile.NamedTemporaryFile(suffix='.podspec', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            assert detect_package_type(temp_path) == PackageType.COCOAPODS
-        finally:
-            os.unlink(temp_path)
-        
-        # Test .podspec.json file
-        with tempfile.NamedTemporaryFile(suffix='.podspec.json', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            assert detect_package_type(temp_path) == PackageType.COCOAPODS
-        finally:
-            os.unlink(temp_path)
\ No newline at end of file
+        for name in ('Pod.podspec', 'Pod.podspec.json'):
+            podspec_path = tmp_path / name
+            podspec_path.touch()
+            assert detect_package_type(str(podspec_path)) == PackageType.COCOAPODS
@@ -1,25 +1,69 @@
 """Tests for Conda package extractor."""
 
+import io
 import json
 import tarfile
-import zipfile
-import tempfile
-import os
 import yaml
 from pathlib import Path
 from datetime import datetime
 
 import pytest
+from unittest.mock import patch
 from src.upmex.extractors.conda_extractor import CondaExtractor
 from src.upmex.core.models import PackageType, NO_ASSERTION
 
+from tests.archive_helpers import tar_bytes, zip_bytes
+
+
+# Recipe meta.yaml contents serialized once at import
+NUMPY_RECIPE_YAML = yaml.dump({
+    "about": {
+        "home": "https://numpy.org",
+        "summary": "Fundamental package for array computing in Python",
+        "license": "BSD-3-Clause",
+        "dev_url": "https://github.com/numpy/numpy"
+    },
+    "requirements": {
+        "build": ["cython"],
+        "host": ["python", "pip"],
+        "run": ["python", "libopenblas"]
+    },
+    "extra": {
+        "recipe-maintainers": ["rgommers", "charris"]
+    }
+})
+
+# Recipe with separate build/host/run requirements
+SKLEARN_RECIPE_YAML = yaml.dump({
+    "requirements": {
+        "build": [
+            "cython >=0.29.33",
+            "compiler_c",
+            "compiler_cxx"
+        ],
+        "host": [
+            "python",
+            "pip",
+            "numpy >=1.17.3"
+        ],
+        "run": [
+            "python",
+            "numpy >=1.17.3",
+            "scipy >=1.5.0",
+            "joblib >=1.1.1",
+            "threadpoolctl >=2.0.0"
+        ]
+    }
+})
+
 
 class TestCondaExtractor:
     """Test Conda package extraction."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.extractor = CondaExtractor()
+    @classmethod
+    def setup_class(cls):
+        """Set up an extractor shared by all tests (extractors are stateless)."""
+        cls.extractor = CondaExtractor()
     
     def test_extract_conda_format_metadata(self):
         """Test extracting metadata from .conda format (zip-based)."""
@@ -38,60 +82,33 @@ class TestCondaExtractor:
             "channel": "conda-forge"
         }
         
-        # Create recipe meta.yaml content
-        recipe_yaml = {
-            "about": {
-                "home": "https://numpy.org",
-                "summary": "Fundamental package for array computing in Python",
-                "license": "BSD-3-Clause",
-                "dev_url": "https://github.com/numpy/numpy"
-            },
-            "requirements": {
-                "build": ["cython"],
-                "host": ["python", "pip"],
-                "run": ["python", "libopenblas"]
-            },
-            "extra": {
-                "recipe-maintainers": ["rgommers", "charris"]
-            }
-        }
+        data = zip_bytes({
+            'info/index.json': json.dumps(index_json),
+            'info/recipe/meta.yaml': NUMPY_RECIPE_YAML,
+        })
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "numpy"
+        assert metadata.version == "1.24.3"
+        assert metadata.package_type == PackageType.CONDA
+        assert metadata.description == "Fundamental package for array computing in Python"
+        assert metadata.homepage == "https://numpy.org"
+        assert metadata.repository == "https://github.com/numpy/numpy"
+        
+        # Check dependencies (recipe takes precedence over index.json)
+        assert "runtime" in metadata.dependencies
+        assert "python" in metadata.dependencies["runtime"]
+        assert "libopenblas" in metadata.dependencies["runtime"]
+        
+        # Check authors
+        assert len(metadata.authors) == 2
+        author_names = [author['name'] for author in metadata.authors]
+        assert "rgommers" in author_names
+        assert "charris" in author_names
         
-        # Create a temporary .conda file
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            # Create the .conda package structure
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('info/index.json', json.dumps(index_json))
-                zf.writestr('info/recipe/meta.yaml', yaml.dump(recipe_yaml))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "numpy"
-            assert metadata.version == "1.24.3"
-            assert metadata.package_type == PackageType.CONDA
-            assert metadata.description == "Fundamental package for array computing in Python"
-            assert metadata.homepage == "https://numpy.org"
-            assert metadata.repository == "https://github.com/numpy/numpy"
-            
-            # Check dependencies (recipe takes precedence over index.json)
-            assert "runtime" in metadata.dependencies
-            assert "python" in metadata.dependencies["runtime"]
-            assert "libopenblas" in metadata.dependencies["runtime"]
-            
-            # Check authors
-            assert len(metadata.authors) == 2
-            author_names = [author['name'] for author in metadata.authors]
-            assert "rgommers" in author_names
-            assert "charris" in author_names
-            
-            # Check keywords
-            assert "conda-forge" in str(metadata.keywords)
-            assert "osx-64" in metadata.keywords
-            
-        finally:
-            os.unlink(temp_path)
+        # Check keywords
+        assert "conda-forge" in str(metadata.keywords)
+        assert "osx-64" in metadata.keywords
     
     def test_extract_tar_bz2_metadata(self):
         """Test extracting metadata from .tar.bz2 conda package."""
@@ -109,37 +126,97 @@ class TestCondaExtractor:
             "subdir": "linux-64"
         }
         
-        # Create temporary .tar.bz2 file
-        with tempfile.NamedTemporaryFile(suffix='.tar.bz2', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            # Create the .tar.bz2 package structure
-            with tarfile.open(temp_path, 'w:bz2') as tar:
-                # Add info/index.json
-                info = tarfile.TarInfo('info/index.json')
-                data = json.dumps(index_json).encode('utf-8')
-                info.size = len(data)
-                import io
-                tar.addfile(info, io.BytesIO(data))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "pandas"
-            assert metadata.version == "2.0.3"
-            assert metadata.package_type == PackageType.CONDA
-            
-            # Check dependencies
-            assert "runtime" in metadata.dependencies
-            deps = metadata.dependencies["runtime"]
-            assert any("numpy" in dep for dep in deps)
-            
-            # Check license
-            assert len(metadata.licenses) > 0
-            assert metadata.licenses[0].spdx_id == "BSD-3-Clause"
-            
-        finally:
-            os.unlink(temp_path)
+        # Build the .tar.bz2 package structure in memory
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:bz2', compresslevel=1) as tar:
+            info = tarfile.TarInfo('info/index.json')
+            data = json.dumps(index_json).encode('utf-8')
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        
+        metadata = self.extractor.extract_from_bytes(buffer.getvalue(), 'package.tar.bz2')
+        
+        assert metadata.name == "pandas"
+        assert metadata.version == "2.0.3"
+        assert metadata.package_type == PackageType.CONDA
+        
+        # Check dependencies
+        assert "runtime" in metadata.dependencies
+        deps = metadata.dependencies["runtime"]
+        assert any("numpy" in dep for dep in deps)
+        
+        # Check license
+        assert len(metadata.licenses) > 0
+        assert metadata.licenses[0].spdx_id == "BSD-3-Clause"
+    
+    def test_extract_tar_bz2_index_with_bom(self):
+        """Test that an info/index.json starting with a UTF-8 BOM still parses."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:bz2', compresslevel=1) as tar:
+            info = tarfile.TarInfo('info/index.json')
+            data = b'\xef\xbb\xbf' + json.dumps({"name": "pandas", "version": "2.0.3"}).encode('utf-8')
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        
+        metadata = self.extractor.extract_from_bytes(buffer.getvalue(), 'package.tar.bz2')
+        
+        assert metadata.name == "pandas"
+        assert metadata.version == "2.0.3"
+    
+    def test_extract_conda_v2_zstd_metadata(self):
+        """Test extracting metadata from a v2 .conda with an info-*.tar.zst member."""
+        zstd = pytest.importorskip("zstandard")
+        info_tar = tar_bytes({
+            'info/index.json': json.dumps({"name": "numpy", "version": "1.24.3"}).encode('utf-8'),
+            'info/recipe/meta.yaml': NUMPY_RECIPE_YAML.encode('utf-8'),
+        }, compress=False)
+        data = zip_bytes({
+            'metadata.json': json.dumps({"conda_pkg_format_version": 2}),
+            'info-numpy-1.24.3-0.tar.zst': zstd.ZstdCompressor(level=1).compress(info_tar),
+        })
+        
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "numpy"
+        assert metadata.version == "1.24.3"
+        assert metadata.homepage == "https://numpy.org"
+        assert metadata.repository == "https://github.com/numpy/numpy"
+    
+    def test_extract_tar_bz2_with_recipe_and_payload(self):
+        """Test reading info/ metadata from a .tar.bz2 package with payload files."""
+        index_json = {"name": "requests", "version": "2.31.0"}
+        recipe_yaml = {"about": {"summary": "HTTP for Humans", "home": "https://requests.readthedocs.io"}}
+        
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode='w:bz2', compresslevel=1) as tar:
+            for name, content in [
+                ('info/index.json', json.dumps(index_json).encode('utf-8')),
+                ('info/recipe/meta.yaml', yaml.dump(recipe_yaml).encode('utf-8')),
+                ('lib/python3.9/site-packages/requests/__init__.py', b'# payload'),
+            ]:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+        
+        metadata = self.extractor.extract_from_bytes(buffer.getvalue(), 'package.tar.bz2')
+        
+        assert metadata.name == "requests"
+        assert metadata.version == "2.31.0"
+        assert metadata.description == "HTTP for Humans"
+        assert metadata.homepage == "https://requests.readthedocs.io"
+    
+    def test_declared_spdx_license_skips_detection(self):
+        """Test that a canonical SPDX license resolves without running OSLiLi."""
+        data = zip_bytes({
+            'info/index.json': json.dumps({"name": "pkg", "version": "1.0", "license": "bsd-3-clause"}),
+        })
+        
+        with patch.object(self.extractor, 'detect_licenses_from_text') as mock_detect:
+            metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        mock_detect.assert_not_called()
+        assert metadata.licenses[0].spdx_id == "BSD-3-Clause"
+        assert metadata.licenses[0].detection_method == "spdx_id"
     
     def test_extract_with_recipe_json(self):
         """Test extracting metadata with recipe.json instead of meta.yaml."""
@@ -162,27 +239,20 @@ class TestCondaExtractor:
             }
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('info/index.json', json.dumps(index_json))
-                zf.writestr('info/recipe.json', json.dumps(recipe_json))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "scipy"
-            assert metadata.version == "1.11.1"
-            assert metadata.description == "Scientific Library for Python"
-            assert metadata.homepage == "https://scipy.org"
-            
-            # Check author extraction
-            assert len(metadata.authors) == 1
-            assert metadata.authors[0]['name'] == "SciPy Developers"
-            
-        finally:
-            os.unlink(temp_path)
+        data = zip_bytes({
+            'info/index.json': json.dumps(index_json),
+            'info/recipe.json': json.dumps(recipe_json),
+        })
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "scipy"
+        assert metadata.version == "1.11.1"
+        assert metadata.description == "Scientific Library for Python"
+        assert metadata.homepage == "https://scipy.org"
+        
+        # Check author extraction
+        assert len(metadata.authors) == 1
+        assert metadata.authors[0]['name'] == "SciPy Developers"
     
     def test_extract_minimal_metadata(self):
         """Test extracting minimal metadata from index.json only."""
@@ -193,26 +263,19 @@ class TestCondaExtractor:
             "build_number": 0
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('info/index.json', json.dumps(index_json))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "minimal-package"
-            assert metadata.version == "0.1.0"
-            assert metadata.package_type == PackageType.CONDA
-            assert metadata.description == NO_ASSERTION
-            
-            # Check raw metadata
-            assert metadata.raw_metadata['build'] == "0"
-            assert metadata.raw_metadata['build_number'] == 0
-            
-        finally:
-            os.unlink(temp_path)
+        data = zip_bytes({
+            'info/index.json': json.dumps(index_json),
+        })
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "minimal-package"
+        assert metadata.version == "0.1.0"
+        assert metadata.package_type == PackageType.CONDA
+        assert metadata.description == NO_ASSERTION
+        
+        # Check raw metadata
+        assert metadata.raw_metadata['build'] == "0"
+        assert metadata.raw_metadata['build_number'] == 0
     
     def test_extract_with_features(self):
         """Test extracting metadata with features and track_features."""
@@ -228,24 +291,33 @@ class TestCondaExtractor:
             ]
         }
         
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('info/index.json', json.dumps(index_json))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "tensorflow"
-            assert metadata.version == "2.13.0"
-            
-            # Check features in keywords
-            assert "gpu" in metadata.keywords
-            assert "tensorflow-gpu" in metadata.keywords
-            
-        finally:
-            os.unlink(temp_path)
+        data = zip_bytes({
+            'info/index.json': json.dumps(index_json),
+        })
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "tensorflow"
+        assert metadata.version == "2.13.0"
+        
+        # Check features in keywords
+        assert "gpu" in metadata.keywords
+        assert "tensorflow-gpu" in metadata.keywords
+    
+    def test_extract_with_string_track_features(self):
+        """Test that space-separated track_features strings become separate keywords."""
+        data = zip_bytes({
+            'info/index.json': json.dumps({
+                "name": "numpy",
+                "version": "1.24.3",
+                "subdir": "linux-64",
+                "features": "mkl",
+                "track_features": "mkl blas_mkl",
+            }),
+        })
+        
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.keywords == ["linux-64", "mkl", "blas_mkl"]
     
     def test_extract_with_detailed_requirements(self):
         """Test extracting metadata with detailed build/host/run requirements."""
@@ -255,138 +327,78 @@ class TestCondaExtractor:
             "build": "py39h1234567_0"
         }
         
-        recipe_yaml = {
-            "requirements": {
-                "build": [
-                    "cython >=0.29.33",
-                    "compiler_c",
-                    "compiler_cxx"
-                ],
-                "host": [
-                    "python",
-                    "pip",
-                    "numpy >=1.17.3"
-                ],
-                "run": [
-                    "python",
-                    "numpy >=1.17.3",
-                    "scipy >=1.5.0",
-                    "joblib >=1.1.1",
-                    "threadpoolctl >=2.0.0"
-                ]
-            }
-        }
+        data = zip_bytes({
+            'info/index.json': json.dumps(index_json),
+            'info/recipe/meta.yaml': SKLEARN_RECIPE_YAML,
+        })
+        metadata = self.extractor.extract_from_bytes(data, 'package.conda')
+        
+        assert metadata.name == "scikit-learn"
+        assert metadata.version == "1.3.0"
+        
+        # Check different dependency types
+        assert "build" in metadata.dependencies
+        assert "host" in metadata.dependencies
+        assert "runtime" in metadata.dependencies
         
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            with zipfile.ZipFile(temp_path, 'w') as zf:
-                zf.writestr('info/index.json', json.dumps(index_json))
-                zf.writestr('info/recipe/meta.yaml', yaml.dump(recipe_yaml))
-            
-            metadata = self.extractor.extract(temp_path)
-            
-            assert metadata.name == "scikit-learn"
-            assert metadata.version == "1.3.0"
-            
-            # Check different dependency types
-            assert "build" in metadata.dependencies
-            assert "host" in metadata.dependencies
-            assert "runtime" in metadata.dependencies
-            
-            # Check specific dependencies
-            build_deps = metadata.dependencies["build"]
-            assert any("cython" in dep for dep in build_deps)
-            
-            runtime_deps = metadata.dependencies["runtime"]
-            assert any("scipy" in dep for dep in runtime_deps)
-            assert any("joblib" in dep for dep in runtime_deps)
-            
-        finally:
-            os.unlink(temp_path)
+        # Check specific dependencies
+        build_deps = metadata.dependencies["build"]
+        assert any("cython" in dep for dep in build_deps)
+        
+        runtime_deps = metadata.dependencies["runtime"]
+        assert any("scipy" in dep for dep in runtime_deps)
+        assert any("joblib" in dep for dep in runtime_deps)
+    
+    @pytest.fixture
+    def conda_tar_bz2(self, tmp_path):
+        """Write a minimal .tar.bz2 conda package to the test's tmp_path."""
+        tar_path = tmp_path / 'package.tar.bz2'
+        with tarfile.open(tar_path, 'w:bz2', compresslevel=1) as tar:
+            info = tarfile.TarInfo('info/index.json')
+            data = b'{}'
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+        return str(tar_path)
     
-    def test_can_extract(self):
+    def test_can_extract(self, tmp_path, conda_tar_bz2):
         """Test that can_extract correctly identifies Conda packages."""
         # Test .conda file
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            conda_path = f.name
-        
-        try:
-            assert self.extractor.can_extract(conda_path) == True
-        finally:
-            os.unlink(conda_path)
+        conda_path = tmp_path / 'package.conda'
+        conda_path.touch()
+        assert self.extractor.can_extract(str(conda_path)) == True
         
         # Test .tar.bz2 with conda structure
-        with tempfile.NamedTemporaryFile(suffix='.tar.bz2', delete=False) as f:
-            tar_path = f.name
-        
-        try:
-            # Create conda package structure
-            with tarfile.open(tar_path, 'w:bz2') as tar:
-                info = tarfile.TarInfo('info/index.json')
-                data = b'{}'
-                info.size = len(data)
-                import io
-                tar.addfile(info, io.BytesIO(data))
-            
-            assert self.extractor.can_extract(tar_path) == True
-        finally:
-            os.unlink(tar_path)
+        assert self.extractor.can_extract(conda_tar_bz2) == True
         
         # Test non-conda file
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as f:
-            zip_path = f.name
+        zip_path = tmp_path / 'package.zip'
+        zip_path.touch()
+        assert self.extractor.can_extract(str(zip_path)) == False
+    
+    def test_can_extract_rejects_non_bzip2(self, tmp_path):
+        """Test that a .tar.bz2 name without bzip2 content is rejected."""
+        fake = tmp_path / 'package.tar.bz2'
+        fake.write_bytes(b'PK\x03\x04 not a bzip2 stream')
         
-        try:
-            assert self.extractor.can_extract(zip_path) == False
-        finally:
-            os.unlink(zip_path)
+        assert self.extractor.can_extract(str(fake)) == False
     
     def test_extract_invalid_package(self):
         """Test handling of invalid package files."""
-        # Create an invalid .conda file
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            f.write(b'invalid zip content')
-            temp_path = f.name
-        
-        try:
-            metadata = self.extractor.extract(temp_path)
-            
-            # Should create minimal metadata with error
-            assert metadata.package_type == PackageType.CONDA
-            assert metadata.version == NO_ASSERTION
-            assert "extraction_error" in metadata.raw_metadata
-            
-        finally:
-            os.unlink(temp_path)
+        metadata = self.extractor.extract_from_bytes(b'invalid zip content', 'package.conda')
+        
+        # Should create minimal metadata with error
+        assert metadata.package_type == PackageType.CONDA
+        assert metadata.version == NO_ASSERTION
+        assert "extraction_error" in metadata.raw_metadata
     
-    def test_package_detection(self):
+    def test_package_detection(self, tmp_path, conda_tar_bz2):
         """Test that package detection works correctly."""
         from src.upmex.utils.package_detector import detect_package_type
         
         # Test .conda file
-        with tempfile.NamedTemporaryFile(suffix='.conda', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            assert detect_package_type(temp_path) == PackageType.CONDA
-        finally:
-            os.unlink(temp_path)
+        conda_path = tmp_path / 'package.conda'
+        conda_path.touch()
+        assert detect_package_type(str(conda_path)) == PackageType.CONDA
         
         # Test .tar.bz2 conda package
-        with tempfile.NamedTemporaryFile(suffix='.tar.bz2', delete=False) as f:
-            tar_path = f.name
-        
-        try:
-            # Create conda package structure
-            with tarfile.open(tar_path, 'w:bz2') as tar:
-                info = tarfile.TarInfo('info/index.json')
-                data = b'{}'
-                info.size = len(data)
-                import io
-                tar.addfile(info, io.BytesIO(data))
-            
-            assert detect_package_type(tar_path) == PackageType.CONDA
-        finally:
-            os.unlink(tar_path)
\ No newline at end of file
+        assert detect_package_type(conda_tar_bz2) == PackageType.CONDA
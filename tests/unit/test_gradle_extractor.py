@@ -6,19 +6,17 @@ from upmex.extractors.gradle_extractor import GradleExtractor
 from upmex.core.models import PackageType
 
 
-class TestGradleExtractor:
-    """Test Gradle extractor functionality."""
-    
-    @pytest.fixture
-    def extractor(self):
-        """Create a Gradle extractor instance."""
-        return GradleExtractor()
-    
-    @pytest.fixture
-    def sample_gradle_groovy(self, tmp_path):
-        """Create a sample build.gradle file (Groovy DSL)."""
-        gradle_file = tmp_path / "build.gradle"
-        gradle_file.write_text("""
+@pytest.fixture(scope="module")
+def extractor():
+    """Create a Gradle extractor instance."""
+    return GradleExtractor()
+
+
+@pytest.fixture(scope="module")
+def sample_gradle_groovy(tmp_path_factory):
+    """Create a sample build.gradle file (Groovy DSL)."""
+    gradle_file = tmp_path_factory.mktemp("groovy") / "build.gradle"
+    gradle_file.write_text("""
 plugins {
     id 'java'
     id 'maven-publish'
@@ -68,13 +66,14 @@ publishing {
     }
 }
 """)
-        return str(gradle_file)
-    
-    @pytest.fixture
-    def sample_gradle_kotlin(self, tmp_path):
-        """Create a sample build.gradle.kts file (Kotlin DSL)."""
-        gradle_file = tmp_path / "build.gradle.kts"
-        gradle_file.write_text("""
+    return str(gradle_file)
+
+
+@pytest.fixture(scope="module")
+def sample_gradle_kotlin(tmp_path_factory):
+    """Create a sample build.gradle.kts file (Kotlin DSL)."""
+    gradle_file = tmp_path_factory.mktemp("kotlin") / "build.gradle.kts"
+    gradle_file.write_text("""
 plugins {
     kotlin("jvm") version "1.9.0"
     `maven-publish`
@@ -120,7 +119,11 @@ publishing {
     }
 }
 """)
-        return str(gradle_file)
+    return str(gradle_file)
+
+
+class TestGradleExtractor:
+    """Test Gradle extractor functionality."""
     
     def test_can_extract_gradle_groovy(self, extractor, sample_gradle_groovy):
         """Test that Gradle Groovy files are recognized."""
@@ -217,4 +220,30 @@ rootProject.name = 'my-project'
         metadata = extractor.extract(str(settings_file))
         
         assert metadata.package_type == PackageType.GRADLE
-        assert metadata.name == "my-project"
\ No newline at end of file
+        assert metadata.name == "my-project"
+    
+    def test_extract_settings_gradle_name_and_version_only(self, extractor, tmp_path):
+        """Test that settings scripts yield only name and version, even with build-script fields."""
+        settings_file = tmp_path / "settings.gradle.kts"
+        settings_file.write_text("""
+rootProject.name = "my-project"
+version = "1.2.3"
+group = "com.example"
+description = "Not a build script"
+
+dependencies {
+    implementation("com.example:lib:1.0")
+}
+""")
+        
+        metadata = extractor.extract(str(settings_file))
+        
+        assert metadata.name == "my-project"
+        assert metadata.version == "1.2.3"
+        assert metadata.description is None
+        assert metadata.repository is None
+        assert metadata.homepage is None
+        assert not metadata.dependencies
+        assert not metadata.authors
+        assert not metadata.licenses
+        assert not metadata.keywords
\ No newline at end of file
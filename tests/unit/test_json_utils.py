@@ -0,0 +1,58 @@
+"""Tests for the shared JSON helpers."""
+
+import json
+
+import pytest
+
+from upmex.utils import json_utils
+from upmex.utils.json_utils import loads, dumps
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without orjson."""
+    if request.param and not json_utils.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_utils, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestLoads:
+    """Test JSON parsing."""
+
+    def test_bytes_and_str(self, json_backend):
+        """Test that bytes and str documents parse the same."""
+        assert loads(b'{"name": "pkg"}') == loads('{"name": "pkg"}') == {"name": "pkg"}
+
+    def test_utf8_bom(self, json_backend):
+        """Test that a UTF-8 byte order mark is accepted on bytes input."""
+        assert loads(b'\xef\xbb\xbf{"name": "pkg"}') == {"name": "pkg"}
+
+    def test_utf16_bytes(self, json_backend):
+        """Test that bytes in an encoding json detects are decoded."""
+        assert loads('{"name": "pkg"}'.encode("utf-16")) == {"name": "pkg"}
+
+    def test_invalid_json_raises_json_error(self, json_backend):
+        """Test that invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"name": ')
+
+
+class TestDumps:
+    """Test JSON serialization."""
+
+    def test_round_trip(self, json_backend):
+        """Test that serialized output parses back to the same object."""
+        data = {"name": "pkg", "version": "1.0.0", "keywords": ["a", "b"]}
+        assert json.loads(dumps(data)) == data
+        assert json.loads(dumps(data, indent=True, sort_keys=True)) == data
+
+    def test_matches_json_dumps(self, json_backend):
+        """Test that output is json.dumps' format with or without orjson."""
+        data = {"name": "caf\u00e9", "confidence": float("nan"), "tags": [1e-05]}
+        assert dumps(data) == json.dumps(data)
+        assert dumps(data, indent=True, sort_keys=True) == json.dumps(data, indent=2, sort_keys=True)
+
+    def test_indent_and_sort_keys(self, json_backend):
+        """Test two-space indentation with sorted keys."""
+        assert dumps({"b": 1, "a": [2]}, indent=True, sort_keys=True) == '{\n  "a": [\n    2\n  ],\n  "b": 1\n}'
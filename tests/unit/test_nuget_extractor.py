@@ -5,17 +5,20 @@ from pathlib import Path
 import tempfile
 import zipfile
 import xml.etree.ElementTree as ET
+from unittest.mock import patch
 
 from upmex.extractors.nuget_extractor import NuGetExtractor
-from upmex.core.models import PackageType, NO_ASSERTION
+from upmex.core.models import PackageType, NO_ASSERTION, LicenseInfo
+from tests.archive_helpers import write_zip
 
 
 class TestNuGetExtractor:
     """Test NuGet package extraction."""
     
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
         """Set up test fixtures."""
-        self.extractor = NuGetExtractor()
+        cls.extractor = NuGetExtractor()
     
     def test_detect_nuget_package_by_extension(self):
         """Test detecting NuGet package by .nupkg extension."""
@@ -47,7 +50,7 @@ class TestNuGetExtractor:
             </package>'''
             
             # Create .nupkg (ZIP file)
-            with zipfile.ZipFile(f.name, 'w') as zf:
+            with zipfile.ZipFile(f.name, 'w', zipfile.ZIP_STORED) as zf:
                 zf.writestr('TestPackage.nuspec', nuspec_content)
             
             # Extract metadata
@@ -89,7 +92,7 @@ class TestNuGetExtractor:
                 </metadata>
             </package>'''
             
-            with zipfile.ZipFile(f.name, 'w') as zf:
+            with zipfile.ZipFile(f.name, 'w', zipfile.ZIP_STORED) as zf:
                 zf.writestr('TestPackage.nuspec', nuspec_content)
             
             metadata = self.extractor.extract(f.name)
@@ -115,7 +118,7 @@ class TestNuGetExtractor:
                 </metadata>
             </package>'''
             
-            with zipfile.ZipFile(f.name, 'w') as zf:
+            with zipfile.ZipFile(f.name, 'w', zipfile.ZIP_STORED) as zf:
                 zf.writestr('TestPackage.nuspec', nuspec_content)
             
             metadata = self.extractor.extract(f.name)
@@ -124,4 +127,28 @@ class TestNuGetExtractor:
             assert len(metadata.licenses) == 1
             assert metadata.licenses[0].spdx_id == 'MIT'
             
-            Path(f.name).unlink()
\ No newline at end of file
+            Path(f.name).unlink()
+    
+    def test_extract_license_file_fallback(self, tmp_path):
+        """Test that a declared license file is read first when the nuspec has no expression."""
+        nuspec_content = '''<?xml version="1.0"?>
+        <package xmlns="http://schemas.microsoft.com/packaging/2013/05/nuspec.xsd">
+            <metadata>
+                <id>TestPackage</id>
+                <version>1.0.0</version>
+                <license type="file">docs\\EULA.txt</license>
+            </metadata>
+        </package>'''
+        package = write_zip(tmp_path / "TestPackage.1.0.0.nupkg", {
+            "TestPackage.nuspec": nuspec_content,
+            "LICENSE.txt": "Other license text",
+            "docs/EULA.txt": "MIT License text",
+            "lib/net6.0/TestPackage.dll": b"\0" * 16,
+        })
+        
+        mit = LicenseInfo(spdx_id="MIT")
+        with patch.object(self.extractor, 'detect_licenses_from_text', return_value=[mit]) as mock_detect:
+            metadata = self.extractor.extract(str(package))
+        
+        assert metadata.licenses == [mit]
+        mock_detect.assert_called_once_with("MIT License text", filename="docs/EULA.txt")
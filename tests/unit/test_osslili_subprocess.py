@@ -0,0 +1,122 @@
+"""Tests for the osslili subprocess detector and the session result cache."""
+
+import subprocess
+from unittest.mock import Mock, patch
+
+from upmex.licenses.osslili_subprocess import OssliliSubprocessDetector
+
+from tests.conftest import OssliliResultCache
+
+
+MIT_RESULT = {
+    "name": "MIT",
+    "spdx_id": "MIT",
+    "confidence": 1.0,
+    "confidence_level": "exact",
+    "source": "osslili_tag",
+}
+
+
+class TestOssliliFailures:
+    """Test that failed osslili runs are distinguishable from no match."""
+
+    def test_timeout_is_failure(self):
+        """Test that an osslili timeout is reported as a failure."""
+        detector = OssliliSubprocessDetector()
+
+        with patch('upmex.licenses.osslili_subprocess.subprocess.run',
+                   side_effect=subprocess.TimeoutExpired('osslili', 10)):
+            assert detector.scan_content("LICENSE", "MIT License") is None
+            assert detector.detect_from_file("LICENSE", "MIT License") == []
+
+    def test_nonzero_exit_is_failure(self):
+        """Test that a nonzero osslili exit status is reported as a failure."""
+        detector = OssliliSubprocessDetector()
+        failed = subprocess.CompletedProcess(['osslili'], 1, stdout='', stderr='boom')
+
+        with patch('upmex.licenses.osslili_subprocess.subprocess.run', return_value=failed):
+            assert detector.scan_content("LICENSE", "MIT License") is None
+
+    def test_no_match_is_empty(self):
+        """Test that a successful run without licenses returns an empty list."""
+        detector = OssliliSubprocessDetector()
+        done = subprocess.CompletedProcess(['osslili'], 0, stdout='{"scan_results": []}', stderr='')
+
+        with patch('upmex.licenses.osslili_subprocess.subprocess.run', return_value=done):
+            assert detector.scan_content("LICENSE", "no license here") == []
+
+    def test_none_content(self):
+        """Test that missing content returns no licenses without running osslili."""
+        detector = OssliliSubprocessDetector()
+
+        with patch('upmex.licenses.osslili_subprocess.subprocess.run') as mock_run:
+            assert detector.detect_from_file("LICENSE", None) == []
+
+        mock_run.assert_not_called()
+
+
+class TestOssliliResultCache:
+    """Test the session cache wrapped around scan_content in tests/conftest.py."""
+
+    def test_cache_hit_skips_scan(self, tmp_path):
+        """Test that identical content is only scanned once."""
+        scan = Mock(return_value=[{**MIT_RESULT, "file": "a/LICENSE"}])
+        cache = OssliliResultCache(scan, tmp_path)
+
+        first = cache("a/LICENSE", "MIT License")
+        second = cache("b/LICENSE", "MIT License")
+
+        assert scan.call_count == 1
+        assert first[0]["spdx_id"] == second[0]["spdx_id"] == "MIT"
+        # Cached results are reported against the requesting file
+        assert second[0]["file"] == "b/LICENSE"
+
+    def test_cache_keyed_on_suffix(self, tmp_path):
+        """Test that the same content under a different suffix is scanned again."""
+        scan = Mock(return_value=[])
+        cache = OssliliResultCache(scan, tmp_path)
+
+        cache("LICENSE", "MIT License")
+        cache("package.json", "MIT License")
+
+        assert scan.call_count == 2
+
+    def test_disk_cache_shared_between_workers(self, tmp_path):
+        """Test that a second cache reuses results written to the same directory."""
+        OssliliResultCache(Mock(return_value=[MIT_RESULT]), tmp_path)("LICENSE", "MIT License")
+        scan = Mock()
+
+        result = OssliliResultCache(scan, tmp_path)("LICENSE", "MIT License")
+
+        scan.assert_not_called()
+        assert result[0]["spdx_id"] == "MIT"
+
+    def test_failed_scan_not_cached(self, tmp_path):
+        """Test that a failed scan is retried instead of served as an empty result."""
+        scan = Mock(side_effect=[None, [MIT_RESULT]])
+        cache = OssliliResultCache(scan, tmp_path)
+
+        assert cache("LICENSE", "MIT License") is None
+        result = cache("LICENSE", "MIT License")
+
+        assert scan.call_count == 2
+        assert result[0]["spdx_id"] == "MIT"
+
+    def test_keyed_on_osslili_version(self, tmp_path):
+        """Test that upgrading osslili invalidates cached results."""
+        with patch('tests.conftest._osslili_version', return_value="1.0"):
+            OssliliResultCache(Mock(return_value=[MIT_RESULT]), tmp_path)("LICENSE", "MIT License")
+        scan = Mock(return_value=[])
+        with patch('tests.conftest._osslili_version', return_value="2.0"):
+            OssliliResultCache(scan, tmp_path)("LICENSE", "MIT License")
+
+        scan.assert_called_once()
+
+    def test_memo_evicts_least_recently_used(self, tmp_path):
+        """Test that the in-memory memo is bounded."""
+        cache = OssliliResultCache(Mock(return_value=[]), tmp_path, memo_size=2)
+
+        for text in ("first", "second", "third"):
+            cache("LICENSE", text)
+
+        assert [content for _, content in cache.memo] == ["second", "third"]
@@ -0,0 +1,53 @@
+"""Tests for output formatting."""
+
+import json
+
+import pytest
+
+from upmex.core.models import PackageMetadata, PackageType
+from upmex.utils import json_utils
+from upmex.utils.output_formatter import OutputFormatter
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without orjson."""
+    if request.param and not json_utils.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_utils, "HAS_ORJSON", request.param)
+    return request.param
+
+
+@pytest.fixture
+def metadata():
+    """Metadata with a non-ASCII description."""
+    return PackageMetadata(
+        name="café",
+        version="1.0.0",
+        package_type=PackageType.NPM,
+        description="Café utilities",
+    )
+
+
+class TestJsonOutput:
+    """Test that JSON output keeps its original format."""
+
+    def test_compact_json(self, json_backend, metadata):
+        """Test compact output uses json.dumps' separators and ASCII escaping."""
+        output = OutputFormatter().format(metadata, 'json')
+
+        assert output == json.dumps(metadata.to_dict())
+        assert '"name": "caf\\u00e9"' in output
+
+    def test_pretty_json(self, json_backend, metadata):
+        """Test pretty output is indented with sorted keys."""
+        output = OutputFormatter(pretty=True).format(metadata, 'json')
+
+        assert output == json.dumps(metadata.to_dict(), indent=2, sort_keys=True)
+
+    def test_format_dict(self, json_backend):
+        """Test dictionaries are serialized the same way as metadata."""
+        data = {"b": "é", "a": 1}
+
+        assert OutputFormatter().format_dict(data, 'json') == json.dumps(data)
+        assert OutputFormatter(pretty=True).format_dict(data, 'json') == json.dumps(data, indent=2, sort_keys=True)
@@ -1,10 +1,12 @@
 """Tests for package type detection."""
 
+import io
 import pytest
 import zipfile
 import tarfile
 import json
 from pathlib import Path
+from unittest.mock import patch
 from upmex.utils.package_detector import detect_package_type
 from upmex.core.models import PackageType
 
@@ -17,7 +19,7 @@ class TestPackageDetection:
         wheel_file = tmp_path / "test_package-1.0.0-py3-none-any.whl"
         
         # Create a minimal wheel file
-        with zipfile.ZipFile(wheel_file, 'w') as zf:
+        with zipfile.ZipFile(wheel_file, 'w', zipfile.ZIP_STORED) as zf:
             zf.writestr("test_package/__init__.py", "")
             zf.writestr("test_package-1.0.0.dist-info/METADATA", "Name: test-package")
         
@@ -29,7 +31,7 @@ class TestPackageDetection:
         sdist_file = tmp_path / "test_package-1.0.0.tar.gz"
         
         # Create a minimal sdist
-        with tarfile.open(sdist_file, 'w:gz') as tf:
+        with tarfile.open(sdist_file, 'w:gz', compresslevel=0) as tf:
             # Create PKG-INFO content
             pkg_info = "Name: test-package\nVersion: 1.0.0\n"
             
@@ -47,7 +49,7 @@ class TestPackageDetection:
         npm_file = tmp_path / "test-package-1.0.0.tgz"
         
         # Create a minimal NPM package
-        with tarfile.open(npm_file, 'w:gz') as tf:
+        with tarfile.open(npm_file, 'w:gz', compresslevel=0) as tf:
             package_json = json.dumps({
                 "name": "test-package",
                 "version": "1.0.0"
@@ -66,7 +68,7 @@ class TestPackageDetection:
         jar_file = tmp_path / "test.jar"
         
         # Create a minimal JAR file
-        with zipfile.ZipFile(jar_file, 'w') as zf:
+        with zipfile.ZipFile(jar_file, 'w', zipfile.ZIP_STORED) as zf:
             manifest = "Manifest-Version: 1.0\nMain-Class: com.example.Main\n"
             zf.writestr("META-INF/MANIFEST.MF", manifest)
         
@@ -78,7 +80,7 @@ class TestPackageDetection:
         jar_file = tmp_path / "maven-artifact.jar"
         
         # Create a Maven JAR with pom.xml
-        with zipfile.ZipFile(jar_file, 'w') as zf:
+        with zipfile.ZipFile(jar_file, 'w', zipfile.ZIP_STORED) as zf:
             manifest = "Manifest-Version: 1.0\n"
             zf.writestr("META-INF/MANIFEST.MF", manifest)
             
@@ -106,10 +108,36 @@ class TestPackageDetection:
         # Create a file with .whl extension but NPM content
         weird_file = tmp_path / "weird.whl"
         
-        with zipfile.ZipFile(weird_file, 'w') as zf:
+        with zipfile.ZipFile(weird_file, 'w', zipfile.ZIP_STORED) as zf:
             # Add NPM-like content to a .whl file
             zf.writestr("package.json", '{"name": "test"}')
         
         # Should still detect as wheel due to extension
         detected_type = detect_package_type(str(weird_file))
-        assert detected_type == PackageType.PYTHON_WHEEL
\ No newline at end of file
+        assert detected_type == PackageType.PYTHON_WHEEL
+
+    def test_detect_non_archive_with_archive_extension(self, tmp_path):
+        """Test that files without archive magic are not opened as archives."""
+        fake_tarball = tmp_path / "not-a-package-1.0.0.tar.gz"
+        fake_tarball.write_text("Some random content")
+        
+        with patch('upmex.utils.package_detector.tarfile.open') as mock_open:
+            detected_type = detect_package_type(str(fake_tarball))
+        
+        mock_open.assert_not_called()
+        assert detected_type == PackageType.UNKNOWN
+    
+    def test_detect_tarball_opened_once(self, tmp_path):
+        """Test that tarball classification decompresses the archive once."""
+        sdist_file = tmp_path / "test_package-1.0.0.tar.gz"
+        
+        with tarfile.open(sdist_file, 'w:gz') as tf:
+            for name in ("test_package-1.0.0/README", "test_package-1.0.0/PKG-INFO"):
+                info = tarfile.TarInfo(name=name)
+                tf.addfile(info, io.BytesIO(b""))
+        
+        with patch('upmex.utils.package_detector.tarfile.open', wraps=tarfile.open) as mock_open:
+            detected_type = detect_package_type(str(sdist_file))
+        
+        assert mock_open.call_count == 1
+        assert detected_type == PackageType.PYTHON_SDIST
@@ -0,0 +1,23 @@
+"""Tests for shared license file patterns."""
+
+import pytest
+
+from upmex.utils.patterns import is_license_file
+
+
+class TestIsLicenseFile:
+    """Test license file name recognition."""
+
+    @pytest.mark.parametrize("filename", [
+        "LICENSE", "license.txt", "Licence.md", "COPYING.LESSER", "NOTICE", "MIT-LICENSE.txt",
+    ])
+    def test_license_file_names(self, filename):
+        """Test names that are a license base name with at most one extension."""
+        assert is_license_file(filename)
+
+    @pytest.mark.parametrize("filename", [
+        "README.md", "LICENSES", "LICENSE-MIT", "LICENSE.tar.gz", "LICENSE.", "pkg/LICENSE",
+    ])
+    def test_other_file_names(self, filename):
+        """Test names that only resemble license files."""
+        assert not is_license_file(filename)
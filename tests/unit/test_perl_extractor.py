@@ -1,153 +1,137 @@
 """Tests for Perl/CPAN package extractor."""
 
 import os
-import io
 import json
-import tempfile
-import tarfile
+import pytest
 from unittest.mock import Mock, patch
 from src.upmex.extractors.perl_extractor import PerlExtractor
 from src.upmex.core.models import PackageType, NO_ASSERTION
+from tests.archive_helpers import tar_bytes
+
+
+META_JSON = {
+    "name": "Test-Module",
+    "version": "1.23",
+    "abstract": "A test Perl module",
+    "author": ["John Doe <john@example.com>"],
+    "license": ["perl_5"],
+    "prereqs": {
+        "runtime": {
+            "requires": {
+                "Moose": "2.0",
+                "JSON": "0"
+            }
+        },
+        "test": {
+            "requires": {
+                "Test::More": "0.96"
+            }
+        }
+    },
+    "resources": {
+        "homepage": "https://example.com",
+        "repository": {
+            "url": "https://github.com/user/test-module"
+        }
+    },
+    "keywords": ["testing", "module"]
+}
+
+META_YML = """---
+name: YAML-Module
+version: 2.34
+abstract: A YAML test module
+author:
+  - Jane Smith <jane@example.com>
+license: mit
+"""
+
+
+@pytest.fixture(scope="module")
+def meta_json_tarball(tmp_path_factory):
+    """Perl distribution tarball containing META.json."""
+    path = tmp_path_factory.mktemp("perl") / "Test-Module-1.23.tar.gz"
+    path.write_bytes(tar_bytes({
+        'Test-Module-1.23/META.json': json.dumps(META_JSON).encode('utf-8'),
+    }))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def meta_yml_tarball(tmp_path_factory):
+    """Perl distribution tarball containing META.yml."""
+    path = tmp_path_factory.mktemp("perl") / "YAML-Module-2.34.tar.gz"
+    path.write_bytes(tar_bytes({
+        'YAML-Module-2.34/META.yml': META_YML.encode('utf-8'),
+    }))
+    return str(path)
 
 
 class TestPerlExtractor:
     """Test Perl/CPAN package extraction."""
     
-    def setup_method(self):
+    @classmethod
+    def setup_class(cls):
         """Set up test fixtures."""
-        self.extractor = PerlExtractor()
+        cls.extractor = PerlExtractor()
     
-    def test_extract_perl_metadata_json(self):
+    def test_extract_perl_metadata_json(self, meta_json_tarball):
         """Test extracting metadata from Perl package with META.json."""
-        # Create test META.json content
-        meta_content = {
-            "name": "Test-Module",
-            "version": "1.23",
-            "abstract": "A test Perl module",
-            "author": ["John Doe <john@example.com>"],
-            "license": ["perl_5"],
-            "prereqs": {
-                "runtime": {
-                    "requires": {
-                        "Moose": "2.0",
-                        "JSON": "0"
-                    }
-                },
-                "test": {
-                    "requires": {
-                        "Test::More": "0.96"
-                    }
-                }
-            },
-            "resources": {
-                "homepage": "https://example.com",
-                "repository": {
-                    "url": "https://github.com/user/test-module"
-                }
-            },
-            "keywords": ["testing", "module"]
-        }
+        metadata = self.extractor.extract(meta_json_tarball)
         
-        # Create a temporary Perl package
-        import io
-        with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-            # Create tarball with META.json
-            with tarfile.open(tmp_path, 'w:gz') as tar:
-                # Create META.json
-                meta_info = tarfile.TarInfo(name='Test-Module-1.23/META.json')
-                meta_data = json.dumps(meta_content).encode('utf-8')
-                meta_info.size = len(meta_data)
-                tar.addfile(meta_info, fileobj=io.BytesIO(meta_data))
+        # Verify extraction
+        assert metadata.name == "Test-Module"
+        assert metadata.version == "1.23"
+        assert metadata.package_type == PackageType.PERL
+        assert metadata.description == "A test Perl module"
+        assert metadata.homepage == "https://example.com"
+        assert metadata.repository == "https://github.com/user/test-module"
+        assert metadata.keywords == ["testing", "module"]
         
-        try:
-            # Extract metadata
-            metadata = self.extractor.extract(tmp_path)
-            
-            # Verify extraction
-            assert metadata.name == "Test-Module"
-            assert metadata.version == "1.23"
-            assert metadata.package_type == PackageType.PERL
-            assert metadata.description == "A test Perl module"
-            assert metadata.homepage == "https://example.com"
-            assert metadata.repository == "https://github.com/user/test-module"
-            assert metadata.keywords == ["testing", "module"]
-            
-            # Check authors
-            assert len(metadata.authors) == 1
-            assert metadata.authors[0]['name'] == "John Doe"
-            assert metadata.authors[0]['email'] == "john@example.com"
-            
-            # Check license
-            assert len(metadata.licenses) == 1
-            assert metadata.licenses[0].spdx_id == "Artistic-1.0 OR GPL-1.0-or-later"
-            
-            # Check dependencies
-            deps = {d['name']: d['version'] for d in metadata.dependencies}
-            assert 'Moose' in deps
-            assert deps['Moose'] == '2.0'
-            assert 'Test::More' in deps
-            
-        finally:
-            os.unlink(tmp_path)
+        # Check authors
+        assert len(metadata.authors) == 1
+        assert metadata.authors[0]['name'] == "John Doe"
+        assert metadata.authors[0]['email'] == "john@example.com"
+        
+        # Check license
+        assert len(metadata.licenses) == 1
+        assert metadata.licenses[0].spdx_id == "Artistic-1.0 OR GPL-1.0-or-later"
+        
+        # Check dependencies
+        deps = {d['name']: d['version'] for d in metadata.dependencies}
+        assert 'Moose' in deps
+        assert deps['Moose'] == '2.0'
+        assert 'Test::More' in deps
     
-    def test_extract_perl_metadata_yml(self):
+    def test_extract_perl_metadata_yml(self, meta_yml_tarball):
         """Test extracting metadata from Perl package with META.yml."""
-        # Create a temporary Perl package with META.yml
-        with tempfile.NamedTemporaryFile(suffix='.tar.gz', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-            
-            # Create tarball with META.yml
-            with tarfile.open(tmp_path, 'w:gz') as tar:
-                # Create META.yml (basic format)
-                yml_content = """---
-name: YAML-Module
-version: 2.34
-abstract: A YAML test module
-author:
-  - Jane Smith <jane@example.com>
-license: mit
-"""
-                yml_info = tarfile.TarInfo(name='YAML-Module-2.34/META.yml')
-                yml_data = yml_content.encode('utf-8')
-                yml_info.size = len(yml_data)
-                tar.addfile(yml_info, fileobj=io.BytesIO(yml_data))
+        metadata = self.extractor.extract(meta_yml_tarball)
         
-        try:
-            # Extract metadata
-            metadata = self.extractor.extract(tmp_path)
-            
-            # Verify extraction (basic parsing without PyYAML)
-            assert metadata.package_type == PackageType.PERL
-            # Basic parsing will extract limited fields
-            
-        finally:
-            os.unlink(tmp_path)
+        # Verify extraction (basic parsing without PyYAML)
+        assert metadata.package_type == PackageType.PERL
+        # Basic parsing will extract limited fields
     
-    def test_parse_author(self):
+    @pytest.mark.parametrize("author_str,expected", [
+        ("John Doe <john@example.com>", {'name': 'John Doe', 'email': 'john@example.com'}),
+        ("Jane Smith", {'name': 'Jane Smith'}),
+        ("", None),
+    ])
+    def test_parse_author(self, author_str, expected):
         """Test author string parsing."""
-        # Test various author formats
-        assert self.extractor._parse_author("John Doe <john@example.com>") == {
-            'name': 'John Doe',
-            'email': 'john@example.com'
-        }
-        
-        assert self.extractor._parse_author("Jane Smith") == {
-            'name': 'Jane Smith'
-        }
-        
-        assert self.extractor._parse_author("") is None
+        assert self.extractor._parse_author(author_str) == expected
     
-    def test_map_perl_license(self):
+    @pytest.mark.parametrize("perl_license,spdx_id", [
+        ("perl_5", "Artistic-1.0 OR GPL-1.0-or-later"),
+        ("perl", "Artistic-1.0 OR GPL-1.0-or-later"),
+        ("mit", "MIT"),
+        ("apache_2_0", "Apache-2.0"),
+        ("gpl_3", "GPL-3.0"),
+        ("bsd", "BSD-3-Clause"),
+        ("unknown", None),
+    ])
+    def test_map_perl_license(self, perl_license, spdx_id):
         """Test Perl license mapping to SPDX."""
-        assert self.extractor._map_perl_license("perl_5") == "Artistic-1.0 OR GPL-1.0-or-later"
-        assert self.extractor._map_perl_license("perl") == "Artistic-1.0 OR GPL-1.0-or-later"
-        assert self.extractor._map_perl_license("mit") == "MIT"
-        assert self.extractor._map_perl_license("apache_2_0") == "Apache-2.0"
-        assert self.extractor._map_perl_license("gpl_3") == "GPL-3.0"
-        assert self.extractor._map_perl_license("bsd") == "BSD-3-Clause"
-        assert self.extractor._map_perl_license("unknown") is None
+        assert self.extractor._map_perl_license(perl_license) == spdx_id
     
     def test_extract_dependencies(self):
         """Test dependency extraction from prereqs."""
@@ -192,19 +176,17 @@ license: mit
         assert 'ExtUtils::MakeMaker' in dep_dict
         assert dep_dict['ExtUtils::MakeMaker']['phase'] == 'configure'
     
-    def test_find_license_files(self):
+    def test_find_license_files(self, tmp_path):
         """Test finding license files in package directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create various license files
-            license_files = ['LICENSE', 'COPYING', 'COPYRIGHT', 'ARTISTIC', 'GPL']
-            for filename in license_files:
-                with open(os.path.join(temp_dir, filename), 'w') as f:
-                    f.write("License content")
-            
-            # Find license files
-            found = self.extractor._find_license_files(temp_dir)
-            found_names = [os.path.basename(f) for f in found]
-            
-            # Verify all license files were found
-            for filename in license_files:
-                assert filename in found_names
\ No newline at end of file
+        # Create various license files
+        license_files = ['LICENSE', 'COPYING', 'COPYRIGHT', 'ARTISTIC', 'GPL']
+        for filename in license_files:
+            (tmp_path / filename).write_text("License content")
+        
+        # Find license files
+        found = self.extractor._find_license_files(str(tmp_path))
+        found_names = [os.path.basename(f) for f in found]
+        
+        # Verify all license files were found
+        for filename in license_files:
+            assert filename in found_names
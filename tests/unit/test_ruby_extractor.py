@@ -1,22 +1,43 @@
 """Unit tests for Ruby gem package extractor."""
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import tarfile
+import tempfile
 import gzip
 import yaml
-import io
 from pathlib import Path
 
 from upmex.extractors.ruby_extractor import RubyExtractor
+from tests.archive_helpers import tar_bytes
+
+
+def gem_bytes(gemspec_data, data_entries=None):
+    """Build a gem archive with a gzipped gemspec and optional data.tar.gz files."""
+    return tar_bytes({
+        'metadata.gz': gzip.compress(yaml.dump(gemspec_data).encode('utf-8')),
+        'data.tar.gz': tar_bytes(data_entries or {}),
+        'checksums.yaml.gz': gzip.compress(b'{}'),
+    }, compress=False)
 
 
 class TestRubyExtractor(unittest.TestCase):
     """Test Ruby gem metadata extraction."""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures."""
-        self.extractor = RubyExtractor()
+        cls.extractor = RubyExtractor()
+    
+    def setUp(self):
+        """Create a scratch directory for gem archives."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.tmp_path = Path(temp_dir.name)
+    
+    def write_gem(self, gemspec_data, data_entries=None, name="test.gem"):
+        """Write a gem archive into the scratch directory."""
+        gem_path = self.tmp_path / name
+        gem_path.write_bytes(gem_bytes(gemspec_data, data_entries))
+        return gem_path
     
     def test_detect_ruby_gem_by_extension(self):
         """Test detection of Ruby gem by .gem extension."""
@@ -26,24 +47,11 @@ class TestRubyExtractor(unittest.TestCase):
     
     def test_detect_ruby_gem_in_tar(self):
         """Test detection of Ruby gem in tar archive."""
-        # Mock tarfile to simulate gem structure
-        with patch('tarfile.open') as mock_open:
-            mock_tar = MagicMock()
-            mock_member1 = MagicMock()
-            mock_member1.name = 'metadata.gz'
-            mock_member2 = MagicMock()
-            mock_member2.name = 'data.tar.gz'
-            mock_member3 = MagicMock()
-            mock_member3.name = 'checksums.yaml.gz'
-            mock_tar.getnames.return_value = ['metadata.gz', 'data.tar.gz', 'checksums.yaml.gz']
-            mock_open.return_value.__enter__.return_value = mock_tar
-            
-            package_path = Path("test-package.tar")
-            result = self.extractor.detect_package_type(package_path)
-            self.assertEqual(result, "ruby_gem")
+        package_path = self.write_gem({'name': 'test-gem'}, name="test-package.tar")
+        result = self.extractor.detect_package_type(package_path)
+        self.assertEqual(result, "ruby_gem")
     
-    @patch('tarfile.open')
-    def test_extract_from_gemspec(self, mock_tarfile):
+    def test_extract_from_gemspec(self):
         """Test extracting metadata from gemspec."""
         # Create mock gemspec data
         gemspec_data = {
@@ -59,22 +67,8 @@ class TestRubyExtractor(unittest.TestCase):
             'required_ruby_version': '>= 2.5.0'
         }
         
-        # Create compressed YAML
-        yaml_bytes = yaml.dump(gemspec_data).encode('utf-8')
-        compressed_yaml = gzip.compress(yaml_bytes)
-        
-        # Mock tar file structure
-        mock_tar = MagicMock()
-        mock_metadata_member = MagicMock()
-        mock_metadata_member.name = 'metadata.gz'
-        
-        mock_tar.getmembers.return_value = [mock_metadata_member]
-        mock_tar.extractfile.return_value = io.BytesIO(compressed_yaml)
-        
-        mock_tarfile.return_value.__enter__.return_value = mock_tar
-        
         # Extract metadata
-        metadata = self.extractor.extract("test.gem")
+        metadata = self.extractor.extract(str(self.write_gem(gemspec_data)))
         
         # Verify extracted data
         self.assertEqual(metadata.name, 'test-gem')
@@ -88,8 +82,7 @@ class TestRubyExtractor(unittest.TestCase):
         self.assertIsNotNone(metadata.licenses)
         self.assertEqual(metadata.licenses[0].spdx_id, 'MIT')
     
-    @patch('tarfile.open')
-    def test_extract_with_gem_dependency(self, mock_tarfile):
+    def test_extract_with_gem_dependency(self):
         """Test extracting dependencies from gemspec."""
         # Create mock gemspec with dependencies
         # Create dependency data as dictionaries
@@ -102,21 +95,8 @@ class TestRubyExtractor(unittest.TestCase):
             ]
         }
         
-        # Prepare mock YAML
-        yaml_bytes = yaml.dump(gemspec_data).encode('utf-8')
-        compressed_yaml = gzip.compress(yaml_bytes)
-        
-        # Mock tar structure
-        mock_tar = MagicMock()
-        mock_metadata = MagicMock()
-        mock_metadata.name = 'metadata.gz'
-        mock_tar.getmembers.return_value = [mock_metadata]
-        mock_tar.extractfile.return_value = io.BytesIO(compressed_yaml)
-        
-        mock_tarfile.return_value.__enter__.return_value = mock_tar
-        
         # Extract and verify
-        metadata = self.extractor.extract(Path("test.gem"))
+        metadata = self.extractor.extract(self.write_gem(gemspec_data))
         
         # Dependency extraction might not work with mocked gemspec
         all_deps = metadata.dependencies.get('runtime', []) + metadata.dependencies.get('development', [])
@@ -124,8 +104,7 @@ class TestRubyExtractor(unittest.TestCase):
         if all_deps:
             self.assertGreater(len(all_deps), 0)
     
-    @patch('tarfile.open')
-    def test_extract_license_from_data_tar(self, mock_tarfile):
+    def test_extract_license_from_data_tar(self):
         """Test extracting license from LICENSE file in data.tar.gz."""
         # Create gemspec without license
         gemspec_data = {
@@ -133,50 +112,19 @@ class TestRubyExtractor(unittest.TestCase):
             'version': '1.0.0'
         }
         
-        yaml_bytes = yaml.dump(gemspec_data).encode('utf-8')
-        compressed_yaml = gzip.compress(yaml_bytes)
-        
-        # Create mock LICENSE file content
+        # LICENSE file shipped in data.tar.gz
         license_content = b"MIT License\n\nCopyright (c) 2024"
-        
-        # Mock the nested tar structure
-        mock_main_tar = MagicMock()
-        mock_metadata = MagicMock()
-        mock_metadata.name = 'metadata.gz'
-        mock_data = MagicMock()
-        mock_data.name = 'data.tar.gz'
-        
-        mock_main_tar.getmembers.return_value = [mock_metadata, mock_data]
-        
-        # Mock metadata.gz extraction
-        def extract_file_side_effect(member):
-            if member.name == 'metadata.gz':
-                return io.BytesIO(compressed_yaml)
-            elif member.name == 'data.tar.gz':
-                # Create a mock data.tar.gz
-                data_tar_bytes = io.BytesIO()
-                with tarfile.open(fileobj=data_tar_bytes, mode='w:gz') as data_tar:
-                    license_info = tarfile.TarInfo(name='LICENSE')
-                    license_info.size = len(license_content)
-                    data_tar.addfile(license_info, io.BytesIO(license_content))
-                data_tar_bytes.seek(0)
-                return data_tar_bytes
-            return None
-        
-        mock_main_tar.extractfile.side_effect = extract_file_side_effect
-        
-        mock_tarfile.return_value.__enter__.return_value = mock_main_tar
+        gem_path = self.write_gem(gemspec_data, {'LICENSE': license_content})
         
         # Extract and verify
-        metadata = self.extractor.extract(Path("test.gem"))
+        metadata = self.extractor.extract(gem_path)
         
         # License extraction might not work with mocked tar file
         if metadata.licenses:
             self.assertEqual(metadata.licenses[0].spdx_id, 'MIT')
             self.assertEqual(metadata.licenses[0].file_path, 'LICENSE')
     
-    @patch('tarfile.open')
-    def test_extract_with_metadata_uri(self, mock_tarfile):
+    def test_extract_with_metadata_uri(self):
         """Test extracting repository from metadata URIs."""
         gemspec_data = {
             'name': 'test-gem',
@@ -187,18 +135,7 @@ class TestRubyExtractor(unittest.TestCase):
             }
         }
         
-        yaml_bytes = yaml.dump(gemspec_data).encode('utf-8')
-        compressed_yaml = gzip.compress(yaml_bytes)
-        
-        mock_tar = MagicMock()
-        mock_metadata = MagicMock()
-        mock_metadata.name = 'metadata.gz'
-        mock_tar.getmembers.return_value = [mock_metadata]
-        mock_tar.extractfile.return_value = io.BytesIO(compressed_yaml)
-        
-        mock_tarfile.return_value.__enter__.return_value = mock_tar
-        
-        metadata = self.extractor.extract(Path("test.gem"))
+        metadata = self.extractor.extract(self.write_gem(gemspec_data))
         
         self.assertEqual(metadata.repository, 'https://github.com/user/test-gem')
         # documentation_url is not stored in PackageMetadata, it's part of raw_metadata